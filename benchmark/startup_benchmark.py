@@ -0,0 +1,122 @@
+"""Start-up benchmark for the Workspace Viewer GUI.
+
+Every run starts a fresh interpreter that imports main.py, creates the main
+window and waits until its first frame is drawn: the first idle callback
+after the window is mapped on screen, which runs once Tk has processed the
+pending redraws. The median import time and time to first paint are
+compared with the budget in startup_budget.json.
+
+Without a display the window cannot be created; the first paint is then
+skipped with a notice and only the import time is checked.
+
+Usage:
+    python benchmark/startup_benchmark.py [--runs 5] [--output results.json]
+
+The exit status is 1 if a median exceeds its budget.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_budget.json")
+
+MEASURE_SCRIPT = """
+import json
+import time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+import tkinter
+result = {"import_ms": (imported - start) * 1000, "first_paint_ms": None}
+try:
+    window = main.UserInterface()
+except tkinter.TclError as e:
+    result["skipped"] = str(e)
+else:
+    painted = []
+    def on_idle():
+        if not painted:
+            painted.append(time.perf_counter())
+    window.bind("<Map>", lambda event: window.after_idle(on_idle), add="+")
+    window.update_idletasks()
+    if window.winfo_ismapped():
+        window.after_idle(on_idle)
+    while not painted and time.perf_counter() - start < 30:
+        window.update()
+    window.destroy()
+    if painted:
+        result["first_paint_ms"] = (painted[0] - start) * 1000
+print(json.dumps(result))
+"""
+
+
+def measure_once():
+    """Measure a single cold start in a fresh interpreter.
+
+    Returns:
+        dict: import_ms and first_paint_ms of the run, with the reason under
+        skipped if the window could not be created.
+
+    Raises:
+        RuntimeError: If main.py could not be imported or the window failed.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Start-up run failed:\n{completed.stderr}")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    """Run the benchmark and check the medians against the budget.
+
+    Args:
+        argv (list): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+        int: 0 if every median is within budget, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Measure GUI start-up time")
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts to measure")
+    parser.add_argument("--output", help="Write the measured medians to this JSON file")
+    args = parser.parse_args(argv)
+
+    with open(BUDGET_PATH, "r", encoding="utf-8") as budget_file:
+        budget = json.load(budget_file)
+
+    runs = [measure_once() for _ in range(args.runs)]
+    medians = {}
+    for metric in budget:
+        values = [run[metric] for run in runs if run.get(metric) is not None]
+        medians[metric] = statistics.median(values) if values else None
+
+    skipped = next((run["skipped"] for run in runs if "skipped" in run), None)
+    within_budget = True
+    for metric, limit in budget.items():
+        measured = medians[metric]
+        if metric == "first_paint_ms" and skipped is not None:
+            print(f"{metric:<16} skipped, no display: {skipped}")
+            continue
+        over = measured is None or measured > limit
+        within_budget = within_budget and not over
+        shown = "n/a" if measured is None else f"{measured:.1f}"
+        print(f"{metric:<16} {shown:>8} ms  (budget {limit} ms){'  OVER BUDGET' if over else ''}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump({"runs": runs, "medians": medians, "budget": budget}, output_file, indent=2)
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,19 @@ This module initializes and runs the main GUI window.
 Running this application opens a GUI that allows the user to edit their paths, make profiles, and
 launch profiles.
 """
+import logging
 from src.view.interface import UserInterface
 
-inter = UserInterface()
-inter.mainloop()
+LOG_FORMAT = '%(asctime)s [%(levelname)s] [%(name)s] %(message)s'
+LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def main():
+    """Configure logging and run the main window until it is closed."""
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    inter = UserInterface()
+    inter.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Allow running the command line interface with ``python -m src``."""
+
+import sys
+from src.cli import main
+
+sys.exit(main())
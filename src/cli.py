@@ -0,0 +1,224 @@
+"""Command line interface for the Workspace Viewer application.
+
+Run it with ``python -m src <command>``. The commands only use the service
+layer, so the GUI stack is never imported.
+"""
+
+import argparse
+import sys
+from src.constants.launch import LAUNCH_FAILED
+from src.service.launcher import DEFAULT_LAUNCH_WORKERS, DEFAULT_SKIP_RUNNING
+from src.service.profile_service import ProfileService
+from src.service.settings_service import SettingsService
+from src.service.telemetry import GROUP_BY_PATH, GROUP_BY_PROFILE
+
+EXIT_OK = 0
+EXIT_LAUNCH_FAILED = 1
+EXIT_USAGE_ERROR = 2
+
+
+def _format_ms(value):
+    """Format a millisecond timing for the report table."""
+    return "-" if value is None else f"{value:.1f}"
+
+
+def _resolve_profile(profile_service, settings_service, profile):
+    """Find the ID of a profile given by ID or name.
+
+    Args:
+        profile_service (ProfileService): Service holding the profiles.
+        settings_service (SettingsService): Service holding the current profile.
+        profile (str): Profile ID or name, None for the current profile.
+
+    Returns:
+        str: ID of the profile, None if no profile matches.
+    """
+    if profile is None:
+        profile = settings_service.get_current_user_profile()
+    if profile in profile_service.get_all_profiles():
+        return profile
+    return profile_service.get_profile_id_by_name(profile)
+
+
+def _launch(args, profile_service, settings_service):
+    """Launch every path of a profile and print the outcome per path.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+        profile_service (ProfileService): Service used to launch the profile.
+        settings_service (SettingsService): Service holding the launch settings.
+
+    Returns:
+        int: Exit status of the command.
+    """
+    profile_id = _resolve_profile(profile_service, settings_service, args.profile)
+    if profile_id is None:
+        print(f"Profile not found: {args.profile}", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    launch_workers = args.workers or settings_service.get_launch_workers() or DEFAULT_LAUNCH_WORKERS
+    skip_running = args.skip_running
+    if skip_running is None:
+        skip_running = settings_service.get_skip_running()
+    try:
+        results = profile_service.launch_profile(
+            profile_id,
+            max_workers=launch_workers,
+            skip_running=DEFAULT_SKIP_RUNNING if skip_running is None else skip_running
+        )
+    except ValueError as e:
+        print(f"Cannot launch profile: {e}", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    for result in results:
+        if result.succeeded:
+            print(f"{result.status:<9} pid {result.pid:<7} "
+                  f"{_format_ms(result.spawn_latency * 1000):>8} ms  {result.path}")
+        else:
+            print(f"{result.status:<9} {result.path}: {result.error}")
+    failed = any(result.status == LAUNCH_FAILED for result in results)
+    return EXIT_LAUNCH_FAILED if failed else EXIT_OK
+
+
+def _list(_args, profile_service, settings_service):
+    """Print every profile with its paths, marking the current profile.
+
+    Args:
+        _args (argparse.Namespace): Parsed command line arguments.
+        profile_service (ProfileService): Service holding the profiles.
+        settings_service (SettingsService): Service holding the current profile.
+
+    Returns:
+        int: Exit status of the command.
+    """
+    current_profile = settings_service.get_current_user_profile()
+    for profile_id, profile in profile_service.get_all_profiles().items():
+        marker = "*" if profile_id == current_profile else " "
+        print(f"{marker} {profile.name} ({profile_id})")
+        for path in profile.entries:
+            print(f"    {path}")
+    return EXIT_OK
+
+
+def _add_path(args, profile_service, settings_service):
+    """Add a path to a profile, optionally starting after other paths.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+        profile_service (ProfileService): Service holding the profiles.
+        settings_service (SettingsService): Service holding the current profile.
+
+    Returns:
+        int: Exit status of the command.
+    """
+    profile_id = _resolve_profile(profile_service, settings_service, args.profile)
+    if profile_id is None:
+        print(f"Profile not found: {args.profile}", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    if profile_service.has_path(profile_id, args.path):
+        print(f"Path already in profile: {args.path}", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    profile_service.add_path_to_profile(profile_id, args.path)
+    if args.after and not profile_service.set_path_dependencies(profile_id, args.path, args.after):
+        profile_service.remove_path_from_profile(profile_id, args.path)
+        print("Paths given with --after must already be in the profile", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    return EXIT_OK
+
+
+def _report(args, profile_service, _settings_service):
+    """Print p50/p95 launch times per app or per profile.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+        profile_service (ProfileService): Service used to read the history.
+        _settings_service (SettingsService): Unused.
+
+    Returns:
+        int: Exit status of the command.
+    """
+    summary = profile_service.get_launch_report(args.by)
+    if not summary:
+        print("No launches recorded")
+        return EXIT_OK
+    if args.by == GROUP_BY_PROFILE:
+        profiles = profile_service.get_all_profiles()
+        header = ("Profile", "Launches", "Failures", "p50 ms", "p95 ms")
+        rows = [(profile_service.get_profile_by_id(key) if key in profiles else str(key),
+                 str(entry["count"]), str(entry["failures"]),
+                 _format_ms(entry["duration_p50"]), _format_ms(entry["duration_p95"]))
+                for key, entry in summary.items()]
+    else:
+        header = ("Path", "Launches", "Failures", "Spawn p50", "Spawn p95",
+                  "Ready p50", "Ready p95")
+        rows = [(key, str(entry["count"]), str(entry["failures"]),
+                 _format_ms(entry["spawn_p50"]), _format_ms(entry["spawn_p95"]),
+                 _format_ms(entry["ready_p50"]), _format_ms(entry["ready_p95"]))
+                for key, entry in summary.items()]
+    widths = [max(len(row[column]) for row in [header, *rows]) for column in range(len(header))]
+    for row in [header, *rows]:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    return EXIT_OK
+
+
+def build_parser():
+    """Build the argument parser for every command.
+
+    Returns:
+        argparse.ArgumentParser: The configured parser.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    launch_parser = commands.add_parser("launch", help="Launch every path of a profile")
+    launch_parser.add_argument(
+        "profile",
+        nargs="?",
+        help="Profile name or ID, defaults to the current profile"
+    )
+    launch_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Maximum number of paths spawned at the same time"
+    )
+    launch_parser.add_argument(
+        "--skip-running",
+        action=argparse.BooleanOptionalAction,
+        help="Don't start paths that are already running"
+    )
+    launch_parser.set_defaults(handler=_launch)
+
+    list_parser = commands.add_parser("list", help="List profiles and their paths")
+    list_parser.set_defaults(handler=_list)
+
+    add_path_parser = commands.add_parser("add-path", help="Add a path to a profile")
+    add_path_parser.add_argument("profile", help="Profile name or ID")
+    add_path_parser.add_argument("path", help="Path to add")
+    add_path_parser.add_argument(
+        "--after",
+        nargs="+",
+        metavar="PATH",
+        help="Paths of the profile that have to start before this one"
+    )
+    add_path_parser.set_defaults(handler=_add_path)
+
+    report_parser = commands.add_parser("report", help="Summarise recorded launch times")
+    report_parser.add_argument(
+        "--by",
+        choices=(GROUP_BY_PATH, GROUP_BY_PROFILE),
+        default=GROUP_BY_PATH,
+        help="Summarise per app path or per profile"
+    )
+    report_parser.set_defaults(handler=_report)
+    return parser
+
+
+def main(argv=None):
+    """Run the command line interface.
+
+    Args:
+        argv (list): Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+        int: Exit status of the command.
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args, ProfileService(), SettingsService())
@@ -0,0 +1,8 @@
+"""Constants for the health of profile paths."""
+
+# Path health
+HEALTH_UNKNOWN = "unknown"
+HEALTH_HEALTHY = "healthy"
+HEALTH_MISSING = "missing"
+HEALTH_NOT_EXECUTABLE = "not executable"
+UNHEALTHY = (HEALTH_MISSING, HEALTH_NOT_EXECUTABLE)
@@ -0,0 +1,10 @@
+"""Constants for profile launch status reporting."""
+
+# Launch statuses
+LAUNCH_QUEUED = "queued"
+LAUNCH_SPAWNING = "spawning"
+LAUNCH_WAITING = "waiting"
+LAUNCH_RUNNING = "running"
+LAUNCH_FAILED = "failed"
+LAUNCH_CANCELLED = "cancelled"
+LAUNCH_ALREADY_RUNNING = "already running"
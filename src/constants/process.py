@@ -0,0 +1,13 @@
+"""Constants for the supervision of launched processes."""
+
+# Restart policies
+RESTART_NEVER = "never"
+RESTART_ON_CRASH = "on-crash"
+RESTART_ALWAYS = "always"
+RESTART_MODES = (RESTART_NEVER, RESTART_ON_CRASH, RESTART_ALWAYS)
+
+# Supervised process statuses
+PROCESS_RUNNING = "running"
+PROCESS_RESTARTING = "restarting"
+PROCESS_EXITED = "exited"
+PROCESS_CRASHED = "crashed"
@@ -3,3 +3,6 @@
 # Settings
 APPEARANCE_SETTING = "appearance"
 CURRENT_PROFILE = "current_profile"
+LAUNCH_WORKERS = "launch_workers"
+SKIP_RUNNING = "skip_running"
+WINDOW_GEOMETRY = "window_geometry"
@@ -0,0 +1,224 @@
+"""Admission control for the spawns of a launch.
+
+Spawning every path of a large profile at once makes the applications
+compete for CPU, memory and disk while they start, so the whole workspace
+becomes usable later than if some had waited. AdmissionController decides
+when the next path may spawn. It caps the number of paths in flight,
+counted from their spawn until they are ready, and lowers that cap while
+the system is loaded:
+
+- No path is admitted while the load average per CPU is above
+  max_load_per_cpu or the available memory is below min_available_mb,
+  unless nothing is in flight, so a launch always makes progress.
+- The cap is halved when the median of the recent spawn latencies is above
+  slow_spawn_seconds, and raised by one again for every fast spawn.
+
+Waiting paths are admitted by priority, which the launcher sets to the
+length of the chain of paths that start after them, so the paths the rest
+of the workspace waits for start first.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+DEFAULT_MEMINFO_PATH = "/proc/meminfo"
+
+logger = logging.getLogger("ProfileService")
+
+
+@dataclass(frozen=True)
+class SystemLoad:
+    """Load of the machine, as far as the platform reports it.
+
+    Attributes:
+        load_per_cpu (float): One minute load average divided by the number
+            of CPUs, None if not available.
+        available_mb (float): Memory available without swapping, in
+            megabytes, None if not available.
+    """
+
+    load_per_cpu: Optional[float] = None
+    available_mb: Optional[float] = None
+
+
+def read_system_load(meminfo_path=DEFAULT_MEMINFO_PATH):
+    """Read the load average and available memory from the OS.
+
+    Args:
+        meminfo_path (str): Path of the Linux meminfo file.
+
+    Returns:
+        SystemLoad: The current load, with None for what the platform does not report.
+    """
+    try:
+        load_per_cpu = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        load_per_cpu = None
+    available_mb = None
+    try:
+        with open(meminfo_path, encoding="ascii") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    available_mb = int(line.split()[1]) / 1024
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+    return SystemLoad(load_per_cpu, available_mb)
+
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    """Limits applied by the admission controller.
+
+    Attributes:
+        max_in_flight (int): Most paths in flight at once, the number of
+            launch workers if None.
+        max_load_per_cpu (float): Load average per CPU above which no more
+            paths are admitted.
+        min_available_mb (float): Available memory in megabytes below which
+            no more paths are admitted.
+        slow_spawn_seconds (float): Median latency from spawn until ready
+            above which the cap is halved.
+        latency_window (int): Number of recent latencies the median is taken of.
+        poll_interval (float): Seconds between two reads of the system load.
+    """
+
+    max_in_flight: Optional[int] = None
+    max_load_per_cpu: float = 1.5
+    min_available_mb: float = 512
+    slow_spawn_seconds: float = 10.0
+    latency_window: int = 5
+    poll_interval: float = 0.2
+
+    def __post_init__(self):
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if self.latency_window < 1 or self.poll_interval <= 0:
+            raise ValueError("latency_window and poll_interval must be positive")
+
+    @classmethod
+    def from_config(cls, config):
+        """Create a policy from its stored configuration.
+
+        Args:
+            config (dict): Attributes that override the defaults.
+
+        Returns:
+            AdmissionPolicy: The configured policy.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        try:
+            return cls(**config)
+        except TypeError as e:
+            raise ValueError(f"Invalid admission settings: {e}") from e
+
+
+class AdmissionController:
+    """Admits the paths of a launch one by one, within the limits of a policy.
+
+    The controller is shared by the launch worker threads. A worker calls
+    acquire before spawning a path and release once the path is ready.
+    """
+
+    def __init__(self, policy, max_in_flight, read_load=read_system_load):
+        """Initialize the controller.
+
+        Args:
+            policy (AdmissionPolicy): Limits to apply.
+            max_in_flight (int): Cap used if the policy does not set one.
+            read_load (callable): Returns the current SystemLoad.
+        """
+        self.policy = policy
+        self.max_in_flight = policy.max_in_flight or max_in_flight
+        self.read_load = read_load
+        self._limit = self.max_in_flight
+        self._in_flight = 0
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._latencies = deque(maxlen=policy.latency_window)
+        self._load = None
+        self._load_time = None
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self):
+        """int: Current cap on the paths in flight, before the system load is considered."""
+        return self._limit
+
+    def acquire(self, priority=0, cancel_event=None):
+        """Wait until a path may spawn.
+
+        Args:
+            priority (int): Paths with a higher priority are admitted first.
+            cancel_event (threading.Event): Event that aborts waiting.
+
+        Returns:
+            bool: True if the path was admitted, False if the wait was cancelled.
+        """
+        ticket = (-priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    if cancel_event is not None and cancel_event.is_set():
+                        return False
+                    if self._waiting[0] == ticket and self._has_capacity():
+                        heapq.heappop(self._waiting)
+                        self._in_flight += 1
+                        return True
+                    self._condition.wait(self.policy.poll_interval)
+            finally:
+                if ticket in self._waiting:
+                    self._waiting.remove(ticket)
+                    heapq.heapify(self._waiting)
+                self._condition.notify_all()
+
+    def release(self, latency=None):
+        """Mark an admitted path as ready, or as failed to start.
+
+        Args:
+            latency (float): Seconds from spawn until the path was ready, None
+                if it did not start.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if latency is not None:
+                self._latencies.append(latency)
+                if statistics.median(self._latencies) > self.policy.slow_spawn_seconds:
+                    self._limit = max(1, self._limit // 2)
+                else:
+                    self._limit = min(self.max_in_flight, self._limit + 1)
+            self._condition.notify_all()
+
+    def _has_capacity(self):
+        """Check whether one more path may be in flight now."""
+        if self._in_flight == 0:
+            return True
+        if self._in_flight >= self._limit:
+            return False
+        return not self._overloaded()
+
+    def _overloaded(self):
+        """Check the system load, read at most once per poll interval."""
+        now = time.monotonic()
+        if self._load_time is None or now - self._load_time >= self.policy.poll_interval:
+            self._load = self.read_load()
+            self._load_time = now
+        load = self._load
+        if load.load_per_cpu is not None and load.load_per_cpu > self.policy.max_load_per_cpu:
+            logger.debug("Holding back spawns, load per CPU is %.2f", load.load_per_cpu)
+            return True
+        if load.available_mb is not None and load.available_mb < self.policy.min_available_mb:
+            logger.debug("Holding back spawns, %.0f MB available", load.available_mb)
+            return True
+        return False
@@ -1,7 +1,48 @@
 """Module for managing persistent data storage through JSON files."""
 
-import json
+import contextlib
+import copy
+import functools
+import itertools
 import os
+import threading
+from src.service.events import (EventBus, PathAdded, PathRemoved, ProfileCreated,
+                                ProfileRemoved, ProfileRenamed, events_from_diff)
+from src.service.name_search import NameSearchIndex
+from src.service.model import PathEntry, Profile, ProfileDiff, intern_path
+from src.service.storage import LazyEntries, SqliteProfileStorage, SqliteStorage, create_storage
+
+_MISSING = object()
+
+
+def refreshes(method):
+    """Decorate a manager method to pick up commits of other processes first.
+
+    The method runs under the manager's lock. Methods called from within a
+    decorated method don't refresh again, so the store cannot be reloaded
+    halfway through an operation. Change events are published when the
+    outermost decorated method returns, unless a transaction is still open.
+
+    Args:
+        method (callable): Method of a BaseManager subclass.
+
+    Returns:
+        callable: The method, calling refresh before it runs.
+    """
+    @functools.wraps(method)
+    def refreshed(self, *args, **kwargs):
+        with self.lock:
+            if self._operation_depth:  # pylint: disable=protected-access
+                return method(self, *args, **kwargs)
+            self.refresh()
+            self._operation_depth += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._operation_depth -= 1
+                if not self._transaction_depth:  # pylint: disable=protected-access
+                    self._publish_events()  # pylint: disable=protected-access
+    return refreshed
 
 
 class BaseManager:
@@ -9,34 +50,278 @@ class BaseManager:
 
     Provides core functionality for loading, saving, and manipulating data
     stored in JSON files within the src/data folder.
+
+    Every mutation marks the keys it changes as dirty and flushes them with
+    _save_data. Inside a transaction the flush is deferred until the
+    outermost transaction commits, and nothing is written when no key changed.
+    How the dirty keys are written is up to the storage engine, see
+    src.service.storage.
+
+    Several processes can share a store. Commits take the storage's
+    inter-process lock and bump its version. Public methods first check the
+    version, which costs a stat call, and reload the store only if another
+    process committed since. A commit that finds the store changed by
+    another process reloads it and writes its own dirty keys on top.
+
+    A manager is shared by the Tk thread and the worker threads of launches
+    and health checks. Operations, transactions and reloads hold the
+    manager's lock attribute, a reentrant lock that callers can also take to
+    read the data consistently across several calls.
+
+    Subclasses describe their changes as events, see src.service.events.
+    Events are collected with _emit and published on the events bus once the
+    operation or the outermost transaction is over; a rollback drops them.
     """
 
-    def __init__(self, file_path):
+    SQLITE_STORAGE = SqliteStorage
+    INDEX_FIELDS = ()
+
+    def __init__(self, file_path, storage=None):
         """Initialize the manager with a specific JSON file path.
 
         Args:
             file_path (str): Path to the JSON file for data storage.
+            storage (str): Storage mode passed to create_storage, defaults to
+                the configured storage mode.
         """
         self.file_path = file_path
+        self.lock = threading.RLock()
+        self.events = EventBus()
+        self._pending_events = []
+        self._operation_depth = 0
+        self.storage = create_storage(
+            file_path, storage, self.SQLITE_STORAGE, self.INDEX_FIELDS)
+        self._version = self.storage.version.read()
+        self.data = self._load_data()
+        self._file_stamp = self._stat_file()
+        self._dirty_keys = set()
+        self._transaction_depth = 0
+        self._undo = {}
+        self._revisions = {}
+        self._revision_counter = itertools.count(1)
+
+    def refresh(self):
+        """Reload the store if another process committed since it was loaded.
+
+        Nothing is reloaded while a transaction is open or changes are pending.
+
+        Returns:
+            bool: True if the store was reloaded.
+        """
+        with self.lock:
+            if self._transaction_depth or self._dirty_keys:
+                return False
+            if not self.storage.version.changed(self._version):
+                return False
+            self._reload()
+            if not self._operation_depth:
+                self._publish_events()
+            return True
+
+    def sync_from_disk(self):
+        """Reload the store if it changed on disk, including edits by hand.
+
+        Unlike refresh, this also notices edits that did not go through a
+        data manager, by comparing the data file with its state after the
+        last load or commit. Nothing is reloaded while a transaction is open
+        or changes are pending.
+
+        Returns:
+            bool: True if the store was reloaded.
+
+        Raises:
+            ValueError: If the changed data file is not valid JSON, the
+                loaded data is kept and the next call tries again.
+        """
+        with self.lock:
+            if self._transaction_depth or self._dirty_keys:
+                return False
+            if (not self.storage.version.changed(self._version)
+                    and self._stat_file() == self._file_stamp):
+                return False
+            self._reload()
+            if not self._operation_depth:
+                self._publish_events()
+            return True
+
+    def _stat_file(self):
+        """Get the stat result of the data file that identifies its content."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _reload(self, keep_keys=()):
+        """Load the store again, keeping the in-memory value of some keys.
+
+        Args:
+            keep_keys (iterable): Keys whose in-memory value or absence wins
+                over the stored one.
+        """
+        kept = {key: self.data.get(key, _MISSING) for key in keep_keys}
+        version = self.storage.version.read()
+        file_stamp = self._stat_file()
         self.data = self._load_data()
+        self._version = version
+        self._file_stamp = file_stamp
+        for key, value in kept.items():
+            if value is _MISSING:
+                self.data.pop(key, None)
+            else:
+                self.data[key] = value
+        self._on_reload()
+
+    def _on_reload(self):
+        """Rebuild state derived from the data after a reload, nothing by default."""
 
     def _load_data(self):
-        """Load data from the JSON file.
+        """Load data from the storage engine.
+
+        In lazy storage mode entries are decoded when they are first accessed.
+
+        Returns:
+            dict: Loaded data or empty dict if nothing is stored yet.
+        """
+        data = self.storage.load()
+        if isinstance(data, LazyEntries):
+            data.decode = self._decode_entry
+            return data
+        return {key: self._decode_entry(value) for key, value in data.items()}
+
+    @staticmethod
+    def _decode_entry(value):
+        """Convert a stored value to its in-memory form.
+
+        Args:
+            value: Value as read from the storage engine.
+
+        Returns:
+            The in-memory value, the stored value itself by default.
+        """
+        return value
+
+    def _touch(self, key):
+        """Mark an entry as changed, before it is modified.
+
+        Inside a transaction the first touch of a key keeps a copy of its
+        current value so the transaction can be rolled back.
+
+        Args:
+            key: Key of the entry that is about to change.
+        """
+        if self._transaction_depth and key not in self._undo:
+            value = self.data.get(key, _MISSING)
+            self._undo[key] = value if value is _MISSING else copy.deepcopy(value)
+        self._dirty_keys.add(key)
+        self._revisions[key] = next(self._revision_counter)
+
+    def revision(self, key):
+        """Get a number that changes whenever an entry is modified in place.
+
+        Reloading or rolling back replaces entries by other objects instead,
+        so a cached value derived from an entry is current if both the entry
+        object and its revision are unchanged.
+
+        Args:
+            key: Key of the entry.
 
         Returns:
-            dict: Loaded data or empty dict if file doesn't exist.
+            int: Revision of the entry, 0 if it was never modified.
+        """
+        return self._revisions.get(key, 0)
+
+    def _emit(self, event):
+        """Collect an event, to be published once the change is committed.
+
+        Args:
+            event: Event describing the change.
         """
-        if os.path.exists(self.file_path):
-            with open(self.file_path, "r", encoding="utf-8") as json_file:
-                return json.load(json_file)
-        return {}
+        self._pending_events.append(event)
+
+    def _publish_events(self):
+        """Publish the collected events on the events bus."""
+        events, self._pending_events = self._pending_events, []
+        for event in events:
+            self.events.publish(event)
 
     def _save_data(self):
-        """Save current data to the JSON file, creating directories if needed."""
-        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-        with open(self.file_path, "w", encoding="utf-8") as json_file:
-            json.dump(self.data, json_file, indent=2)
+        """Write pending changes, unless nothing changed or a transaction is open."""
+        if self._transaction_depth or not self._dirty_keys:
+            return
+        try:
+            self._write_data()
+        except BaseException:
+            self._discard_changes()
+            raise
+        self._dirty_keys.clear()
+
+    def _discard_changes(self):
+        """Drop changes that could not be committed and load the stored state again.
+
+        The reload bypasses subclass overrides of _reload, so the discarded
+        changes are not reported as changes of other processes.
+        """
+        self._dirty_keys.clear()
+        self._undo.clear()
+        BaseManager._reload(self)
+        self._pending_events.clear()
+
+    def _write_data(self):
+        """Commit the dirty entries to the storage engine, under the store's lock.
 
+        If another process committed since the store was loaded, the store is
+        reloaded first so its changes to other keys are not overwritten.
+        """
+        version = self.storage.version
+        with version.lock():
+            if version.read() != self._version:
+                self._reload(self._dirty_keys)
+            self.storage.commit(self.data, self._dirty_keys)
+            self._version = version.bump()
+            self._file_stamp = self._stat_file()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Group several mutations into a single write.
+
+        The manager's lock is held for the whole block. Changes made inside
+        the block are written once when the block exits.
+        If the block raises, every entry changed inside it is restored and
+        nothing is written. Nested transactions join the outermost one.
+
+        Yields:
+            BaseManager: This manager.
+        """
+        with self.lock:
+            self.refresh()
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                if not self._transaction_depth:
+                    self._rollback()
+                raise
+            self._transaction_depth -= 1
+            if not self._transaction_depth:
+                self._undo.clear()
+                self._save_data()
+                if not self._operation_depth:
+                    self._publish_events()
+
+    def _rollback(self):
+        """Restore every entry changed in the current transaction and drop its events."""
+        self._pending_events.clear()
+        for key, value in self._undo.items():
+            if value is _MISSING:
+                self.data.pop(key, None)
+            else:
+                self.data[key] = value
+            self._dirty_keys.discard(key)
+        self._undo.clear()
+
+    @refreshes
     def add_entry(self, key, value):
         """Add a new entry to the data store.
 
@@ -48,11 +333,13 @@ class BaseManager:
             bool: True if entry was added, False if key already exists.
         """
         if key not in self.data:
+            self._touch(key)
             self.data[key] = value
             self._save_data()
             return True
         return False  # Entry with the same key already exists
 
+    @refreshes
     def remove_entry(self, key):
         """Remove an entry from the data store.
 
@@ -63,14 +350,18 @@ class BaseManager:
             bool: True if entry was removed, False if key doesn't exist.
         """
         if key in self.data:
+            self._touch(key)
             del self.data[key]
             self._save_data()
             return True
         return False  # Entry with the given key doesn't exist
 
+    @refreshes
     def update_entry(self, key, value):
         """Update an existing entry or create if it doesn't exist.
 
+        Updating an entry to the value it already has writes nothing.
+
         Args:
             key: Key of the entry to update.
             value: New value to store.
@@ -79,11 +370,14 @@ class BaseManager:
             bool: True if entry was updated or added.
         """
         if key in self.data:
-            self.data[key] = value
-            self._save_data()
+            if self.data[key] != value:
+                self._touch(key)
+                self.data[key] = value
+                self._save_data()
             return True
         return self.add_entry(key, value)  # Entry with the given key doesn't exist
 
+    @refreshes
     def get_entry(self, key):
         """Retrieve an entry from the data store.
 
@@ -96,17 +390,296 @@ class BaseManager:
         return self.data.get(key, None)
 
 
-class ProfileManager(BaseManager):
-    """Manager for handling workspace profile data storage and operations."""
+class ProfileManager(BaseManager):  # pylint: disable=too-many-public-methods
+    """Manager for handling workspace profile data storage and operations.
 
-    def __init__(self, file_path="data/profiles.json"):
+    Profiles are held as Profile objects, see src.service.model, and are
+    converted to and from their JSON format only by the storage engine.
+    Besides the profiles, the manager keeps a name to ID index and a search
+    index over the names that are updated on every mutation, so name
+    lookups and searches don't scan the profiles.
+    Profile and path changes are published as events on the events bus.
+    """
+
+    SQLITE_STORAGE = SqliteProfileStorage
+    INDEX_FIELDS = ("name",)
+
+    def __init__(self, file_path="data/profiles.json", storage=None):
         """Initialize ProfileManager with default or custom file path.
 
         Args:
             file_path (str): Path to profiles JSON file.
+            storage (str): Storage mode, defaults to the configured storage mode.
+        """
+        self._name_index = {}
+        self._search_index = NameSearchIndex()
+        self.track_changes = False
+        self._changes = []
+        super().__init__(file_path, storage)
+        self._on_reload()
+
+    def _on_reload(self):
+        """Rebuild the name indexes from the loaded profiles."""
+        self._name_index = {}
+        self._search_index = NameSearchIndex()
+        for profile_id in self.data:
+            self._index_profile(profile_id)
+
+    def _reload(self, keep_keys=()):
+        """Load the profiles again and record what other processes changed.
+
+        When track_changes is set, the differences are kept for take_changes
+        and published as events.
+
+        Args:
+            keep_keys (iterable): Profiles whose in-memory state wins over the stored one.
+        """
+        if not self.track_changes:
+            super()._reload(keep_keys)
+            return
+        before = {profile_id: (self._profile_name(profile_id), self._loaded_paths(profile_id))
+                  for profile_id in self.data}
+        super()._reload(keep_keys)
+        diff = ProfileDiff()
+        for profile_id, (name, paths) in before.items():
+            if profile_id not in self.data:
+                diff.removed[profile_id] = name
+            else:
+                self._compare_profile(diff, profile_id, name, paths)
+        for profile_id in self.data:
+            if profile_id not in before:
+                diff.added[profile_id] = self._profile_name(profile_id)
+        if diff:
+            self._changes.append(diff)
+            for event in events_from_diff(diff):
+                self._emit(event)
+
+    def _compare_profile(self, diff, profile_id, name, paths):
+        """Record how a profile differs from an earlier state of it.
+
+        Args:
+            diff (ProfileDiff): Differences to add to.
+            profile_id: ID of a profile that exists.
+            name (str): Earlier name of the profile.
+            paths (list): Earlier paths of the profile, None to skip comparing paths.
+        """
+        new_name = self._profile_name(profile_id)
+        if new_name != name:
+            diff.renamed[profile_id] = (name, new_name)
+        if paths is None:
+            return
+        new_paths = self.data[profile_id].entries
+        old_paths = set(paths)
+        added = [path for path in new_paths if path not in old_paths]
+        removed = [path for path in paths if path not in new_paths]
+        if added:
+            diff.paths_added[profile_id] = added
+        if removed:
+            diff.paths_removed[profile_id] = removed
+
+    def take_changes(self):
+        """Get and clear the changes other processes made, found by reloads.
+
+        Changes are only recorded while track_changes is set.
+
+        Returns:
+            list: ProfileDiff of every reload that changed something, oldest first.
+        """
+        with self.lock:
+            changes, self._changes = self._changes, []
+            return changes
+
+    def _loaded_paths(self, profile_id):
+        """Get the paths of a profile, None if it was not decoded yet."""
+        if isinstance(self.data, LazyEntries) and not self.data.is_loaded(profile_id):
+            return None
+        return list(self.data[profile_id].entries)
+
+    def _profile_name(self, profile_id):
+        """Get the name of a profile without refreshing or decoding it."""
+        if isinstance(self.data, LazyEntries) and not self.data.is_loaded(profile_id):
+            return self.data.summary(profile_id)["name"]
+        return self.data[profile_id].name
+
+    @staticmethod
+    def _decode_entry(value):
+        """Convert a stored profile to a Profile.
+
+        Args:
+            value (dict): Profile in its stored format.
+
+        Returns:
+            Profile: The decoded profile.
+        """
+        return Profile.from_dict(value)
+
+    @refreshes
+    def get_profile_name(self, profile_id):
+        """Get the name of a profile, without decoding it in lazy storage mode.
+
+        Args:
+            profile_id: ID of the profile.
+
+        Returns:
+            str: Name of the profile.
+
+        Raises:
+            KeyError: If the profile doesn't exist.
+        """
+        return self._profile_name(profile_id)
+
+    @refreshes
+    def get_profile_names(self):
+        """Get the names of all profiles in storage order.
+
+        Returns:
+            list: Profile names.
+        """
+        return [self._profile_name(profile_id) for profile_id in self.data]
+
+    def _index_profile(self, profile_id):
+        """Add a profile to the name indexes.
+
+        Args:
+            profile_id: ID of the profile to index.
+        """
+        name = self._profile_name(profile_id)
+        if self._name_index.setdefault(name, profile_id) == profile_id:
+            self._search_index.add(name)
+
+    def _unindex_profile(self, profile_id):
+        """Remove a profile from the name indexes, before it is changed or removed.
+
+        Args:
+            profile_id: ID of the profile to remove from the indexes.
+        """
+        name = self._profile_name(profile_id)
+        if self._name_index.get(name) == profile_id:
+            del self._name_index[name]
+            self._search_index.remove(name)
+
+    @refreshes
+    def add_entry(self, key, value):
+        """Add a new profile entry and index it.
+
+        Args:
+            key: Unique identifier for the profile.
+            value (Profile): The profile.
+
+        Returns:
+            bool: True if entry was added, False if key already exists.
+        """
+        added = super().add_entry(key, value)
+        if added:
+            self._index_profile(key)
+            self._emit(ProfileCreated(key, self._profile_name(key)))
+        return added
+
+    @refreshes
+    def remove_entry(self, key):
+        """Remove a profile entry and drop it from the index.
+
+        Args:
+            key: Key of the profile to remove.
+
+        Returns:
+            bool: True if entry was removed, False if key doesn't exist.
+        """
+        if key not in self.data:
+            return False
+        name = self._profile_name(key)
+        self._unindex_profile(key)
+        super().remove_entry(key)
+        self._emit(ProfileRemoved(key, name))
+        return True
+
+    @refreshes
+    def update_entry(self, key, value):
+        """Replace a profile entry and re-index it.
+
+        Args:
+            key: Key of the profile to update.
+            value (Profile): The new profile.
+
+        Returns:
+            bool: True if entry was updated or added.
+        """
+        if key not in self.data:
+            return self.add_entry(key, value)
+        name, paths = self._profile_name(key), self._loaded_paths(key)
+        self._unindex_profile(key)
+        updated = super().update_entry(key, value)
+        self._index_profile(key)
+        diff = ProfileDiff()
+        self._compare_profile(diff, key, name, paths)
+        for event in events_from_diff(diff):
+            self._emit(event)
+        return updated
+
+    def _rollback(self):
+        """Restore every profile changed in the current transaction and the name index."""
+        changed = list(self._undo)
+        for key in changed:
+            if key in self.data:
+                self._unindex_profile(key)
+        super()._rollback()
+        for key in changed:
+            if key in self.data:
+                self._index_profile(key)
+
+    @refreshes
+    def find_profile_id(self, profile_name):
+        """Look up the ID of a profile by its name.
+
+        Args:
+            profile_name: Name of the profile.
+
+        Returns:
+            The ID of the profile, or None if no profile has the name.
+        """
+        return self._name_index.get(profile_name)
+
+    @refreshes
+    def has_profile_name(self, profile_name):
+        """Check whether a profile name is in use.
+
+        Args:
+            profile_name: Name to check.
+
+        Returns:
+            bool: True if a profile has the name.
+        """
+        return profile_name in self._name_index
+
+    @refreshes
+    def search_profile_names(self, query, limit=None):
+        """Find the profile names containing a text, ignoring case.
+
+        Args:
+            query (str): Text to look for, every name matches an empty query.
+            limit (int): Maximum number of names to return, all if None.
+
+        Returns:
+            list: Names starting with the query, then the other names
+            containing it, each group in alphabetical order.
+        """
+        return self._search_index.search(query, limit)
+
+    @refreshes
+    def has_path(self, profile_id, path):
+        """Check whether a profile contains a path.
+
+        Args:
+            profile_id: ID of the profile.
+            path: Path to check.
+
+        Returns:
+            bool: True if the profile exists and contains the path.
         """
-        super().__init__(file_path)
+        profile = self.data.get(profile_id)
+        return profile is not None and path in profile.entries
 
+    @refreshes
     def add_profile(self, profile_id, profile_name):
         """Create a new profile with empty paths list.
 
@@ -115,11 +688,13 @@ class ProfileManager(BaseManager):
             profile_name: Display name for the profile.
 
         Returns:
-            bool: True if profile was created, False if ID already exists.
+            bool: True if profile was created, False if the ID or name already exists.
         """
-        profile_data = {"name": profile_name, "paths": []}
-        return self.add_entry(key=profile_id, value=profile_data)
+        if profile_name in self._name_index:
+            return False  # Profile name already exists
+        return self.add_entry(key=profile_id, value=Profile(profile_name))
 
+    @refreshes
     def remove_profile(self, profile_id):
         """Remove a profile and all its associated paths.
 
@@ -131,38 +706,202 @@ class ProfileManager(BaseManager):
         """
         return self.remove_entry(key=profile_id)
 
+    @refreshes
     def add_path_to_profile(self, profile_id, path):
-        """Add a path to an existing profile's paths list.
+        """Add a path to the end of an existing profile.
+
+        Adding a path the profile already contains changes nothing.
 
         Args:
             profile_id: ID of the target profile.
             path: Path to add to the profile.
 
         Returns:
-            bool: True if path was added, False if profile not found.
+            bool: True if path was added or already present, False if profile not found.
         """
-        if profile_id in self.data:
-            self.data[profile_id]["paths"].append(path)
+        profile = self.data.get(profile_id)
+        if profile is None:
+            return False  # Profile with the given ID doesn't exist
+        if path not in profile.entries:
+            self._touch(profile_id)
+            entry = PathEntry.create(path)
+            profile.entries[entry.path] = entry
+            self._emit(PathAdded(profile_id, entry.path))
             self._save_data()
-            return True
-        return False  # Profile with the given ID doesn't exist
+        return True
 
+    @refreshes
     def remove_path_from_profile(self, profile_id, path):
-        """Remove a path from a profile's paths list.
+        """Remove a path from a profile, along with dependencies on it.
 
         Args:
             profile_id: ID of the target profile.
             path: Path to remove from the profile.
 
         Returns:
-            bool: True if path was removed, False if profile not found.
+            bool: True if path was removed, False if profile or path not found.
+        """
+        if not self.has_path(profile_id, path):
+            return False  # Profile doesn't exist or doesn't contain the path
+        self._touch(profile_id)
+        entries = self.data[profile_id].entries
+        del entries[path]
+        for other_path, entry in entries.items():
+            if path in entry.after:
+                entries[other_path] = entry.with_options(
+                    after=tuple(after for after in entry.after if after != path))
+        self._emit(PathRemoved(profile_id, path))
+        self._save_data()
+        return True
+
+    @refreshes
+    def set_path_dependencies(self, profile_id, path, after_paths):
+        """Set the paths that a profile path has to start after.
+
+        Args:
+            profile_id: ID of the target profile.
+            path: Path whose dependencies are set.
+            after_paths (list): Paths of the same profile to start before path.
+
+        Returns:
+            bool: True if dependencies were set, False if the profile or any
+            of the paths is not found.
+        """
+        if any(not self.has_path(profile_id, after) for after in after_paths):
+            return False  # Dependency is not part of the profile
+        return self._set_path_option(
+            profile_id, path, "after", tuple(intern_path(after) for after in after_paths)
+        )
+
+    @refreshes
+    def get_path_dependencies(self, profile_id):
+        """Get the start-after dependencies of every path in a profile.
+
+        Args:
+            profile_id: ID of the target profile.
+
+        Returns:
+            dict: Mapping of path to the list of paths it starts after.
+        """
+        return {path: list(entry.after)
+                for path, entry in self.data[profile_id].entries.items() if entry.after}
+
+    @refreshes
+    def set_path_probes(self, profile_id, path, probe_configs):
+        """Set the readiness probe configurations of a profile path.
+
+        Args:
+            profile_id: ID of the target profile.
+            path: Path whose probes are set.
+            probe_configs (list): Probe configuration dictionaries.
+
+        Returns:
+            bool: True if probes were set, False if the profile or path is not found.
+        """
+        return self._set_path_option(
+            profile_id, path, "probes", tuple(dict(config) for config in probe_configs)
+        )
+
+    @refreshes
+    def get_path_probes(self, profile_id):
+        """Get the readiness probe configurations of every path in a profile.
+
+        Args:
+            profile_id: ID of the target profile.
+
+        Returns:
+            dict: Mapping of path to its list of probe configurations.
+        """
+        return {path: [dict(config) for config in entry.probes]
+                for path, entry in self.data[profile_id].entries.items() if entry.probes}
+
+    @refreshes
+    def set_path_restart_policy(self, profile_id, path, restart_config):
+        """Set the restart policy configuration of a profile path.
+
+        Args:
+            profile_id: ID of the target profile.
+            path: Path whose restart policy is set.
+            restart_config (dict): Restart policy configuration, None or
+                empty to never restart the path.
+
+        Returns:
+            bool: True if the policy was set, False if the profile or path is not found.
+        """
+        return self._set_path_option(
+            profile_id, path, "restart", dict(restart_config) if restart_config else None
+        )
+
+    @refreshes
+    def get_path_restart_policies(self, profile_id):
+        """Get the restart policy configuration of every path in a profile.
+
+        Args:
+            profile_id: ID of the target profile.
+
+        Returns:
+            dict: Mapping of path to its restart policy configuration.
+        """
+        return {path: dict(entry.restart)
+                for path, entry in self.data[profile_id].entries.items() if entry.restart}
+
+    def _set_path_option(self, profile_id, path, option, value):
+        """Store a single option of a profile path.
+
+        Args:
+            profile_id: ID of the target profile.
+            path: Path the option belongs to.
+            option (str): Name of the PathEntry attribute.
+            value: Value of the option, an empty tuple or None clears it.
+
+        Returns:
+            bool: True if the option was stored, False if the profile or path is not found.
+        """
+        if not self.has_path(profile_id, path):
+            return False  # Profile doesn't exist or doesn't contain the path
+        entries = self.data[profile_id].entries
+        if getattr(entries[path], option) == value:
+            return True  # Option already has this value
+        self._touch(profile_id)
+        entries[path] = entries[path].with_options(**{option: value})
+        self._save_data()
+        return True
+
+    @refreshes
+    def set_profile_admission(self, profile_id, admission_config):
+        """Set the admission control overrides of a profile.
+
+        Args:
+            profile_id: ID of the target profile.
+            admission_config (dict): Settings overriding the defaults, None
+                or empty to use the defaults.
+
+        Returns:
+            bool: True if the overrides were set, False if the profile is not found.
         """
-        if profile_id in self.data:
-            self.data[profile_id]["paths"].remove(path)
+        profile = self.data.get(profile_id)
+        if profile is None:
+            return False  # Profile with the given ID doesn't exist
+        admission = dict(admission_config) if admission_config else None
+        if profile.admission != admission:
+            self._touch(profile_id)
+            profile.admission = admission
             self._save_data()
-            return True
-        return False  # Profile with the given ID doesn't exist
+        return True
+
+    @refreshes
+    def get_profile_admission(self, profile_id):
+        """Get the admission control overrides of a profile.
 
+        Args:
+            profile_id: ID of the target profile.
+
+        Returns:
+            dict: Settings overriding the defaults, empty if there are none.
+        """
+        return dict(self.data[profile_id].admission or {})
+
+    @refreshes
     def change_profile_name(self, profile_id, new_name):
         """Update the name of an existing profile.
 
@@ -171,22 +910,33 @@ class ProfileManager(BaseManager):
             new_name: New name for the profile.
 
         Returns:
-            bool: True if name was updated, False if profile not found.
+            bool: True if name was updated, False if profile not found or
+            another profile has the name.
         """
-        if profile_id in self.data:
-            self.data[profile_id]["name"] = new_name
+        profile = self.data.get(profile_id)
+        if profile is None:
+            return False  # Profile with the given ID doesn't exist
+        old_name = profile.name
+        if old_name != new_name:
+            if new_name in self._name_index:
+                return False  # Name is used by another profile
+            self._touch(profile_id)
+            self._unindex_profile(profile_id)
+            profile.name = new_name
+            self._index_profile(profile_id)
+            self._emit(ProfileRenamed(profile_id, old_name, new_name))
             self._save_data()
-            return True
-        return False  # Profile with the given ID doesn't exist
+        return True
 
 
 class SettingsManager(BaseManager):
     """Manager for handling application settings storage and operations."""
 
-    def __init__(self, file_path="data/settings.json"):
+    def __init__(self, file_path="data/settings.json", storage=None):
         """Initialize SettingsManager with default or custom file path.
 
         Args:
             file_path (str): Path to settings JSON file.
+            storage (str): Storage mode, defaults to the configured storage mode.
         """
-        super().__init__(file_path)
+        super().__init__(file_path, storage)
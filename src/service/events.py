@@ -0,0 +1,151 @@
+"""Change events published by the data managers.
+
+Every change of the profiles, whether made by this process or loaded from
+a commit of another process, is published as a small typed event on the
+manager's EventBus. Subscribers, such as the view, can update only what
+the event names instead of re-reading whole profiles.
+
+Events are published once the change is committed. Changes made inside a
+transaction are published when the outermost transaction commits, and
+never if it rolls back.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+
+logger = logging.getLogger("ProfileService")
+
+
+@dataclass(frozen=True)
+class ProfileCreated:
+    """A profile was added.
+
+    Attributes:
+        profile_id: ID of the new profile.
+        name (str): Name of the new profile.
+    """
+
+    profile_id: str
+    name: str
+
+
+@dataclass(frozen=True)
+class ProfileRenamed:
+    """A profile got a new name.
+
+    Attributes:
+        profile_id: ID of the profile.
+        old_name (str): Name before the change.
+        new_name (str): Name after the change.
+    """
+
+    profile_id: str
+    old_name: str
+    new_name: str
+
+
+@dataclass(frozen=True)
+class ProfileRemoved:
+    """A profile was removed.
+
+    Attributes:
+        profile_id: ID of the removed profile.
+        name (str): Name the profile had.
+    """
+
+    profile_id: str
+    name: str
+
+
+@dataclass(frozen=True)
+class PathAdded:
+    """A path was appended to a profile.
+
+    Attributes:
+        profile_id: ID of the profile.
+        path (str): The new path.
+    """
+
+    profile_id: str
+    path: str
+
+
+@dataclass(frozen=True)
+class PathRemoved:
+    """A path was removed from a profile.
+
+    Attributes:
+        profile_id: ID of the profile.
+        path (str): The removed path.
+    """
+
+    profile_id: str
+    path: str
+
+
+def events_from_diff(diff):
+    """Convert the differences found by a reload to events.
+
+    Args:
+        diff (ProfileDiff): Differences between two states of the profiles.
+
+    Returns:
+        list: Events in the order removals, creations, renames, then path changes.
+    """
+    events = [ProfileRemoved(profile_id, name) for profile_id, name in diff.removed.items()]
+    events.extend(ProfileCreated(profile_id, name) for profile_id, name in diff.added.items())
+    events.extend(ProfileRenamed(profile_id, old_name, new_name)
+                  for profile_id, (old_name, new_name) in diff.renamed.items())
+    for profile_id, paths in diff.paths_removed.items():
+        events.extend(PathRemoved(profile_id, path) for path in paths)
+    for profile_id, paths in diff.paths_added.items():
+        events.extend(PathAdded(profile_id, path) for path in paths)
+    return events
+
+
+class EventBus:
+    """Dispatches events to the handlers subscribed to their type.
+
+    Handlers run synchronously on the thread that publishes the event, which
+    is not necessarily the Tk thread, so view handlers should only queue the
+    event. An exception in a handler is logged and does not stop the others.
+    """
+
+    def __init__(self):
+        """Initialize the bus without subscribers."""
+        self._handlers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, handler, event_types=None):
+        """Call a handler for published events.
+
+        Args:
+            handler (callable): Called with the event.
+            event_types (tuple): Event classes to receive, every event if None.
+
+        Returns:
+            callable: Function that cancels the subscription.
+        """
+        subscription = (handler, tuple(event_types) if event_types else None)
+        with self._lock:
+            self._handlers = self._handlers + [subscription]
+
+        def unsubscribe():
+            with self._lock:
+                self._handlers = [other for other in self._handlers if other is not subscription]
+        return unsubscribe
+
+    def publish(self, event):
+        """Call the handlers subscribed to the type of an event.
+
+        Args:
+            event: The event to publish.
+        """
+        for handler, event_types in self._handlers:
+            if event_types is not None and not isinstance(event, event_types):
+                continue
+            try:
+                handler(event)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Error handling %s", type(event).__name__)
@@ -0,0 +1,61 @@
+"""Advisory inter-process file locks.
+
+A FileLock locks a separate lock file rather than the data file itself, so
+the data file can still be replaced atomically while the lock is held. The
+lock is only honoured by processes that take it too, such as other
+Workspace-Viewer instances and scripts using the data managers.
+"""
+
+import os
+
+if os.name == "nt":
+    import msvcrt  # pylint: disable=import-error
+else:
+    import fcntl
+
+
+class FileLock:
+    """Exclusive lock on a lock file, used as a context manager."""
+
+    def __init__(self, lock_path):
+        """Initialize the lock.
+
+        Args:
+            lock_path (str): Path to the lock file, created if it doesn't exist.
+        """
+        self.lock_path = lock_path
+        self._lock_file = None
+
+    def __enter__(self):
+        """Block until the lock is acquired.
+
+        Returns:
+            FileLock: This lock.
+        """
+        directory = os.path.dirname(self.lock_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lock_file = open(self.lock_path, "a+b")  # pylint: disable=consider-using-with
+        try:
+            if os.name == "nt":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        except OSError:
+            lock_file.close()
+            raise
+        self._lock_file = lock_file
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Release the lock."""
+        lock_file, self._lock_file = self._lock_file, None
+        try:
+            if os.name == "nt":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
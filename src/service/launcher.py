@@ -0,0 +1,445 @@
+"""Concurrent launch engine for the paths stored in workspace profiles.
+
+Launching happens in two steps. compile_launch_plan decides everything that
+does not change between launches: how every path is spawned, the order
+given by the dependencies and the readiness probes. ProfileLauncher then
+runs a LaunchPlan, which can be cached and launched again without
+repeating any of that work.
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+from src.constants.launch import (
+    LAUNCH_ALREADY_RUNNING, LAUNCH_CANCELLED, LAUNCH_FAILED, LAUNCH_QUEUED, LAUNCH_RUNNING,
+    LAUNCH_SPAWNING, LAUNCH_WAITING
+)
+from src.service.process_table import ProcessTable
+
+DEFAULT_LAUNCH_WORKERS = 8
+DEFAULT_SKIP_RUNNING = False
+SHELL_EXTENSIONS = ('.rdp', '.bat')
+
+
+@dataclass
+class LaunchResult:
+    """Outcome of spawning a single profile path.
+
+    Attributes:
+        path (str): Path that was launched.
+        pid (int): Process ID of the spawned process, None if spawning failed.
+        spawn_latency (float): Seconds spent spawning the process.
+        error (str): Error message if spawning failed, None otherwise.
+        ready_latency (float): Seconds from spawn until the readiness probes
+            passed, None if the path has no probes or never became ready.
+        status (str): Final launch status of the path.
+        process (subprocess.Popen): Handle of the spawned process.
+    """
+
+    path: str
+    pid: Optional[int] = None
+    spawn_latency: float = 0.0
+    error: Optional[str] = None
+    ready_latency: Optional[float] = None
+    status: str = LAUNCH_RUNNING
+    process: Optional[subprocess.Popen] = field(default=None, repr=False, compare=False)
+
+    @property
+    def succeeded(self):
+        """bool: True if the process was spawned without error."""
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class SpawnSpec:
+    """Resolved way of spawning a single path.
+
+    Attributes:
+        path (str): Path as stored in the profile.
+        args: Argument list for a direct spawn, command string for the shell.
+        options (dict): Keyword arguments for subprocess.Popen, such as
+            shell, cwd and env. The working directory and environment are
+            inherited when they are not set.
+    """
+
+    path: str
+    args: object
+    options: dict = field(default_factory=dict)
+
+
+def compile_spawn_spec(path):
+    """Decide how a path is spawned.
+
+    Batch and remote desktop files are started through the shell. Everything
+    else is executed directly; a bare program name is looked up on PATH.
+
+    Args:
+        path (str): Path to launch.
+
+    Returns:
+        SpawnSpec: How to spawn the path.
+    """
+    _, file_extension = os.path.splitext(path)
+    if file_extension in SHELL_EXTENSIONS:
+        return SpawnSpec(path, path, {"shell": True})
+    return SpawnSpec(path, [resolve_executable(path)])
+
+
+def resolve_executable(path):
+    """Look up a bare program name on PATH, as the launcher runs it.
+
+    Args:
+        path (str): Path to launch.
+
+    Returns:
+        str: The program found on PATH for a bare name, the path itself otherwise.
+    """
+    if os.path.dirname(path):
+        return path
+    return shutil.which(path) or path
+
+
+def spawn_path(path):
+    """Spawn a single path without waiting for it to exit.
+
+    Args:
+        path (str): Path to launch.
+
+    Returns:
+        LaunchResult: Result of the spawn attempt.
+    """
+    return spawn(compile_spawn_spec(path))
+
+
+def spawn(spec):
+    """Spawn a path as described by its spec, without waiting for it to exit.
+
+    Args:
+        spec (SpawnSpec): How to spawn the path.
+
+    Returns:
+        LaunchResult: Result of the spawn attempt.
+    """
+    path = spec.path
+    start = time.perf_counter()
+    try:
+        process = subprocess.Popen(spec.args, **spec.options)  # pylint: disable=consider-using-with
+    except (OSError, subprocess.SubprocessError) as e:
+        return LaunchResult(
+            path=path,
+            spawn_latency=time.perf_counter() - start,
+            error=str(e),
+            status=LAUNCH_FAILED
+        )
+    return LaunchResult(
+        path=path,
+        pid=process.pid,
+        spawn_latency=time.perf_counter() - start,
+        process=process
+    )
+
+
+def compute_launch_waves(path_list: list, dependencies=None):
+    """Group paths into waves that can be launched in parallel.
+
+    Every path is placed in the first wave after all the paths it starts
+    after. Dependencies on paths that are not in path_list are ignored.
+
+    Args:
+        path_list (list): Paths to launch.
+        dependencies (dict): Mapping of path to the list of paths it starts after.
+
+    Returns:
+        list: List of waves, each a list of paths in path_list order.
+
+    Raises:
+        ValueError: If the dependencies contain a cycle.
+    """
+    dependencies = dependencies or {}
+    ordered_paths = list(dict.fromkeys(path_list))
+    known_paths = set(ordered_paths)
+    remaining = {
+        path: {after for after in dependencies.get(path, ()) if after in known_paths} - {path}
+        for path in ordered_paths
+    }
+    waves = []
+    while remaining:
+        wave = [path for path in ordered_paths if path in remaining and not remaining[path]]
+        if not wave:
+            raise ValueError(f"Dependency cycle between paths: {sorted(remaining)}")
+        waves.append(wave)
+        for path in wave:
+            del remaining[path]
+        for pending in remaining.values():
+            pending.difference_update(wave)
+    return waves
+
+
+@dataclass(frozen=True)
+class LaunchPlan:
+    """Everything needed to launch a list of paths, decided ahead of time.
+
+    Attributes:
+        paths (tuple): Paths in the order of the launch list.
+        specs (dict): Mapping of path to its SpawnSpec.
+        start_after (dict): Mapping of path to the tuple of listed paths it
+            starts after, in launch order.
+        dependents (dict): Mapping of path to the tuple of paths starting after it.
+        probes (dict): Mapping of path to the list of ReadinessProbe that have
+            to pass before the path counts as ready.
+        priorities (dict): Mapping of path to the length of the longest chain
+            of paths starting after it, which admission control starts first.
+    """
+
+    paths: tuple
+    specs: dict
+    start_after: dict
+    dependents: dict
+    probes: dict
+    priorities: dict = field(default_factory=dict)
+
+
+def compile_launch_plan(path_list: list, dependencies=None, probes=None):
+    """Compile a list of paths into a LaunchPlan.
+
+    Args:
+        path_list (list): Paths to launch.
+        dependencies (dict): Mapping of path to the list of paths it starts after.
+        probes (dict): Mapping of path to the list of ReadinessProbe that
+            have to pass before the path counts as ready.
+
+    Returns:
+        LaunchPlan: The plan.
+
+    Raises:
+        ValueError: If the dependencies contain a cycle.
+    """
+    dependencies = dependencies or {}
+    probes = probes or {}
+    waves = compute_launch_waves(path_list, dependencies)
+    start_after = {}
+    dependents = {}
+    for path, after in _start_after(waves, dependencies):
+        start_after[path] = tuple(after)
+        for after_path in after:
+            dependents.setdefault(after_path, []).append(path)
+    priorities = {}
+    for path in reversed(list(start_after)):
+        priorities[path] = max((priorities[dependent] + 1
+                                for dependent in dependents.get(path, ())), default=0)
+    return LaunchPlan(
+        paths=tuple(path_list),
+        specs={path: compile_spawn_spec(path) for path in start_after},
+        start_after=start_after,
+        dependents={path: tuple(paths) for path, paths in dependents.items()},
+        probes={path: list(path_probes) for path, path_probes in probes.items() if path_probes},
+        priorities=priorities
+    )
+
+
+@dataclass(frozen=True)
+class LaunchOptions:
+    """Options of a single run of a launch plan.
+
+    Attributes:
+        on_status (callable): Called with (path, status) whenever a path
+            changes status. It is invoked from worker threads.
+        cancel_event (threading.Event): Event that cancels pending paths.
+        unavailable (dict): Mapping of path to the reason it cannot be launched.
+        skip_running (bool): Don't spawn paths that are already running,
+            according to a single snapshot of the process table taken before
+            the first spawn.
+        admission (AdmissionController): Decides when each path may spawn,
+            None to spawn as soon as a worker is free. Admitted paths stay in
+            flight until they are ready.
+    """
+
+    on_status: Optional[Callable] = None
+    cancel_event: Optional[threading.Event] = None
+    unavailable: Optional[dict] = None
+    skip_running: bool = False
+    admission: Optional[object] = None
+
+
+class ProfileLauncher:
+    """Launches the paths of a profile concurrently on a pool of worker threads."""
+
+    def __init__(self, max_workers=DEFAULT_LAUNCH_WORKERS):
+        """Initialize the launcher.
+
+        Args:
+            max_workers (int): Maximum number of paths spawned at the same time.
+
+        Raises:
+            ValueError: If max_workers is lower than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+
+    def launch(self, path_list: list, dependencies=None, probes=None, **options):
+        """Spawn every path in the list as soon as its dependencies are ready.
+
+        Paths without dependencies are spawned concurrently straight away. A
+        path that starts after other paths is spawned the moment all of them
+        are ready: spawned, and with every readiness probe passed. The call
+        never waits for the launched applications to exit. Paths whose
+        dependencies failed to start are not launched, and paths that have
+        not started spawning when cancel_event is set are skipped, as are
+        paths still waiting for their readiness probes. Paths known to be
+        unavailable fail at once, without an attempt to spawn them.
+        With skip_running, paths whose program is already running are not
+        spawned again and count as ready. With an admission controller, each
+        path also waits until the controller admits it.
+
+        Args:
+            path_list (list): List of paths to launch.
+            dependencies (dict): Mapping of path to the list of paths it starts after.
+            probes (dict): Mapping of path to the list of ReadinessProbe that
+                have to pass before the path counts as ready.
+            **options: Options of the launch, see LaunchOptions: on_status,
+                cancel_event, unavailable, skip_running and admission.
+
+        Returns:
+            list: LaunchResult for every path, in the order of path_list.
+
+        Raises:
+            ValueError: If the dependencies contain a cycle.
+        """
+        if not path_list:
+            return []
+        return self.launch_plan(compile_launch_plan(path_list, dependencies, probes), **options)
+
+    def launch_plan(self, plan, **options):
+        """Run a compiled launch plan, see launch.
+
+        Args:
+            plan (LaunchPlan): The plan to run.
+            **options: Options of the launch, see LaunchOptions.
+
+        Returns:
+            list: LaunchResult for every path, in the order of plan.paths.
+        """
+        if not plan.paths:
+            return []
+        options = LaunchOptions(**options)
+        cancel_event = options.cancel_event
+        unavailable = options.unavailable or {}
+        admission = options.admission
+        process_table = ProcessTable.snapshot() if options.skip_running else ProcessTable()
+        results = {}
+
+        def notify(path, status):
+            if options.on_status is not None:
+                options.on_status(path, status)
+
+        def check(path):
+            """Get the result of a path that is not spawned, None if it may spawn."""
+            if cancel_event is not None and cancel_event.is_set():
+                return LaunchResult(path=path, error="Launch cancelled", status=LAUNCH_CANCELLED)
+            failed = [after for after in plan.start_after[path]
+                      if not results[after].succeeded]
+            if failed:
+                return LaunchResult(
+                    path=path,
+                    error=f"Dependency did not start: {failed[0]}",
+                    status=LAUNCH_FAILED
+                )
+            if path in unavailable:
+                return LaunchResult(path=path, error=unavailable[path], status=LAUNCH_FAILED)
+            pids = process_table.find(plan.specs[path])
+            if pids:
+                return LaunchResult(path=path, pid=pids[0], status=LAUNCH_ALREADY_RUNNING)
+            return None
+
+        def launch_one(path):
+            result = check(path)
+            if result is not None:
+                notify(path, result.status)
+                return result
+            if admission is None:
+                return start(path)
+            if not admission.acquire(plan.priorities.get(path, 0), cancel_event):
+                notify(path, LAUNCH_CANCELLED)
+                return LaunchResult(path=path, error="Launch cancelled", status=LAUNCH_CANCELLED)
+            try:
+                result = start(path)
+            finally:
+                admission.release(
+                    result.spawn_latency + (result.ready_latency or 0)
+                    if result is not None and result.succeeded else None
+                )
+            return result
+
+        def start(path):
+            notify(path, LAUNCH_SPAWNING)
+            result = spawn(plan.specs[path])
+            if result.succeeded and path in plan.probes:
+                notify(path, LAUNCH_WAITING)
+                wait_for_readiness(result, plan.probes[path], cancel_event)
+            notify(path, result.status)
+            return result
+
+        for path in plan.paths:
+            notify(path, LAUNCH_QUEUED)
+        pending = {path: set(after) for path, after in plan.start_after.items()}
+        workers = min(self.max_workers, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="launcher") as executor:
+            running = {executor.submit(launch_one, path): path
+                       for path, after in pending.items() if not after}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished = running.pop(future)
+                    results[finished] = future.result()
+                    for path in plan.dependents.get(finished, ()):
+                        pending[path].discard(finished)
+                        if not pending[path]:
+                            running[executor.submit(launch_one, path)] = path
+        return [results[path] for path in plan.paths]
+
+
+def _start_after(waves, dependencies):
+    """Yield every path with the known paths it has to start after.
+
+    Args:
+        waves (list): Waves returned by compute_launch_waves.
+        dependencies (dict): Mapping of path to the list of paths it starts after.
+
+    Yields:
+        tuple: (path, list of paths it starts after).
+    """
+    known_paths = {path for wave in waves for path in wave}
+    for wave in waves:
+        for path in wave:
+            yield path, [after for after in dependencies.get(path, ())
+                         if after in known_paths and after != path]
+
+
+def wait_for_readiness(result, probes, cancel_event=None):
+    """Run the readiness probes of a spawned path and record the outcome.
+
+    A wait aborted by cancel_event leaves the path cancelled rather than
+    failed. The spawned process keeps running either way.
+
+    Args:
+        result (LaunchResult): Result of the spawn, updated in place.
+        probes (list): ReadinessProbe instances that all have to pass.
+        cancel_event (threading.Event): Event that aborts waiting.
+    """
+    start = time.perf_counter()
+    for probe in probes:
+        if not probe.wait(result.process, cancel_event):
+            if cancel_event is not None and cancel_event.is_set():
+                result.error = "Launch cancelled"
+                result.status = LAUNCH_CANCELLED
+            else:
+                result.error = f"Readiness check {type(probe).__name__} did not pass"
+                result.status = LAUNCH_FAILED
+            return
+    result.ready_latency = time.perf_counter() - start
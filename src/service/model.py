@@ -0,0 +1,210 @@
+"""In-memory model of workspace profiles.
+
+Profiles are held as slotted objects instead of nested dictionaries. Every
+path string is interned, so a path that appears in many profiles, or in the
+dependencies of other paths, is stored only once. Path entries are treated
+as immutable, which lets every profile share the entry of a path without
+options. The stored JSON format is produced by to_dict and read by
+from_dict, only when the storage engine writes or loads a profile.
+"""
+
+import sys
+import weakref
+from dataclasses import dataclass, field
+
+_NO_OPTIONS = ()
+_plain_entries = weakref.WeakValueDictionary()
+
+
+def intern_path(path):
+    """Intern a path string so equal paths share a single object.
+
+    Args:
+        path (str): Path to intern.
+
+    Returns:
+        str: The interned path.
+    """
+    return sys.intern(str(path))
+
+
+class PathEntry:
+    """A path of a profile with its launch options.
+
+    Entries are not changed once created, use create or with_options to get
+    an entry with other options.
+    """
+
+    __slots__ = ("path", "after", "probes", "restart", "__weakref__")
+
+    def __init__(self, path, after=_NO_OPTIONS, probes=_NO_OPTIONS, restart=None):
+        """Initialize the entry.
+
+        Args:
+            path (str): Path of the application.
+            after (iterable): Paths of the same profile to start before this one.
+            probes (iterable): Readiness probe configuration dictionaries.
+            restart (dict): Restart policy configuration, None to never restart.
+        """
+        self.path = intern_path(path)
+        self.after = tuple(intern_path(after_path) for after_path in after)
+        self.probes = tuple(dict(config) for config in probes)
+        self.restart = dict(restart) if restart else None
+
+    def __eq__(self, other):
+        if not isinstance(other, PathEntry):
+            return NotImplemented
+        return ((self.path, self.after, self.probes, self.restart)
+                == (other.path, other.after, other.probes, other.restart))
+
+    def __repr__(self):
+        return (f"PathEntry({self.path!r}, after={self.after!r}, probes={self.probes!r}, "
+                f"restart={self.restart!r})")
+
+    @classmethod
+    def create(cls, path, after=_NO_OPTIONS, probes=_NO_OPTIONS, restart=None):
+        """Get an entry, sharing a single instance per path for entries without options.
+
+        Args:
+            path (str): Path of the application.
+            after (iterable): Paths of the same profile to start before this one.
+            probes (iterable): Readiness probe configuration dictionaries.
+            restart (dict): Restart policy configuration, None to never restart.
+
+        Returns:
+            PathEntry: The entry.
+        """
+        if after or probes or restart:
+            return cls(path, after, probes, restart)
+        entry = _plain_entries.get(path)
+        if entry is None:
+            entry = cls(path)
+            _plain_entries[entry.path] = entry
+        return entry
+
+    def with_options(self, **options):
+        """Get an entry for the same path with some options replaced.
+
+        Args:
+            **options: New values for after, probes and restart.
+
+        Returns:
+            PathEntry: The entry with the new options.
+        """
+        return self.create(self.path, options.get("after", self.after),
+                           options.get("probes", self.probes),
+                           options.get("restart", self.restart))
+
+    def options(self):
+        """Get the options of the entry in the stored format.
+
+        Returns:
+            dict: The options that are set, empty if none is.
+        """
+        options = {}
+        if self.after:
+            options["after"] = list(self.after)
+        if self.probes:
+            options["probes"] = [dict(config) for config in self.probes]
+        if self.restart:
+            options["restart"] = dict(self.restart)
+        return options
+
+
+class Profile:
+    """A named, ordered set of paths.
+
+    Entries are kept in a dictionary keyed by path, so membership checks,
+    lookups and removals don't depend on the number of paths.
+    """
+
+    __slots__ = ("name", "entries", "admission")
+
+    def __init__(self, name, entries=(), admission=None):
+        """Initialize the profile.
+
+        Args:
+            name (str): Display name of the profile.
+            entries (iterable): PathEntry objects in launch order.
+            admission (dict): Admission control settings that override the
+                defaults for this profile, None to use the defaults.
+        """
+        self.name = name
+        self.entries = {entry.path: entry for entry in entries}
+        self.admission = dict(admission) if admission else None
+
+    def __eq__(self, other):
+        if not isinstance(other, Profile):
+            return NotImplemented
+        return (self.name == other.name and self.admission == other.admission
+                and list(self.entries.values()) == list(other.entries.values()))
+
+    def __repr__(self):
+        return f"Profile({self.name!r}, paths={self.paths!r})"
+
+    @property
+    def paths(self):
+        """list: Paths of the profile in launch order."""
+        return list(self.entries)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a profile from its stored format.
+
+        Duplicate paths are dropped, keeping the first occurrence.
+
+        Args:
+            data (dict): Profile with the keys name, paths and optionally
+                options and admission.
+
+        Returns:
+            Profile: The decoded profile.
+        """
+        options = data.get("options", {})
+        return cls(data["name"], (
+            PathEntry.create(path, **options.get(path, {})) for path in data["paths"]
+        ), data.get("admission"))
+
+    def to_dict(self):
+        """Convert the profile to its stored format.
+
+        Returns:
+            dict: Profile with the keys name, paths and, if any path has
+            options, options, and admission if the profile overrides it.
+        """
+        data = {"name": self.name, "paths": list(self.entries)}
+        options = {}
+        for path, entry in self.entries.items():
+            entry_options = entry.options()
+            if entry_options:
+                options[path] = entry_options
+        if options:
+            data["options"] = options
+        if self.admission:
+            data["admission"] = dict(self.admission)
+        return data
+
+
+@dataclass
+class ProfileDiff:
+    """Differences between two states of the stored profiles.
+
+    Path changes are only reported for profiles whose paths were loaded
+    before the change.
+
+    Attributes:
+        added (dict): Mapping of ID to name of every new profile.
+        removed (dict): Mapping of ID to name of every removed profile.
+        renamed (dict): Mapping of ID to (old name, new name).
+        paths_added (dict): Mapping of profile ID to the list of added paths.
+        paths_removed (dict): Mapping of profile ID to the list of removed paths.
+    """
+
+    added: dict = field(default_factory=dict)
+    removed: dict = field(default_factory=dict)
+    renamed: dict = field(default_factory=dict)
+    paths_added: dict = field(default_factory=dict)
+    paths_removed: dict = field(default_factory=dict)
+
+    def __bool__(self):
+        return any((self.added, self.removed, self.renamed, self.paths_added, self.paths_removed))
@@ -0,0 +1,115 @@
+"""Incremental prefix and substring index over names.
+
+NameSearchIndex answers type-ahead queries without scanning every name.
+Names are kept in a list sorted by their case-folded form, so prefix
+matches are a binary search followed by a walk over the matches. Substring
+matches come from an inverted index of every 1 to 3 character slice of the
+folded names: queries of up to three characters are a single lookup,
+longer queries intersect the postings of their trigrams and check the few
+candidates left. Adding or removing a name only touches its own slices.
+"""
+
+import bisect
+
+GRAM_SIZE = 3
+
+
+def _fold(name):
+    """Get the form of a name that searches compare, ignoring case."""
+    return name.casefold()
+
+
+def _grams(folded):
+    """Get every slice of up to GRAM_SIZE characters of a folded name."""
+    return {folded[start:start + size]
+            for size in range(1, GRAM_SIZE + 1)
+            for start in range(len(folded) - size + 1)}
+
+
+class NameSearchIndex:
+    """Set of names that can be searched by prefix and substring, ignoring case."""
+
+    def __init__(self, names=()):
+        """Initialize the index.
+
+        Args:
+            names (iterable): Names to index.
+        """
+        self._sorted = []
+        self._folded = {}
+        self._postings = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        return len(self._folded)
+
+    def __contains__(self, name):
+        return name in self._folded
+
+    def add(self, name):
+        """Add a name, if it is not indexed yet.
+
+        Args:
+            name (str): Name to add.
+        """
+        if name in self._folded:
+            return
+        folded = _fold(name)
+        self._folded[name] = folded
+        bisect.insort(self._sorted, (folded, name))
+        for gram in _grams(folded):
+            self._postings.setdefault(gram, set()).add(name)
+
+    def remove(self, name):
+        """Remove a name, if it is indexed.
+
+        Args:
+            name (str): Name to remove.
+        """
+        folded = self._folded.pop(name, None)
+        if folded is None:
+            return
+        del self._sorted[bisect.bisect_left(self._sorted, (folded, name))]
+        for gram in _grams(folded):
+            names = self._postings[gram]
+            names.discard(name)
+            if not names:
+                del self._postings[gram]
+
+    def search(self, query, limit=None):
+        """Find the names containing a query, ignoring case.
+
+        Args:
+            query (str): Text to look for, every name matches an empty query.
+            limit (int): Maximum number of names to return, all if None.
+
+        Returns:
+            list: Names starting with the query in alphabetical order,
+            followed by the other names containing it in alphabetical order.
+        """
+        folded = _fold(query.strip())
+        matches = []
+        position = bisect.bisect_left(self._sorted, (folded,))
+        while position < len(self._sorted) and (limit is None or len(matches) < limit):
+            name_folded, name = self._sorted[position]
+            if not name_folded.startswith(folded):
+                break
+            matches.append(name)
+            position += 1
+        if not folded or (limit is not None and len(matches) >= limit):
+            return matches
+        candidates = self._candidates(folded)
+        others = sorted((self._folded[name], name) for name in candidates
+                        if not self._folded[name].startswith(folded)
+                        and folded in self._folded[name])
+        matches.extend(name for _, name in others[:None if limit is None else limit - len(matches)])
+        return matches
+
+    def _candidates(self, folded):
+        """Get the names that contain every trigram of a non-empty folded query."""
+        if len(folded) <= GRAM_SIZE:
+            return self._postings.get(folded, set())
+        postings = sorted((self._postings.get(folded[start:start + GRAM_SIZE], set())
+                           for start in range(len(folded) - GRAM_SIZE + 1)), key=len)
+        return postings[0].intersection(*postings[1:])
@@ -0,0 +1,133 @@
+"""Cache of the health of profile paths.
+
+A path is healthy if it exists and can be launched: it is an executable
+file, or a file the launcher opens through the shell. A bare program name
+is looked up on PATH first, as the launcher does. PathHealthCache
+checks many paths in parallel on a thread pool, because stat calls on
+network drives can take long, and remembers the outcome per path together
+with the modification time, inode and mode of the file. A later check
+still stats the path, but only assesses it again if one of those changed.
+"""
+
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.constants.health import (
+    HEALTH_HEALTHY, HEALTH_MISSING, HEALTH_NOT_EXECUTABLE, HEALTH_UNKNOWN
+)
+from src.service.launcher import SHELL_EXTENSIONS, resolve_executable
+
+DEFAULT_HEALTH_WORKERS = 16
+
+
+def assess_path(path, stat_result):
+    """Decide whether a path can be launched.
+
+    Args:
+        path (str): Path to assess.
+        stat_result (os.stat_result): Result of stat on the path, None if it failed.
+
+    Returns:
+        str: Health of the path, one of the constants of src.constants.health.
+    """
+    if stat_result is None:
+        return HEALTH_MISSING
+    if not stat.S_ISREG(stat_result.st_mode):
+        return HEALTH_NOT_EXECUTABLE
+    _, file_extension = os.path.splitext(path)
+    if file_extension in SHELL_EXTENSIONS:
+        return HEALTH_HEALTHY if os.access(path, os.R_OK) else HEALTH_NOT_EXECUTABLE
+    return HEALTH_HEALTHY if os.access(path, os.X_OK) else HEALTH_NOT_EXECUTABLE
+
+
+class PathHealthCache:
+    """Health of paths, assessed again only when a path changes on disk.
+
+    The cache can be used from several threads.
+    """
+
+    def __init__(self, max_workers=DEFAULT_HEALTH_WORKERS):
+        """Initialize an empty cache.
+
+        Args:
+            max_workers (int): Maximum number of paths checked at the same time.
+        """
+        self.max_workers = max_workers
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Get the last known health of a path, without touching the disk.
+
+        Args:
+            path (str): Path to look up.
+
+        Returns:
+            str: Health of the path, HEALTH_UNKNOWN if it was never checked.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+        return HEALTH_UNKNOWN if entry is None else entry[1]
+
+    def check(self, path):
+        """Check a path, reusing the cached health if the file did not change.
+
+        Args:
+            path (str): Path to check.
+
+        Returns:
+            str: Health of the path.
+        """
+        target = resolve_executable(path)
+        try:
+            stat_result = os.stat(target)
+        except (OSError, ValueError):
+            stat_result = None
+        key = None if stat_result is None else (
+            target, stat_result.st_mtime_ns, stat_result.st_ino, stat_result.st_mode)
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        health = assess_path(target, stat_result)
+        with self._lock:
+            self._entries[path] = (key, health)
+        return health
+
+    def check_all(self, paths, on_result=None):
+        """Check paths in parallel.
+
+        Args:
+            paths (iterable): Paths to check.
+            on_result (callable): Called with (path, health) for every path
+                whose health differs from the last known one. It is invoked
+                from worker threads.
+
+        Returns:
+            dict: Mapping of path to its health.
+        """
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return {}
+
+        def check_one(path):
+            previous = self.get(path)
+            health = self.check(path)
+            if on_result is not None and health != previous:
+                on_result(path, health)
+            return health
+
+        workers = min(self.max_workers, len(paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="path-health") as executor:
+            return dict(zip(paths, executor.map(check_one, paths)))
+
+    def retain(self, paths):
+        """Forget every path that is not in a set of paths.
+
+        Args:
+            paths (set): Paths to keep.
+        """
+        with self._lock:
+            self._entries = {path: entry for path, entry in self._entries.items()
+                             if path in paths}
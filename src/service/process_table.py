@@ -0,0 +1,88 @@
+"""Snapshot of the running processes, indexed by executable.
+
+ProcessTable is taken once per launch by walking /proc a single time and
+reading the executable of every process, so deciding whether each path
+of a profile is already running is a dictionary lookup. Processes of
+other users whose executable cannot be read are left out. Where /proc is
+not available the snapshot is empty and nothing counts as running.
+"""
+
+import logging
+import os
+
+DEFAULT_PROC_ROOT = "/proc"
+_DELETED_SUFFIX = " (deleted)"
+
+logger = logging.getLogger("ProfileService")
+
+
+class ProcessTable:
+    """Process IDs of the running processes, keyed by resolved executable path."""
+
+    def __init__(self, executables=None):
+        """Initialize the table.
+
+        Args:
+            executables (dict): Mapping of resolved executable path to the
+                tuple of IDs of the processes running it.
+        """
+        self._executables = dict(executables or {})
+
+    def __len__(self):
+        return len(self._executables)
+
+    @classmethod
+    def snapshot(cls, proc_root=DEFAULT_PROC_ROOT):
+        """Read the executables of every running process.
+
+        Args:
+            proc_root (str): Mount point of the proc file system.
+
+        Returns:
+            ProcessTable: The running processes, empty if proc_root cannot be read.
+        """
+        executables = {}
+        try:
+            entries = os.scandir(proc_root)
+        except OSError as e:
+            logger.debug("Cannot read the process table: %s", e)
+            return cls()
+        with entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    executable = os.readlink(os.path.join(entry.path, "exe"))
+                except OSError:
+                    continue  # Exited, kernel thread or not ours to read
+                if executable.endswith(_DELETED_SUFFIX):
+                    executable = executable[:-len(_DELETED_SUFFIX)]  # Replaced while running
+                executables.setdefault(executable, []).append(int(entry.name))
+        return cls({executable: tuple(pids) for executable, pids in executables.items()})
+
+    def pids(self, executable):
+        """Get the processes running an executable.
+
+        Args:
+            executable (str): Resolved path of the executable.
+
+        Returns:
+            tuple: IDs of the processes, empty if none runs it.
+        """
+        return self._executables.get(executable, ())
+
+    def find(self, spec):
+        """Get the processes already running the program of a spawn spec.
+
+        Paths started through the shell are never found, since the running
+        process is whatever program the shell opened them with.
+
+        Args:
+            spec (SpawnSpec): How the path is spawned.
+
+        Returns:
+            tuple: IDs of the processes, empty if none runs it.
+        """
+        if not self._executables or spec.options.get("shell"):
+            return ()
+        return self.pids(os.path.realpath(spec.args[0]))
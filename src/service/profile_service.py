@@ -1,42 +1,291 @@
 """Service module for managing and executing workspace profiles."""
 
-import subprocess
-import os
+import logging
+import time
+from src.constants.health import UNHEALTHY
+from src.constants.launch import LAUNCH_FAILED
+from src.service.admission import AdmissionController, AdmissionPolicy
 from src.service.data_manager import ProfileManager
+from src.service.launcher import DEFAULT_LAUNCH_WORKERS, ProfileLauncher, compile_launch_plan
+from src.service.path_health import PathHealthCache
+from src.service.readiness import probe_from_config
+from src.service.supervisor import ProcessSupervisor, RestartPolicy
+from src.service.telemetry import GROUP_BY_PATH, LaunchHistory
 
+logger = logging.getLogger("ProfileService")
 
-class ProfileService:
+
+class ProfileService:  # pylint: disable=too-many-public-methods
     """Service class for managing workspace profiles and their associated paths."""
 
     def __init__(self):
-        """Initialize ProfileService with a ProfileManager instance."""
+        """Initialize ProfileService with its managers, caches and process supervisor."""
         self.profiles = ProfileManager()
+        self.history = LaunchHistory()
+        self.health = PathHealthCache()
+        self.supervisor = ProcessSupervisor()
+        self._launch_plans = {}
 
     @staticmethod
-    def launch_all_paths_in_profile(path_list: list):
-        """Launch all paths in a profile.
+    def launch_all_paths_in_profile(path_list: list, max_workers=DEFAULT_LAUNCH_WORKERS,
+                                    **launch_options):
+        """Launch all paths in a profile concurrently, in dependency order.
 
         Args:
             path_list (list): List of paths to launch.
+            max_workers (int): Maximum number of paths spawned at the same time.
+            **launch_options: Keyword arguments forwarded to ProfileLauncher.launch:
+                dependencies, probes, on_status, cancel_event, unavailable,
+                skip_running and admission.
+
+        Returns:
+            list: LaunchResult for every path, in the order of path_list.
+
+        Raises:
+            ValueError: If the dependencies contain a cycle.
+        """
+        launcher = ProfileLauncher(max_workers=max_workers)
+        results = launcher.launch(path_list, **launch_options)
+        _log_failures(results)
+        return results
+
+    def launch_profile(self, profile_id, max_workers=DEFAULT_LAUNCH_WORKERS, supervise=False,
+                       **launch_options):
+        """Launch every path of a stored profile, honouring its dependencies and probes.
+
+        The profile is launched from its cached launch plan, see
+        get_launch_plan. Paths that the last health check found missing or
+        not executable are checked again and, if still unhealthy, fail
+        without being spawned. The launch is appended to the launch history.
+        Supervised processes are restarted according to the restart policy
+        of their path, see get_process_states. Spawns are admitted by an
+        AdmissionController with the admission policy of the profile, see
+        get_admission_policy.
+
+        Args:
+            profile_id: ID of the profile to launch.
+            max_workers (int): Maximum number of paths spawned at the same time.
+            supervise (bool): Hand the spawned processes to the supervisor.
+            **launch_options: Keyword arguments forwarded to
+                ProfileLauncher.launch_plan: on_status, cancel_event and skip_running.
+
+        Returns:
+            list: LaunchResult for every path of the profile.
+
+        Raises:
+            KeyError: If the profile doesn't exist.
+            ValueError: If the dependencies contain a cycle, or a probe or the
+                admission settings are invalid.
+        """
+        plan = self.get_launch_plan(profile_id)
+        admission = AdmissionController(self.get_admission_policy(profile_id), max_workers)
+        start = time.perf_counter()
+        results = ProfileLauncher(max_workers=max_workers).launch_plan(
+            plan,
+            unavailable=self._unavailable_paths(plan.paths),
+            admission=admission,
+            **launch_options
+        )
+        _log_failures(results)
+        if supervise:
+            self._supervise(profile_id, plan, results)
+        try:
+            self.history.record_launch(profile_id, results, time.perf_counter() - start)
+        except OSError as e:
+            logger.warning("Could not record launch history: %s", e)
+        return results
+
+    def get_launch_plan(self, profile_id):
+        """Get the compiled launch plan of a profile.
+
+        Plans are cached per profile and compiled again only after the
+        profile changed, in this process or on disk. No stored setting
+        affects a plan; the number of launch workers is applied when the
+        plan runs.
+
+        Args:
+            profile_id: ID of the profile.
+
+        Returns:
+            LaunchPlan: The plan for the paths of the profile.
+
+        Raises:
+            KeyError: If the profile doesn't exist.
+            ValueError: If the dependencies contain a cycle or a probe is invalid.
         """
-        for path in path_list:
+        with self.profiles.lock:
+            profile = self.profiles.get_entry(profile_id)
+            if profile is None:
+                raise KeyError(profile_id)
+            revision = self.profiles.revision(profile_id)
+            cached = self._launch_plans.get(profile_id)
+            if cached is not None and cached[0] is profile and cached[1] == revision:
+                return cached[2]
+            paths = profile.paths
+            probe_configs = self.profiles.get_path_probes(profile_id)
+            dependencies = self.profiles.get_path_dependencies(profile_id)
+        probes = {
+            path: [probe_from_config(config) for config in configs]
+            for path, configs in probe_configs.items()
+        }
+        plan = compile_launch_plan(paths, dependencies=dependencies, probes=probes)
+        self._launch_plans[profile_id] = (profile, revision, plan)
+        return plan
+
+    def _supervise(self, profile_id, plan, results):
+        """Hand the processes spawned by a launch to the supervisor.
+
+        Args:
+            profile_id: ID of the launched profile.
+            plan (LaunchPlan): Plan the profile was launched from.
+            results (list): LaunchResult for every path of the profile.
+        """
+        try:
+            configs = self.profiles.get_path_restart_policies(profile_id)
+        except KeyError:
+            configs = {}  # Removed while it was launched
+        for result in results:
+            if result.process is None:
+                continue
             try:
-                _, file_extension = os.path.splitext(path)
-                if file_extension in ('.rdp', '.bat'):
-                    with subprocess.Popen(path, shell=True) as process:
-                        process.wait()
-                else:
-                    with subprocess.Popen([path]) as process:
-                        process.wait()
-            except subprocess.CalledProcessError as e:
-                print(f"Error: {e}")
+                policy = RestartPolicy.from_config(configs.get(result.path, {}))
+            except ValueError as e:
+                logger.warning("Not restarting %s: %s", result.path, e)
+                policy = None
+            self.supervisor.supervise(plan.specs[result.path], result.process, policy)
+
+    def get_process_states(self):
+        """Get the state of every supervised process.
+
+        Returns:
+            dict: Mapping of path to its ProcessState.
+        """
+        return self.supervisor.states()
+
+    def stop_supervising(self):
+        """Stop supervising the launched processes, which keep running."""
+        self.supervisor.stop()
+
+    def _unavailable_paths(self, paths):
+        """Find the paths that are known to be unhealthy and still are.
+
+        Args:
+            paths (list): Paths about to be launched.
+
+        Returns:
+            dict: Mapping of unhealthy path to the reason it is skipped.
+        """
+        unavailable = {}
+        for path in paths:
+            if self.health.get(path) in UNHEALTHY:
+                health = self.health.check(path)
+                if health in UNHEALTHY:
+                    unavailable[path] = f"Path is {health}"
+        return unavailable
+
+    def check_path_health(self, paths=None, on_result=None):
+        """Check whether paths exist and can be launched, in parallel.
+
+        Only paths that changed on disk since their last check are assessed
+        again. Checking every path also forgets paths no profile contains.
+
+        Args:
+            paths (iterable): Paths to check, every path of every profile if None.
+            on_result (callable): Called with (path, health) for every path
+                whose health changed. It is invoked from worker threads.
+
+        Returns:
+            dict: Mapping of path to its health, see src.constants.health.
+        """
+        if paths is not None:
+            return self.health.check_all(paths, on_result)
+        all_paths = {}
+        with self.profiles.lock:
+            for profile_id in list(self.get_all_profiles()):
+                try:
+                    all_paths.update(dict.fromkeys(self.get_paths_for_profile(profile_id)))
+                except KeyError:
+                    continue  # Removed while the paths were collected
+        self.health.retain(all_paths)
+        return self.health.check_all(all_paths, on_result)
+
+    def get_path_health(self, path):
+        """Get the last known health of a path, without touching the disk.
+
+        Args:
+            path: Path to look up.
+
+        Returns:
+            str: Health of the path, HEALTH_UNKNOWN if it was not checked yet.
+        """
+        return self.health.get(path)
+
+    def get_data_file_path(self):
+        """Get the path of the profiles data file.
+
+        Returns:
+            str: Path to the profiles JSON file.
+        """
+        return self.profiles.file_path
+
+    def get_watched_paths(self):
+        """Get the files that change when the profiles are committed.
+
+        Returns:
+            list: Paths written by the storage engine of the profiles.
+        """
+        return self.profiles.storage.watched_paths()
+
+    def track_external_changes(self):
+        """Start recording the profile changes other processes make, see sync_from_disk."""
+        self.profiles.track_changes = True
+
+    def subscribe(self, handler, event_types=None):
+        """Call a handler for every committed profile change, see src.service.events.
+
+        Handlers run on the thread that made or loaded the change.
+
+        Args:
+            handler (callable): Called with each event.
+            event_types (tuple): Event classes to receive, every event if None.
+
+        Returns:
+            callable: Function that cancels the subscription.
+        """
+        return self.profiles.events.subscribe(handler, event_types)
+
+    def sync_from_disk(self):
+        """Reload the profiles if they were changed outside this process.
+
+        Returns:
+            list: ProfileDiff of every change found since the last call, only
+            recorded after track_external_changes, which also publishes them as
+            events.
+
+        Raises:
+            ValueError: If the changed profiles file is not valid JSON.
+        """
+        self.profiles.sync_from_disk()
+        return self.profiles.take_changes()
+
+    def get_launch_report(self, group_by=GROUP_BY_PATH):
+        """Summarise recorded launch times.
+
+        Args:
+            group_by (str): "path" for a summary per app, "profile" per profile.
+
+        Returns:
+            dict: Mapping of path or profile ID to its timing summary.
+        """
+        return self.history.summarize(group_by)
 
     def get_all_profiles(self):
         """Get all profiles data.
 
         Returns:
-            dict: Dictionary containing all profile data.
+            dict: Mapping of profile ID to Profile, decoded on access in lazy storage mode.
         """
+        self.profiles.refresh()
         return self.profiles.data
 
     def get_all_profile_names(self):
@@ -45,7 +294,53 @@ class ProfileService:
         Returns:
             list: List of profile names.
         """
-        return [profile_data["name"] for profile_data in self.profiles.data.values()]
+        return self.profiles.get_profile_names()
+
+    def get_profile_id_by_name(self, profile_name):
+        """Get the ID of a profile by its name.
+
+        Args:
+            profile_name: Name of the profile.
+
+        Returns:
+            The ID of the profile, or None if no profile has the name.
+        """
+        return self.profiles.find_profile_id(profile_name)
+
+    def search_profile_names(self, query, limit=None):
+        """Find the profile names containing a text, ignoring case.
+
+        Args:
+            query (str): Text to look for, every name matches an empty query.
+            limit (int): Maximum number of names to return, all if None.
+
+        Returns:
+            list: Names starting with the query, then the other names containing it.
+        """
+        return self.profiles.search_profile_names(query, limit)
+
+    def profile_name_exists(self, profile_name):
+        """Check whether a profile name is in use.
+
+        Args:
+            profile_name: Name to check.
+
+        Returns:
+            bool: True if a profile has the name.
+        """
+        return self.profiles.has_profile_name(profile_name)
+
+    def has_path(self, profile_id, path):
+        """Check whether a profile contains a path.
+
+        Args:
+            profile_id: ID of the profile.
+            path: Path to check.
+
+        Returns:
+            bool: True if the profile exists and contains the path.
+        """
+        return self.profiles.has_path(profile_id, path)
 
     def get_paths_for_profile(self, profile_id):
         """Get all paths associated with a profile.
@@ -56,7 +351,9 @@ class ProfileService:
         Returns:
             list: List of paths in the profile.
         """
-        return self.profiles.data[profile_id]["paths"]
+        with self.profiles.lock:
+            self.profiles.refresh()
+            return self.profiles.data[profile_id].paths
 
     def initialize_profile(self, profile_id, profile_name):
         """Initialize a new profile.
@@ -68,8 +365,6 @@ class ProfileService:
         Returns:
             bool: False if profile name exists, True if profile was created.
         """
-        if profile_name in self.get_all_profile_names():
-            return False  # Profile name already exists
         return self.profiles.add_profile(profile_id, profile_name)
 
     def delete_profile(self, profile_id):
@@ -78,7 +373,7 @@ class ProfileService:
         Args:
             profile_id: ID of the profile to delete.
         """
-        del self.profiles.data[profile_id]
+        self.profiles.remove_profile(profile_id)
 
     def create_profile(self, profile_id, profile_name):
         """Create a new profile.
@@ -90,8 +385,6 @@ class ProfileService:
         Returns:
             bool: False if profile name exists, True if profile was created.
         """
-        if profile_name in self.get_all_profile_names():
-            return False  # Profile name already exists
         return self.profiles.add_profile(profile_id, profile_name)
 
     def add_path_to_profile(self, profile_id, path):
@@ -106,6 +399,20 @@ class ProfileService:
         """
         return self.profiles.add_path_to_profile(profile_id, path)
 
+    def add_paths_to_profile(self, profile_id, paths):
+        """Add several paths to an existing profile with a single write.
+
+        Args:
+            profile_id: ID of the profile.
+            paths (list): Paths to add to the profile.
+
+        Returns:
+            bool: Success status of the operation.
+        """
+        with self.profiles.transaction():
+            added = [self.profiles.add_path_to_profile(profile_id, path) for path in paths]
+        return all(added)
+
     def change_profile_name(self, profile_id, new_name):
         """Change the name of an existing profile.
 
@@ -118,6 +425,120 @@ class ProfileService:
         """
         return self.profiles.change_profile_name(profile_id, new_name)
 
+    def set_path_dependencies(self, profile_id, path, after_paths):
+        """Set the paths that a profile path has to start after.
+
+        Args:
+            profile_id: ID of the profile.
+            path: Path whose dependencies are set.
+            after_paths (list): Paths of the same profile to start before path.
+
+        Returns:
+            bool: Success status of the operation.
+        """
+        return self.profiles.set_path_dependencies(profile_id, path, after_paths)
+
+    def get_path_dependencies(self, profile_id):
+        """Get the start-after dependencies of every path in a profile.
+
+        Args:
+            profile_id: ID of the profile.
+
+        Returns:
+            dict: Mapping of path to the list of paths it starts after.
+        """
+        return self.profiles.get_path_dependencies(profile_id)
+
+    def set_path_probes(self, profile_id, path, probe_configs):
+        """Set the readiness probes of a profile path.
+
+        Args:
+            profile_id: ID of the profile.
+            path: Path whose probes are set.
+            probe_configs (list): Probe configuration dictionaries.
+
+        Returns:
+            bool: Success status of the operation.
+
+        Raises:
+            ValueError: If a probe configuration is invalid.
+        """
+        for config in probe_configs:
+            probe_from_config(config)
+        return self.profiles.set_path_probes(profile_id, path, probe_configs)
+
+    def get_path_probes(self, profile_id):
+        """Get the readiness probe configurations of every path in a profile.
+
+        Args:
+            profile_id: ID of the profile.
+
+        Returns:
+            dict: Mapping of path to its list of probe configurations.
+        """
+        return self.profiles.get_path_probes(profile_id)
+
+    def set_path_restart_policy(self, profile_id, path, restart_config):
+        """Set when a profile path is restarted after its process exits.
+
+        Args:
+            profile_id: ID of the profile.
+            path: Path whose restart policy is set.
+            restart_config (dict): Restart policy configuration, see
+                RestartPolicy, None or empty to never restart the path.
+
+        Returns:
+            bool: Success status of the operation.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        RestartPolicy.from_config(restart_config or {})
+        return self.profiles.set_path_restart_policy(profile_id, path, restart_config)
+
+    def get_path_restart_policies(self, profile_id):
+        """Get the restart policy configuration of every path in a profile.
+
+        Args:
+            profile_id: ID of the profile.
+
+        Returns:
+            dict: Mapping of path to its restart policy configuration.
+        """
+        return self.profiles.get_path_restart_policies(profile_id)
+
+    def get_admission_policy(self, profile_id):
+        """Get the admission policy of a profile: the defaults with its overrides.
+
+        Args:
+            profile_id: ID of the profile.
+
+        Returns:
+            AdmissionPolicy: Policy applied when the profile is launched.
+
+        Raises:
+            KeyError: If the profile doesn't exist.
+            ValueError: If the stored overrides are invalid.
+        """
+        return AdmissionPolicy.from_config(self.profiles.get_profile_admission(profile_id))
+
+    def set_profile_admission(self, profile_id, admission_config):
+        """Override the admission control defaults for a profile.
+
+        Args:
+            profile_id: ID of the profile.
+            admission_config (dict): AdmissionPolicy attributes to override,
+                None or empty to use the defaults.
+
+        Returns:
+            bool: Success status of the operation.
+
+        Raises:
+            ValueError: If the settings are invalid.
+        """
+        AdmissionPolicy.from_config(admission_config or {})
+        return self.profiles.set_profile_admission(profile_id, admission_config)
+
     def get_profile_by_id(self, profile_id):
         """Get profile name by ID.
 
@@ -127,7 +548,7 @@ class ProfileService:
         Returns:
             str: Name of the profile.
         """
-        return self.profiles.data[profile_id]["name"]
+        return self.profiles.get_profile_name(profile_id)
 
     def remove_path_from_profile(self, profile_id, path):
         """Remove a path from a profile.
@@ -135,5 +556,19 @@ class ProfileService:
         Args:
             profile_id: ID of the profile.
             path: Path to remove from the profile.
+
+        Returns:
+            bool: Success status of the operation.
         """
-        self.profiles.remove_path_from_profile(profile_id, path)
+        return self.profiles.remove_path_from_profile(profile_id, path)
+
+
+def _log_failures(results):
+    """Log every path that failed to launch.
+
+    Args:
+        results (list): LaunchResult of every launched path.
+    """
+    for result in results:
+        if result.status == LAUNCH_FAILED:
+            logger.error("Error launching %s: %s", result.path, result.error)
@@ -0,0 +1,187 @@
+"""Readiness probes that tell the launcher when a spawned path is up.
+
+Probes are stored per profile path as plain configuration dictionaries, for
+example ``{"type": "tcp", "port": 5432, "timeout": 10}``, and turned into
+probe objects with probe_from_config.
+"""
+
+import os
+import socket
+import time
+
+DEFAULT_PROBE_TIMEOUT = 30.0
+DEFAULT_PROBE_INTERVAL = 0.05
+
+
+class ReadinessProbe:
+    """Base class for readiness checks with a timeout.
+
+    Subclasses implement check, which is polled until it passes or the
+    timeout expires.
+    """
+
+    def __init__(self, timeout=DEFAULT_PROBE_TIMEOUT, interval=DEFAULT_PROBE_INTERVAL):
+        """Initialize the probe.
+
+        Args:
+            timeout (float): Seconds to wait for the check to pass.
+            interval (float): Seconds to sleep between two checks.
+        """
+        self.timeout = timeout
+        self.interval = interval
+
+    def check(self, process):
+        """Check once whether the launched path is ready.
+
+        Args:
+            process (subprocess.Popen): Handle of the spawned process.
+
+        Returns:
+            bool: True if the path is ready.
+        """
+        raise NotImplementedError
+
+    def wait(self, process, cancel_event=None):
+        """Poll the check until it passes, the timeout expires or the launch is cancelled.
+
+        Args:
+            process (subprocess.Popen): Handle of the spawned process.
+            cancel_event (threading.Event): Event that aborts the wait.
+
+        Returns:
+            bool: True if the check passed before the timeout.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if self.check(process):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if cancel_event is None:
+                time.sleep(min(self.interval, remaining))
+            elif cancel_event.wait(min(self.interval, remaining)):
+                return False
+
+
+class ProcessAliveProbe(ReadinessProbe):
+    """Ready once the process is still running after a delay.
+
+    The delay starts anew in every wait, and nothing of it is kept on the
+    probe, since launch plans and their probes are reused by later and
+    concurrent launches.
+    """
+
+    def __init__(self, delay_ms=500, timeout=DEFAULT_PROBE_TIMEOUT,
+                 interval=DEFAULT_PROBE_INTERVAL):
+        """Initialize the probe.
+
+        Args:
+            delay_ms (int): Milliseconds the process has to stay alive.
+            timeout (float): Seconds to wait for the check to pass.
+            interval (float): Seconds to sleep between two checks.
+        """
+        super().__init__(timeout=max(timeout, delay_ms / 1000), interval=interval)
+        self.delay_ms = delay_ms
+
+    def check(self, process):
+        """Check whether the process is running."""
+        return process is not None and process.poll() is None
+
+    def wait(self, process, cancel_event=None):
+        """Wait for the delay, failing as soon as the process exits."""
+        deadline = time.monotonic() + self.delay_ms / 1000
+        while self.check(process):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            if cancel_event is None:
+                time.sleep(min(self.interval, remaining))
+            elif cancel_event.wait(min(self.interval, remaining)):
+                return False
+        return False
+
+
+class TcpPortProbe(ReadinessProbe):
+    """Ready once a TCP port accepts connections."""
+
+    def __init__(self, port, host="127.0.0.1", timeout=DEFAULT_PROBE_TIMEOUT,
+                 interval=DEFAULT_PROBE_INTERVAL):
+        """Initialize the probe.
+
+        Args:
+            port (int): Port that has to accept connections.
+            host (str): Host to connect to.
+            timeout (float): Seconds to wait for the check to pass.
+            interval (float): Seconds to sleep between two checks.
+        """
+        super().__init__(timeout=timeout, interval=interval)
+        self.port = int(port)
+        self.host = host
+
+    def check(self, process):
+        """Check whether the port accepts a connection."""
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.interval or 0.05):
+                return True
+        except OSError:
+            return False
+
+
+class PathExistsProbe(ReadinessProbe):
+    """Ready once a file, directory or socket exists."""
+
+    def __init__(self, path, timeout=DEFAULT_PROBE_TIMEOUT, interval=DEFAULT_PROBE_INTERVAL):
+        """Initialize the probe.
+
+        Args:
+            path (str): File system path that has to exist.
+            timeout (float): Seconds to wait for the check to pass.
+            interval (float): Seconds to sleep between two checks.
+        """
+        super().__init__(timeout=timeout, interval=interval)
+        self.path = path
+
+    def check(self, process):
+        """Check whether the path exists."""
+        return os.path.exists(self.path)
+
+
+PROBE_TYPES = {
+    "alive": ProcessAliveProbe,
+    "tcp": TcpPortProbe,
+    "path": PathExistsProbe,
+}
+
+
+def register_probe_type(name, probe_class):
+    """Register a custom probe class for use in probe configurations.
+
+    Args:
+        name (str): Value of the "type" key that selects the probe.
+        probe_class (type): ReadinessProbe subclass to instantiate.
+    """
+    PROBE_TYPES[name] = probe_class
+
+
+def probe_from_config(config):
+    """Create a probe from its stored configuration.
+
+    Args:
+        config (dict): Probe configuration with a "type" key and the keyword
+            arguments of the probe class.
+
+    Returns:
+        ReadinessProbe: The configured probe.
+
+    Raises:
+        ValueError: If the type is unknown or the arguments are invalid.
+    """
+    arguments = dict(config)
+    probe_type = arguments.pop("type", None)
+    if probe_type not in PROBE_TYPES:
+        raise ValueError(f"Unknown readiness probe type: {probe_type}")
+    try:
+        return PROBE_TYPES[probe_type](**arguments)
+    except TypeError as e:
+        raise ValueError(f"Invalid {probe_type} probe configuration: {e}") from e
@@ -1,6 +1,8 @@
 """Service module for managing application settings."""
 
-from src.constants.settings import APPEARANCE_SETTING, CURRENT_PROFILE
+from src.constants.settings import (
+    APPEARANCE_SETTING, CURRENT_PROFILE, LAUNCH_WORKERS, SKIP_RUNNING, WINDOW_GEOMETRY
+)
 from src.service.data_manager import SettingsManager
 
 
@@ -42,3 +44,78 @@ class SettingsService:
             The current user profile.
         """
         return self.settings.get_entry(CURRENT_PROFILE)
+
+    def update_launch_workers(self, launch_workers):
+        """Update the number of paths launched at the same time.
+
+        Args:
+            launch_workers (int): Maximum number of concurrent spawns.
+        """
+        self.settings.update_entry(LAUNCH_WORKERS, launch_workers)
+
+    def get_launch_workers(self):
+        """Get the number of paths launched at the same time.
+
+        Returns:
+            int: Maximum number of concurrent spawns, None if not set.
+        """
+        return self.settings.get_entry(LAUNCH_WORKERS)
+
+    def update_skip_running(self, skip_running):
+        """Update whether launches skip the paths that are already running.
+
+        Args:
+            skip_running (bool): True to skip running paths.
+        """
+        self.settings.update_entry(SKIP_RUNNING, skip_running)
+
+    def get_skip_running(self):
+        """Get whether launches skip the paths that are already running.
+
+        Returns:
+            bool: True to skip running paths, None if not set.
+        """
+        return self.settings.get_entry(SKIP_RUNNING)
+
+    def update_window_geometry(self, window_geometry):
+        """Remember the size and position of the main window.
+
+        Args:
+            window_geometry (str): Geometry string in format 'WIDTHxHEIGHT+X+Y'.
+        """
+        self.settings.update_entry(WINDOW_GEOMETRY, window_geometry)
+
+    def get_window_geometry(self):
+        """Get the remembered size and position of the main window.
+
+        Returns:
+            str: Geometry string, None if not set.
+        """
+        return self.settings.get_entry(WINDOW_GEOMETRY)
+
+    def get_data_file_path(self):
+        """Get the path of the settings data file.
+
+        Returns:
+            str: Path to the settings JSON file.
+        """
+        return self.settings.file_path
+
+    def get_watched_paths(self):
+        """Get the files that change when the settings are committed.
+
+        Returns:
+            list: Paths written by the storage engine of the settings.
+        """
+        return self.settings.storage.watched_paths()
+
+    def sync_from_disk(self):
+        """Reload the settings if they were changed outside this process.
+
+        Returns:
+            bool: True if the settings were reloaded.
+
+        Raises:
+            ValueError: If the changed settings file is not valid JSON.
+        """
+        return self.settings.sync_from_disk()
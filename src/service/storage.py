@@ -0,0 +1,972 @@
+"""Storage engines used by the data managers to persist their entries.
+
+Each engine loads the whole store as a mapping and commits the keys a
+mutation changed. JsonStorage rewrites the full JSON document on every
+commit, LazyJsonStorage reads the same document as raw bytes and decodes
+entries only when they are accessed, JournalStorage appends one record per
+changed key and compacts the journal into a fresh snapshot in the
+background, and the SQLite engines update only the rows of changed keys in
+a shared local database.
+
+Values that are not JSON types, such as the Profile model, are converted
+with their to_dict method when they are written.
+
+Every engine has a version attribute, a StoreVersion or SqliteVersion,
+that the data managers use to notice commits of other processes and to
+serialise their own commits, a watched_paths method that lists the files
+a commit writes, and a close method that releases the files and
+connections it holds.
+
+The engine used by default is selected with the WORKSPACE_VIEWER_STORAGE
+environment variable and falls back to JSON.
+"""
+
+import contextlib
+import json
+import os
+import threading
+from collections.abc import MutableMapping
+from src.service.file_lock import FileLock
+
+STORAGE_JSON = "json"
+STORAGE_JOURNAL = "journal"
+STORAGE_SQLITE = "sqlite"
+STORAGE_LAZY = "lazy"
+SQLITE_DATABASE_NAME = "workspace.db"
+STORAGE_MODE_ENV = "WORKSPACE_VIEWER_STORAGE"
+DEFAULT_COMPACT_BYTES = 256 * 1024
+
+_NOT_LOADED = object()
+
+
+def _to_json_types(value):
+    """Convert a model object to JSON types, used as the json.dumps default.
+
+    Args:
+        value: Object that json cannot encode by itself.
+
+    Returns:
+        The result of the object's to_dict method.
+
+    Raises:
+        TypeError: If the object has no to_dict method.
+    """
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _stat_stamp(file_path):
+    """Get the stat result that identifies the content of a file, None if it is missing."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _write_file_atomically(file_path, content):
+    """Replace a file so that a crash leaves either the old or the new content.
+
+    Args:
+        file_path (str): File to replace.
+        content (str): New content of the file, written as UTF-8 if it is text.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "wb") as temp_file:
+        temp_file.write(content)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    os.replace(temp_path, file_path)
+
+
+class StoreVersion:
+    """Monotonic version stamp of a file-based store, shared between processes.
+
+    The version is kept in a small sidecar file and incremented under an
+    advisory lock on every commit. Checking for changes by other processes
+    only stats the sidecar and reads it when its stat result changed.
+    """
+
+    def __init__(self, file_path):
+        """Initialize the version stamp.
+
+        Args:
+            file_path (str): Path to the data file, the sidecars are stored next to it.
+        """
+        self.version_path = f"{file_path}.version"
+        self.lock_path = f"{file_path}.lock"
+        self._stamp = None
+
+    def lock(self):
+        """Get the lock that serialises commits of every process.
+
+        Returns:
+            FileLock: Lock to use as a context manager.
+        """
+        return FileLock(self.lock_path)
+
+    def read(self):
+        """Read the current version.
+
+        Returns:
+            int: The version, 0 if the store was never committed with a version.
+        """
+        self._stamp = self._stat()
+        try:
+            with open(self.version_path, "r", encoding="utf-8") as version_file:
+                return int(version_file.read() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def changed(self, known_version):
+        """Check cheaply whether the store moved past a known version.
+
+        Args:
+            known_version (int): Version the caller loaded or committed.
+
+        Returns:
+            bool: True if another commit happened since.
+        """
+        if self._stat() == self._stamp:
+            return False
+        return self.read() != known_version
+
+    def bump(self):
+        """Increment the version, while holding the lock.
+
+        Returns:
+            int: The new version.
+        """
+        version = self.read() + 1
+        _write_file_atomically(self.version_path, str(version))
+        self._stamp = self._stat()
+        return version
+
+    def _stat(self):
+        """Get the stat result of the version file that identifies its content."""
+        return _stat_stamp(self.version_path)
+
+
+class SqliteVersion:
+    """Version stamp of one table of a SQLite store, kept in the versions table.
+
+    Every commit to the table increments its counter in the same
+    transaction, so commits to other tables of the shared database don't
+    change it. The counter is only read again when PRAGMA data_version
+    reports a commit of another connection, or after a commit of this one.
+    SQLite serialises writers itself, so the lock is a no-op.
+    """
+
+    def __init__(self, connection, table_name):
+        """Initialize the version stamp.
+
+        Args:
+            connection (sqlite3.Connection): Connection of the storage.
+            table_name (str): Name of the versioned table.
+        """
+        self.connection = connection
+        self.table_name = table_name
+        self._data_version = None
+        self._counter = 0
+
+    @staticmethod
+    def lock():
+        """Get a no-op lock.
+
+        Returns:
+            contextlib.nullcontext: Context manager that does nothing.
+        """
+        return contextlib.nullcontext()
+
+    def read(self):
+        """Read the current version of the table.
+
+        Returns:
+            int: The commit counter of the table, 0 if it was never committed.
+        """
+        data_version = self.connection.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            row = self.connection.execute(
+                "SELECT counter FROM versions WHERE name = ?", (self.table_name,)).fetchone()
+            self._counter = row[0] if row else 0
+            self._data_version = data_version
+        return self._counter
+
+    def changed(self, known_version):
+        """Check whether the table was committed since a known version.
+
+        Args:
+            known_version (int): Version the caller loaded or committed.
+
+        Returns:
+            bool: True if the table was committed since.
+        """
+        return self.read() != known_version
+
+    def increment(self):
+        """Increment the counter of the table, inside the transaction of a commit."""
+        self.connection.execute(
+            "INSERT INTO versions (name, counter) VALUES (?, 1)"
+            " ON CONFLICT(name) DO UPDATE SET counter = counter + 1",
+            (self.table_name,)
+        )
+        self._data_version = None  # Own commits don't change data_version
+
+    def bump(self):
+        """Get the version after a commit of this connection.
+
+        Returns:
+            int: The counter, already incremented by the commit.
+        """
+        return self.read()
+
+
+class JsonStorage:
+    """Stores all entries in a single JSON document that is rewritten on commit."""
+
+    def __init__(self, file_path):
+        """Initialize the storage.
+
+        Args:
+            file_path (str): Path to the JSON file.
+        """
+        self.file_path = file_path
+        self.version = StoreVersion(file_path)
+
+    def load(self):
+        """Load every entry.
+
+        Returns:
+            dict: Stored entries, empty if the file doesn't exist.
+        """
+        if os.path.exists(self.file_path):
+            with open(self.file_path, "r", encoding="utf-8") as json_file:
+                return json.load(json_file)
+        return {}
+
+    def commit(self, data, dirty_keys):  # pylint: disable=unused-argument
+        """Write the whole store.
+
+        Args:
+            data (dict): Every entry of the store.
+            dirty_keys (set): Keys changed since the last commit.
+        """
+        _write_file_atomically(self.file_path, json.dumps(data, indent=2, default=_to_json_types))
+
+    def close(self):
+        """Release the storage, nothing is held open between commits."""
+
+    def watched_paths(self):
+        """Get the files a commit of this store writes.
+
+        Returns:
+            list: Paths of the JSON file and its version file.
+        """
+        return [self.file_path, self.version.version_path]
+
+
+class LazyEntries(MutableMapping):
+    """Mapping over a JSON document whose entries are decoded on first access.
+
+    Every entry starts as a byte range of the raw document. Reading
+    an entry parses only its range and passes the result through decode.
+    Entries that are assigned or deleted no longer refer to the document.
+    """
+
+    def __init__(self, source, ranges, summaries, decode=None):
+        """Initialize the mapping.
+
+        Args:
+            source: Bytes-like content of the document.
+            ranges (dict): Mapping of key to (offset, length) of its value in source.
+            summaries (dict): Mapping of key to the indexed fields of its value.
+            decode (callable): Converts a parsed value, defaults to no conversion.
+        """
+        self.source = source
+        self.decode = decode
+        self._ranges = ranges
+        self._summaries = summaries
+        self._values = dict.fromkeys(ranges, _NOT_LOADED)
+
+    def __getitem__(self, key):
+        value = self._values[key]
+        if value is _NOT_LOADED:
+            offset, length = self._ranges[key]
+            value = json.loads(self.source[offset:offset + length])
+            if self.decode is not None:
+                value = self.decode(value)
+            self._values[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+        self._ranges.pop(key, None)
+        self._summaries.pop(key, None)
+
+    def __delitem__(self, key):
+        del self._values[key]
+        self._ranges.pop(key, None)
+        self._summaries.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def is_loaded(self, key):
+        """Check whether an entry was decoded or assigned.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            bool: False if the entry is still only a range of the document.
+        """
+        return self._values[key] is not _NOT_LOADED
+
+    def summary(self, key):
+        """Get the indexed fields of an entry without decoding it.
+
+        Args:
+            key: Key of an entry that is not loaded.
+
+        Returns:
+            dict: The fields named in the storage's index_fields.
+        """
+        return self._summaries[key]
+
+    def raw(self, key):
+        """Get the encoded value of an entry that is not loaded.
+
+        Args:
+            key: Key of the entry.
+
+        Returns:
+            bytes: The value as it appears in the document.
+        """
+        offset, length = self._ranges[key]
+        return self.source[offset:offset + length]
+
+    def rebase(self, source, ranges, summaries):
+        """Point the entries that are not loaded at a rewritten document.
+
+        Args:
+            source: Bytes-like content of the new document.
+            ranges (dict): Ranges of the entries in the new document.
+            summaries (dict): Indexed fields of the entries in the new document.
+        """
+        self.source = source
+        self._ranges = {key: ranges[key] for key in self._values if key in ranges}
+        self._summaries = {key: summaries[key] for key in self._ranges if key in summaries}
+
+
+class LazyJsonStorage:
+    """Stores all entries in a JSON document that is decoded entry by entry.
+
+    The byte range of every entry is kept in a sidecar index next to the
+    document, together with the fields named in index_fields. On load the
+    document is read as raw bytes and only the index is parsed, so the cost
+    of decoding depends on the entries that are accessed rather than on the
+    size of the store. The index is rebuilt by scanning the document when
+    its size or modification time no longer match, such as after an edit
+    by hand.
+
+    The document is not kept open between loads, since another process
+    could not replace an open file on Windows.
+
+    Commits rewrite the document with one entry per line, copying entries
+    that were never loaded byte for byte, and write a fresh index.
+    """
+
+    def __init__(self, file_path, index_fields=()):
+        """Initialize the storage.
+
+        Args:
+            file_path (str): Path to the JSON file, the index is stored next to it.
+            index_fields (tuple): Fields of every entry to keep in the index,
+                readable through LazyEntries.summary without decoding the entry.
+        """
+        self.file_path = file_path
+        self.version = StoreVersion(file_path)
+        self.index_path = f"{file_path}.idx"
+        self.index_fields = tuple(index_fields)
+
+    def load(self):
+        """Read the document and its index, rebuilding the index if it is out of date.
+
+        Returns:
+            LazyEntries: Stored entries, decoded on access.
+
+        Raises:
+            ValueError: If the document is not valid JSON.
+        """
+        try:
+            with open(self.file_path, "rb") as json_file:
+                source = json_file.read()
+                stat = os.fstat(json_file.fileno())
+        except FileNotFoundError:
+            return LazyEntries(b"", {}, {})
+        if not source:
+            return LazyEntries(b"", {}, {})
+        stamp = self._file_stamp(stat)
+        index = self._read_index(stamp)
+        if index is None:
+            ranges, summaries = self._scan(source)
+            self._write_index(ranges, summaries, stamp)
+        else:
+            ranges, summaries = index
+        return LazyEntries(source, ranges, summaries)
+
+    def commit(self, data, dirty_keys):  # pylint: disable=unused-argument
+        """Rewrite the document and its index.
+
+        Args:
+            data (dict): Every entry of the store, usually the LazyEntries from load.
+            dirty_keys (set): Keys changed since the last commit.
+        """
+        lazy = isinstance(data, LazyEntries)
+        chunks = [b"{"]
+        offset = 1
+        ranges = {}
+        summaries = {}
+        for position, key in enumerate(data):
+            if lazy and not data.is_loaded(key):
+                value = bytes(data.raw(key))
+                if self.index_fields:
+                    summaries[key] = data.summary(key)
+            else:
+                entry = data[key]
+                value = json.dumps(entry, default=_to_json_types).encode("utf-8")
+                if self.index_fields:
+                    summaries[key] = self._summarize(json.loads(value))
+            prefix = ("," if position else "").encode("utf-8") + b"\n  " + json.dumps(
+                key).encode("utf-8") + b": "
+            offset += len(prefix)
+            ranges[key] = (offset, len(value))
+            offset += len(value)
+            chunks.extend((prefix, value))
+        chunks.append(b"\n}\n")
+        content = b"".join(chunks)
+
+        _write_file_atomically(self.file_path, content)
+        self._write_index(ranges, summaries, self._file_stamp(os.stat(self.file_path)))
+        if lazy:
+            data.rebase(content, ranges, summaries)
+
+    def close(self):
+        """Release the storage, the document is not held open between loads."""
+
+    def watched_paths(self):
+        """Get the files a commit of this store writes, apart from the index.
+
+        Returns:
+            list: Paths of the JSON file and its version file.
+        """
+        return [self.file_path, self.version.version_path]
+
+    @staticmethod
+    def _file_stamp(stat):
+        """Get the size and modification time the index has to match."""
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _read_index(self, stamp):
+        """Read the sidecar index, None if it is missing or does not match the stamp."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError):
+            return None
+        if index.get("stamp") != stamp or index.get("fields") != list(
+                self.index_fields):
+            return None
+        ranges = {key: tuple(entry[:2]) for key, entry in index["entries"].items()}
+        summaries = {key: entry[2] for key, entry in index["entries"].items() if len(entry) > 2}
+        return ranges, summaries
+
+    def _write_index(self, ranges, summaries, stamp):
+        """Write the sidecar index for the document with the given stamp."""
+        entries = {}
+        for key, (offset, length) in ranges.items():
+            entries[key] = [offset, length]
+            if key in summaries:
+                entries[key].append(summaries[key])
+        index = {"stamp": stamp, "fields": list(self.index_fields),
+                 "entries": entries}
+        try:
+            _write_file_atomically(self.index_path, json.dumps(index, separators=(",", ":")))
+        except OSError:
+            pass  # The index only speeds up the next load
+
+    def _scan(self, source):
+        """Find the byte range of every entry by parsing the whole document once.
+
+        Args:
+            source: Bytes-like view of the document.
+
+        Returns:
+            tuple: Mapping of key to (offset, length) and mapping of key to summary.
+
+        Raises:
+            ValueError: If the document is not a JSON object.
+        """
+        text = bytes(source).decode("utf-8")
+        decoder = json.JSONDecoder()
+        ranges = {}
+        summaries = {}
+        byte_offset = 0
+        char_offset = 0
+
+        def skip_whitespace(position):
+            while position < len(text) and text[position] in " \t\r\n":
+                position += 1
+            return position
+
+        def to_bytes(position):
+            nonlocal byte_offset, char_offset
+            byte_offset += len(text[char_offset:position].encode("utf-8"))
+            char_offset = position
+            return byte_offset
+
+        position = skip_whitespace(0)
+        if text[position:position + 1] != "{":
+            raise ValueError(f"{self.file_path} does not hold a JSON object")
+        position = skip_whitespace(position + 1)
+        while text[position:position + 1] != "}":
+            key, position = decoder.raw_decode(text, position)
+            position = skip_whitespace(position)
+            if text[position:position + 1] != ":":
+                raise ValueError(f"Expected ':' at character {position} of {self.file_path}")
+            start = skip_whitespace(position + 1)
+            value, end = decoder.raw_decode(text, start)
+            start_byte = to_bytes(start)
+            ranges[key] = (start_byte, to_bytes(end) - start_byte)
+            if self.index_fields:
+                summaries[key] = self._summarize(value)
+            position = skip_whitespace(end)
+            if text[position:position + 1] == ",":
+                position = skip_whitespace(position + 1)
+        return ranges, summaries
+
+    def _summarize(self, value):
+        """Pick the indexed fields of a parsed entry."""
+        if not isinstance(value, dict):
+            return {}
+        return {field: value[field] for field in self.index_fields if field in value}
+
+
+class JournalStorage:
+    """Stores entries as a snapshot plus an append-only journal of changes.
+
+    Every commit appends one record per changed key to the journal, so its
+    cost does not depend on the size of the store. Once the journal passes
+    compact_bytes it is rotated aside and a background thread writes a fresh
+    snapshot and removes the rotated journal. Records are replayed in
+    order on load; replaying a journal that was already compacted is
+    harmless because each record holds the final value of its key.
+
+    The compaction thread takes the store's lock, so it cannot interleave
+    with commits of other processes, and it leaves a rotated journal alone
+    if a commit already folded it in. Loads don't take the lock; a load
+    that sees the snapshot or the rotated journal change under it starts
+    over.
+    """
+
+    def __init__(self, file_path, compact_bytes=DEFAULT_COMPACT_BYTES):
+        """Initialize the storage.
+
+        Args:
+            file_path (str): Path to the snapshot file, the journal is stored next to it.
+            compact_bytes (int): Journal size that triggers a compaction.
+        """
+        self.file_path = file_path
+        self.version = StoreVersion(file_path)
+        self.journal_path = f"{file_path}.journal"
+        self.rotated_journal_path = f"{file_path}.journal.1"
+        self.compact_bytes = compact_bytes
+        self._compaction = None
+
+    def load(self):
+        """Load the snapshot and replay the journals on top of it.
+
+        A record cut short by a crash is ignored.
+
+        Returns:
+            dict: Stored entries.
+        """
+        while True:
+            stamps = self._stamps()
+            data = self._replay()
+            if self._stamps() == stamps:
+                return data
+
+    def commit(self, data, dirty_keys):
+        """Append the new value of every changed key to the journal.
+
+        Args:
+            data (dict): Every entry of the store.
+            dirty_keys (set): Keys changed since the last commit.
+        """
+        records = []
+        for key in dirty_keys:
+            record = {"k": key}
+            if key in data:
+                record["v"] = data[key]
+            records.append(
+                json.dumps(record, separators=(",", ":"), default=_to_json_types) + "\n")
+        directory = os.path.dirname(self.journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        content = "".join(records).encode("utf-8")
+        with open(self.journal_path, "a+b") as journal_file:
+            if journal_file.seek(0, os.SEEK_END):
+                journal_file.seek(-1, os.SEEK_END)
+                if journal_file.read(1) != b"\n":
+                    # Terminate a record cut short by a crash, so it doesn't swallow ours
+                    content = b"\n" + content
+            journal_file.write(content)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+            journal_size = journal_file.tell()
+        if journal_size > self.compact_bytes:
+            self.compact(data)
+
+    def compact(self, data):
+        """Fold the journal into a fresh snapshot on a background thread.
+
+        Called with the store's lock held. Nothing is done while a
+        compaction of this storage is still waiting for the lock.
+
+        Args:
+            data (dict): Every entry of the store, matching snapshot plus journal.
+        """
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        snapshot = json.dumps(data, indent=2, default=_to_json_types)
+        if os.path.exists(self.rotated_journal_path):
+            # Left behind by an interrupted or pending compaction, data already includes it
+            self._write_snapshot(snapshot)
+            os.remove(self.journal_path)
+            return
+        os.replace(self.journal_path, self.rotated_journal_path)
+        self._compaction = threading.Thread(
+            target=self._fold_rotated_journal,
+            args=(snapshot, _stat_stamp(self.rotated_journal_path)),
+            name="journal-compaction"
+        )
+        self._compaction.start()
+
+    def wait_for_compaction(self):
+        """Block until a running compaction has finished."""
+        if self._compaction is not None:
+            self._compaction.join()
+            self._compaction = None
+
+    def close(self):
+        """Wait for a running compaction, nothing else is held open."""
+        self.wait_for_compaction()
+
+    def watched_paths(self):
+        """Get the files a commit or a compaction of this store writes.
+
+        Returns:
+            list: Paths of the snapshot, the version file and both journals.
+        """
+        return [self.file_path, self.version.version_path,
+                self.journal_path, self.rotated_journal_path]
+
+    def _stamps(self):
+        """Get the stat results that change when a compaction rotates or folds a journal."""
+        return _stat_stamp(self.file_path), _stat_stamp(self.rotated_journal_path)
+
+    def _replay(self):
+        """Read the snapshot and the records of both journals once."""
+        data = {}
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as snapshot_file:
+                data = json.load(snapshot_file)
+        except FileNotFoundError:
+            pass
+        for journal_path in (self.rotated_journal_path, self.journal_path):
+            try:
+                with open(journal_path, "r", encoding="utf-8") as journal_file:
+                    lines = journal_file.readlines()
+            except FileNotFoundError:
+                continue  # Not written yet, or folded in by a compaction
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Incomplete record from an interrupted write
+                if "v" in record:
+                    data[record["k"]] = record["v"]
+                else:
+                    data.pop(record["k"], None)
+        return data
+
+    def _fold_rotated_journal(self, snapshot, rotated_stamp):
+        """Write a snapshot under the store's lock, unless a commit already folded the journal.
+
+        Args:
+            snapshot (str): Snapshot that includes the rotated journal.
+            rotated_stamp (tuple): Stat result of the rotated journal when it was rotated.
+        """
+        with self.version.lock():
+            if _stat_stamp(self.rotated_journal_path) == rotated_stamp:
+                self._write_snapshot(snapshot)
+
+    def _write_snapshot(self, snapshot):
+        """Write a snapshot and drop the journal it replaces."""
+        _write_file_atomically(self.file_path, snapshot)
+        os.remove(self.rotated_journal_path)
+
+
+class SqliteStorage:
+    """Stores key/value entries as rows of a table in a local SQLite database.
+
+    Values are JSON encoded. Commits only touch the rows of changed keys
+    and increment the version of their table, see SqliteVersion. The first
+    time a table is opened, the entries of the JSON file it replaces are
+    migrated into it.
+    """
+
+    TABLE_SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS settings ("
+        " key TEXT PRIMARY KEY,"
+        " value TEXT NOT NULL)",
+    )
+    TABLE_NAME = "settings"
+
+    def __init__(self, file_path, database_path=None):
+        """Initialize the storage.
+
+        Args:
+            file_path (str): Path to the JSON file this storage replaces.
+            database_path (str): Path to the database, defaults to
+                SQLITE_DATABASE_NAME next to file_path.
+        """
+        self.file_path = file_path
+        self.database_path = database_path or os.path.join(
+            os.path.dirname(file_path), SQLITE_DATABASE_NAME)
+        directory = os.path.dirname(self.database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Imported here, since only the SQLite storage mode needs it at start-up
+        import sqlite3  # pylint: disable=import-outside-toplevel
+        self.connection = sqlite3.connect(self.database_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.version = SqliteVersion(self.connection, self.TABLE_NAME)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS migrations (name TEXT PRIMARY KEY)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS versions ("
+                " name TEXT PRIMARY KEY,"
+                " counter INTEGER NOT NULL)")
+            for statement in self.TABLE_SCHEMA:
+                self.connection.execute(statement)
+
+    def load(self):
+        """Load every entry, migrating the JSON file on first use.
+
+        Returns:
+            dict: Stored entries.
+        """
+        self.migrate_from_json()
+        return self._read_rows()
+
+    def commit(self, data, dirty_keys):
+        """Insert, update or delete the rows of the changed keys in one transaction.
+
+        Args:
+            data (dict): Every entry of the store.
+            dirty_keys (set): Keys changed since the last commit.
+        """
+        written_keys = [key for key in dirty_keys if key in data]
+        with self.connection:
+            for key in dirty_keys:
+                if key not in data:
+                    self._delete_row(key)
+            self._release_rows(written_keys)
+            for key in written_keys:
+                self._write_row(key, data[key])
+            self.version.increment()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def watched_paths(self):
+        """Get the files a commit to the database writes.
+
+        In WAL mode commits are appended to the write-ahead log and reach
+        the database file only when the log is checkpointed.
+
+        Returns:
+            list: Paths of the database and its write-ahead log.
+        """
+        return [self.database_path, f"{self.database_path}-wal"]
+
+    def migrate_from_json(self):
+        """Import the entries of the JSON file this table replaces, once.
+
+        Returns:
+            bool: True if entries were imported by this call.
+        """
+        migration = f"{self.TABLE_NAME}:{os.path.abspath(self.file_path)}"
+        if self.connection.execute(
+                "SELECT 1 FROM migrations WHERE name = ?", (migration,)).fetchone():
+            return False
+        data = self._prepare_migration(JsonStorage(self.file_path).load())
+        with self.connection:
+            for key, value in data.items():
+                self._write_row(key, value)
+            self.connection.execute("INSERT INTO migrations (name) VALUES (?)", (migration,))
+            if data:
+                self.version.increment()
+        return bool(data)
+
+    @staticmethod
+    def _prepare_migration(data):
+        """Adjust entries read from JSON so they fit the table constraints."""
+        return data
+
+    def _release_rows(self, keys):
+        """Free the unique values of rows about to be rewritten, nothing by default."""
+
+    def _read_rows(self):
+        """Read every row of the table."""
+        return {key: json.loads(value) for key, value in
+                self.connection.execute("SELECT key, value FROM settings")}
+
+    def _write_row(self, key, value):
+        """Insert or replace the row of a key."""
+        self.connection.execute(
+            "INSERT INTO settings (key, value) VALUES (?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, json.dumps(value, default=_to_json_types))
+        )
+
+    def _delete_row(self, key):
+        """Delete the row of a key."""
+        self.connection.execute("DELETE FROM settings WHERE key = ?", (key,))
+
+
+class SqliteProfileStorage(SqliteStorage):
+    """Stores profiles and their paths in indexed SQLite tables.
+
+    Profile names are unique and indexed. Paths are kept in their own table
+    in profile order, so changing a profile only rewrites its own rows.
+    Any other profile attributes, such as path options, are stored as JSON.
+    """
+
+    TABLE_SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS profiles ("
+        " id TEXT PRIMARY KEY,"
+        " name TEXT NOT NULL UNIQUE,"
+        " attributes TEXT NOT NULL DEFAULT '{}')",
+        "CREATE TABLE IF NOT EXISTS profile_paths ("
+        " profile_id TEXT NOT NULL REFERENCES profiles (id) ON DELETE CASCADE,"
+        " position INTEGER NOT NULL,"
+        " path TEXT NOT NULL,"
+        " PRIMARY KEY (profile_id, position))",
+        "CREATE INDEX IF NOT EXISTS profile_paths_path ON profile_paths (path)",
+    )
+    TABLE_NAME = "profiles"
+
+    @staticmethod
+    def _prepare_migration(data):
+        """Make duplicate profile names from the JSON file unique."""
+        used_names = set()
+        for profile in data.values():
+            name = profile["name"]
+            suffix = 2
+            while name in used_names:
+                name = f"{profile['name']} ({suffix})"
+                suffix += 1
+            profile["name"] = name
+            used_names.add(name)
+        return data
+
+    def _read_rows(self):
+        """Read every profile with its paths in order."""
+        profiles = {}
+        for profile_id, name, attributes in self.connection.execute(
+                "SELECT id, name, attributes FROM profiles ORDER BY rowid"):
+            profiles[profile_id] = {"name": name, "paths": [], **json.loads(attributes)}
+        for profile_id, path in self.connection.execute(
+                "SELECT profile_id, path FROM profile_paths ORDER BY profile_id, position"):
+            profiles[profile_id]["paths"].append(path)
+        return profiles
+
+    def _release_rows(self, keys):
+        """Give the profiles about to be rewritten placeholder names.
+
+        Names may be swapped between profiles within one commit, so no
+        final name is written while another row still holds it.
+        """
+        self.connection.executemany(
+            "UPDATE profiles SET name = ? WHERE id = ?",
+            [(f"\0{key}", key) for key in keys]
+        )
+
+    def _write_row(self, key, value):
+        """Insert or update a profile and replace its paths."""
+        if not isinstance(value, dict):
+            value = _to_json_types(value)
+        attributes = {name: item for name, item in value.items() if name not in ("name", "paths")}
+        self.connection.execute(
+            "INSERT INTO profiles (id, name, attributes) VALUES (?, ?, ?)"
+            " ON CONFLICT(id) DO UPDATE SET name = excluded.name,"
+            " attributes = excluded.attributes",
+            (key, value["name"], json.dumps(attributes))
+        )
+        self.connection.execute("DELETE FROM profile_paths WHERE profile_id = ?", (key,))
+        self.connection.executemany(
+            "INSERT INTO profile_paths (profile_id, position, path) VALUES (?, ?, ?)",
+            [(key, position, path) for position, path in enumerate(value["paths"])]
+        )
+
+    def _delete_row(self, key):
+        """Delete a profile, its paths are removed by the foreign key."""
+        self.connection.execute("DELETE FROM profiles WHERE id = ?", (key,))
+
+
+def create_storage(file_path, mode=None, sqlite_storage=SqliteStorage, index_fields=()):
+    """Create the storage engine for a data file.
+
+    Args:
+        file_path (str): Path to the data file.
+        mode (str): STORAGE_JSON, STORAGE_LAZY, STORAGE_JOURNAL or
+            STORAGE_SQLITE, defaults to the WORKSPACE_VIEWER_STORAGE
+            environment variable or STORAGE_JSON.
+        sqlite_storage (type): SqliteStorage class used in SQLite mode.
+        index_fields (tuple): Fields of every entry kept in the lazy mode index.
+
+    Returns:
+        The storage engine.
+
+    Raises:
+        ValueError: If the mode is unknown.
+    """
+    mode = mode or os.environ.get(STORAGE_MODE_ENV) or STORAGE_JSON
+    if mode == STORAGE_JSON:
+        return JsonStorage(file_path)
+    if mode == STORAGE_LAZY:
+        return LazyJsonStorage(file_path, index_fields)
+    if mode == STORAGE_JOURNAL:
+        return JournalStorage(file_path)
+    if mode == STORAGE_SQLITE:
+        return sqlite_storage(file_path)
+    raise ValueError(f"Unknown storage mode: {mode}")
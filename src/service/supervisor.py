@@ -0,0 +1,414 @@
+"""Supervisor for the processes started by profile launches.
+
+ProcessSupervisor watches any number of launched processes from a single
+daemon thread. On Linux every process is watched through a pidfd, which
+becomes readable when the process exits, so the thread sleeps in one
+selector call until a process exits, a restart is due or a process is
+added. Where pidfds are not available the same loop polls the processes
+it could not open, at a fixed interval.
+
+An exited process is reaped right away and restarted according to the
+RestartPolicy of its path, with an exponential backoff between
+consecutive restarts. The state of every supervised path, with its PID,
+uptime and restart count, can be read at any time with states.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import selectors
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from src.constants.process import (
+    PROCESS_CRASHED, PROCESS_EXITED, PROCESS_RESTARTING, PROCESS_RUNNING, RESTART_ALWAYS,
+    RESTART_MODES, RESTART_NEVER, RESTART_ON_CRASH
+)
+from src.service import launcher
+
+DEFAULT_POLL_INTERVAL_SECONDS = 0.5
+
+logger = logging.getLogger("ProfileService")
+
+
+@dataclass(frozen=True)
+class RestartPolicy:
+    """When and how fast a supervised path is restarted after its process exits.
+
+    Attributes:
+        mode (str): "never", "on-crash" to restart after a non-zero exit code,
+            or "always".
+        max_restarts (int): Consecutive restarts before the path is given up.
+        backoff (float): Seconds before the first restart, doubled for every
+            consecutive restart.
+        max_backoff (float): Longest wait before a restart, in seconds.
+        reset_after (float): Seconds a process has to run for its exit not
+            to count as consecutive, which resets the backoff.
+    """
+
+    mode: str = RESTART_NEVER
+    max_restarts: int = 5
+    backoff: float = 1.0
+    max_backoff: float = 60.0
+    reset_after: float = 60.0
+
+    def __post_init__(self):
+        if self.mode not in RESTART_MODES:
+            raise ValueError(f"Unknown restart mode: {self.mode}")
+        if self.max_restarts < 0 or self.backoff < 0 or self.max_backoff < 0:
+            raise ValueError("Restart limits must not be negative")
+
+    @classmethod
+    def from_config(cls, config):
+        """Create a policy from its stored configuration.
+
+        Args:
+            config (dict): Policy configuration with the attributes to set,
+                empty for a policy that never restarts.
+
+        Returns:
+            RestartPolicy: The configured policy.
+
+        Raises:
+            ValueError: If the configuration is invalid.
+        """
+        try:
+            return cls(**config)
+        except TypeError as e:
+            raise ValueError(f"Invalid restart policy: {e}") from e
+
+    def should_restart(self, exit_code, attempts):
+        """Decide whether an exited process is started again.
+
+        Args:
+            exit_code (int): Exit code of the process, None if it could not be spawned.
+            attempts (int): Consecutive restarts so far.
+
+        Returns:
+            bool: True if the path is restarted.
+        """
+        if attempts >= self.max_restarts:
+            return False
+        if self.mode == RESTART_ALWAYS:
+            return True
+        return self.mode == RESTART_ON_CRASH and exit_code != 0
+
+    def delay(self, attempts):
+        """Get the seconds to wait before a restart.
+
+        Args:
+            attempts (int): Consecutive restarts so far.
+
+        Returns:
+            float: Backoff before the next restart.
+        """
+        return min(self.max_backoff, self.backoff * 2 ** attempts)
+
+
+@dataclass(frozen=True)
+class ProcessState:
+    """Snapshot of a supervised path.
+
+    Attributes:
+        path (str): Supervised path.
+        pid (int): Process ID of the current or last process, None if the
+            last restart could not spawn it.
+        status (str): Supervision status, see src.constants.process.
+        uptime (float): Seconds the current process has been running, or
+            the last process ran.
+        restarts (int): Number of times the path was restarted.
+        exit_code (int): Exit code of the last process, None while running.
+    """
+
+    path: str
+    pid: Optional[int]
+    status: str
+    uptime: float
+    restarts: int
+    exit_code: Optional[int] = None
+
+
+class _Child:  # pylint: disable=too-few-public-methods
+    """Mutable supervision record of a path, only touched under the supervisor lock."""
+
+    def __init__(self, spec, process, policy, now):
+        self.spec = spec
+        self.policy = policy
+        self.process = process
+        self.pidfd = None
+        self.status = PROCESS_RUNNING
+        self.started = now
+        self.ended = None
+        self.restarts = 0
+        self.attempts = 0
+        self.exit_code = None
+
+    def state(self, now):
+        """Get a snapshot of the record."""
+        return ProcessState(
+            path=self.spec.path,
+            pid=None if self.process is None else self.process.pid,
+            status=self.status,
+            uptime=(now if self.ended is None else self.ended) - self.started,
+            restarts=self.restarts,
+            exit_code=self.exit_code
+        )
+
+
+class ProcessSupervisor:
+    """Reaps and restarts launched processes from a single background thread."""
+
+    def __init__(self, on_change=None, poll_interval=DEFAULT_POLL_INTERVAL_SECONDS,
+                 spawn=launcher.spawn):
+        """Initialize the supervisor, its thread starts with the first supervised process.
+
+        Args:
+            on_change (callable): Called with the ProcessState of a path
+                whenever its status changes. It runs on the supervisor thread,
+                so it must not touch Tk widgets.
+            poll_interval (float): Seconds between two polls of the processes
+                that cannot be watched with a pidfd.
+            spawn (callable): Called with a SpawnSpec to restart a path,
+                returns a LaunchResult.
+        """
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self._spawn = spawn
+        self._children = {}
+        self._polled = set()
+        self._timers = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._selector = None
+        self._wakeup = None
+        self._thread = None
+
+    def supervise(self, spec, process, policy=None):
+        """Watch a launched process, replacing the supervision of the same path.
+
+        Args:
+            spec (SpawnSpec): How the path is spawned again on restart.
+            process (subprocess.Popen): The launched process.
+            policy (RestartPolicy): When to restart the path, never if None.
+        """
+        with self._lock:
+            self._start()
+            old = self._children.get(spec.path)
+            if old is not None:
+                self._unwatch(old)
+            child = _Child(spec, process, policy or RestartPolicy(), time.monotonic())
+            self._children[spec.path] = child
+            self._watch(child)
+            state = child.state(time.monotonic())
+        self._wake()
+        self._notify([state])
+
+    def forget(self, path):
+        """Stop supervising a path, without stopping its process.
+
+        Args:
+            path (str): Supervised path.
+
+        Returns:
+            bool: True if the path was supervised.
+        """
+        with self._lock:
+            child = self._children.pop(path, None)
+            if child is None:
+                return False
+            self._unwatch(child)
+        return True
+
+    def state(self, path):
+        """Get the state of a supervised path.
+
+        Args:
+            path (str): Supervised path.
+
+        Returns:
+            ProcessState: Snapshot of the path, None if it is not supervised.
+        """
+        with self._lock:
+            child = self._children.get(path)
+            return None if child is None else child.state(time.monotonic())
+
+    def states(self):
+        """Get the state of every supervised path.
+
+        Returns:
+            dict: Mapping of path to its ProcessState.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {path: child.state(now) for path, child in self._children.items()}
+
+    def stop(self):
+        """Stop supervising every path and wait for the thread to end.
+
+        The supervised processes keep running.
+        """
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            for child in self._children.values():
+                self._unwatch(child)
+            self._children.clear()
+            self._polled.clear()
+            self._timers.clear()
+            selector, wakeup = self._selector, self._wakeup
+            self._thread = self._selector = self._wakeup = None
+        wakeup[1].send(b"\0")
+        thread.join()
+        selector.close()
+        for sock in wakeup:
+            sock.close()
+
+    def _start(self):
+        """Start the supervisor thread, if it is not running."""
+        if self._thread is not None:
+            return
+        self._selector = selectors.DefaultSelector()
+        self._wakeup = socket.socketpair()
+        for sock in self._wakeup:
+            sock.setblocking(False)
+        self._selector.register(self._wakeup[0], selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._run, name="process-supervisor", daemon=True)
+        self._thread.start()
+
+    def _wake(self):
+        """Interrupt the wait of the supervisor thread."""
+        try:
+            self._wakeup[1].send(b"\0")
+        except (BlockingIOError, OSError, TypeError):
+            pass  # Already woken, or stopped
+
+    def _watch(self, child):
+        """Watch the current process of a record, with a pidfd if possible."""
+        try:
+            child.pidfd = os.pidfd_open(child.process.pid)
+        except (AttributeError, OSError):
+            self._polled.add(child)
+            return
+        self._selector.register(child.pidfd, selectors.EVENT_READ, child)
+
+    def _unwatch(self, child):
+        """Stop watching the current process of a record."""
+        self._polled.discard(child)
+        if child.pidfd is not None:
+            self._selector.unregister(child.pidfd)
+            os.close(child.pidfd)
+            child.pidfd = None
+
+    def _run(self):
+        """Wait for exits, restarts and wake-ups until stopped."""
+        while True:
+            with self._lock:
+                if self._thread is not threading.current_thread():
+                    return
+                selector = self._selector
+                timeout = self._next_timeout(time.monotonic())
+            ready = selector.select(timeout)
+            changes = []
+            with self._lock:
+                if self._thread is not threading.current_thread():
+                    return
+                now = time.monotonic()
+                for key, _ in ready:
+                    if key.data is None:
+                        self._drain_wakeup()
+                    elif key.data.pidfd == key.fd and key.data.process.poll() is not None:
+                        changes.append(self._on_exit(key.data, now))
+                for child in list(self._polled):
+                    if child.process.poll() is not None:
+                        changes.append(self._on_exit(child, now))
+                while self._timers and self._timers[0][0] <= now:
+                    _, _, child = heapq.heappop(self._timers)
+                    if self._children.get(child.spec.path) is child:
+                        changes.append(self._restart(child, now))
+            self._notify(changes)
+
+    def _next_timeout(self, now):
+        """Get the seconds until the next poll or restart, None to wait for events only."""
+        timeout = self.poll_interval if self._polled else None
+        if self._timers:
+            due = max(0.0, self._timers[0][0] - now)
+            timeout = due if timeout is None else min(timeout, due)
+        return timeout
+
+    def _drain_wakeup(self):
+        """Read every pending wake-up byte."""
+        try:
+            while self._wakeup[0].recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _on_exit(self, child, now):
+        """Reap a process and schedule its restart if the policy asks for one.
+
+        Args:
+            child (_Child): Record of the exited process.
+            now (float): Current monotonic time.
+
+        Returns:
+            ProcessState: The new state of the path.
+        """
+        self._unwatch(child)
+        child.exit_code = child.process.returncode
+        child.ended = now
+        if now - child.started >= child.policy.reset_after:
+            child.attempts = 0
+        self._schedule(child, now)
+        logger.info("%s exited with code %s, %s", child.spec.path, child.exit_code, child.status)
+        return child.state(now)
+
+    def _schedule(self, child, now):
+        """Schedule a restart, or mark the path as exited or crashed if there is none."""
+        if child.policy.should_restart(child.exit_code, child.attempts):
+            child.status = PROCESS_RESTARTING
+            due = now + child.policy.delay(child.attempts)
+            heapq.heappush(self._timers, (due, next(self._sequence), child))
+        else:
+            child.status = PROCESS_EXITED if child.exit_code == 0 else PROCESS_CRASHED
+
+    def _restart(self, child, now):
+        """Spawn a path again.
+
+        Args:
+            child (_Child): Record of the path to restart.
+            now (float): Current monotonic time.
+
+        Returns:
+            ProcessState: The new state of the path.
+        """
+        child.attempts += 1
+        child.restarts += 1
+        result = self._spawn(child.spec)
+        if not result.succeeded:
+            logger.error("Error restarting %s: %s", child.spec.path, result.error)
+            child.process = None
+            child.exit_code = None
+            self._schedule(child, now)
+            return child.state(now)
+        child.process = result.process
+        child.status = PROCESS_RUNNING
+        child.started = now
+        child.ended = None
+        child.exit_code = None
+        self._watch(child)
+        logger.info("Restarted %s as PID %d", child.spec.path, result.pid)
+        return child.state(now)
+
+    def _notify(self, states):
+        """Report changed states to on_change."""
+        if self.on_change is None:
+            return
+        for state in states:
+            try:
+                self.on_change(state)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Error handling the state of %s", state.path)
@@ -0,0 +1,168 @@
+"""Persistent launch telemetry and timing reports.
+
+Every launch appends compact JSON lines to a local history file. Path records
+use short keys to keep the file small:
+
+    t: Unix timestamp of the launch.
+    p: ID of the launched profile.
+    a: Launched path.
+    s: Spawn latency in milliseconds, null if no process was spawned.
+    r: Milliseconds from spawn until readiness, null without probes.
+    x: Exit code if the process had already exited, null otherwise.
+    e: Error message, null if the path launched.
+
+Profile records carry ``"k": "profile"`` and the total launch duration in
+milliseconds under ``d``.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+
+DEFAULT_MAX_HISTORY_BYTES = 1024 * 1024
+GROUP_BY_PATH = "path"
+GROUP_BY_PROFILE = "profile"
+
+
+def percentile(values, pct):
+    """Calculate a percentile with the nearest-rank method.
+
+    Args:
+        values (list): Numbers to calculate the percentile of.
+        pct (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile, None if values is empty.
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _milliseconds(seconds):
+    """Convert seconds to milliseconds rounded to a tenth, keeping None."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class LaunchHistory:
+    """Append-only store of launch records with p50/p95 summaries."""
+
+    def __init__(self, file_path="data/launch_history.jsonl",
+                 max_bytes=DEFAULT_MAX_HISTORY_BYTES):
+        """Initialize the history store.
+
+        Args:
+            file_path (str): Path to the JSON lines history file.
+            max_bytes (int): Size after which the oldest half of the history is dropped.
+        """
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def record_launch(self, profile_id, results, duration):
+        """Append the records of a single profile launch.
+
+        Args:
+            profile_id: ID of the launched profile.
+            results (list): LaunchResult for every launched path.
+            duration (float): Seconds the whole launch took.
+        """
+        timestamp = round(time.time(), 3)
+        records = []
+        for result in results:
+            # Paths that were skipped or failed to spawn have no spawn latency
+            spawned = result.process is not None
+            records.append({
+                "t": timestamp,
+                "p": profile_id,
+                "a": result.path,
+                "s": _milliseconds(result.spawn_latency) if spawned else None,
+                "r": _milliseconds(result.ready_latency),
+                "x": result.process.poll() if spawned else None,
+                "e": result.error,
+            })
+        records.append({"k": GROUP_BY_PROFILE, "t": timestamp, "p": profile_id,
+                        "d": _milliseconds(duration)})
+        lines = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        with self._lock:
+            directory = os.path.dirname(self.file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.file_path, "a", encoding="utf-8") as history_file:
+                history_file.write(lines)
+            if os.path.getsize(self.file_path) > self.max_bytes:
+                self._drop_oldest_half()
+
+    def load_records(self):
+        """Read every record in the history file.
+
+        Lines that cannot be decoded, such as a line cut short by a crash,
+        are skipped.
+
+        Returns:
+            list: Record dictionaries, oldest first.
+        """
+        if not os.path.exists(self.file_path):
+            return []
+        records = []
+        with open(self.file_path, "r", encoding="utf-8") as history_file:
+            for line in history_file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return records
+
+    def summarize(self, group_by=GROUP_BY_PATH):
+        """Summarise launch times per path or per profile.
+
+        Args:
+            group_by (str): GROUP_BY_PATH or GROUP_BY_PROFILE.
+
+        Returns:
+            dict: Mapping of path or profile ID to a summary with the keys
+            count, failures, and p50/p95 of the timings in milliseconds
+            (spawn_p50, spawn_p95, ready_p50 and ready_p95 per path,
+            duration_p50 and duration_p95 per profile).
+
+        Raises:
+            ValueError: If group_by is not a known grouping.
+        """
+        if group_by not in (GROUP_BY_PATH, GROUP_BY_PROFILE):
+            raise ValueError(f"Unknown grouping: {group_by}")
+        timings = {}
+        for record in self.load_records():
+            is_profile_record = record.get("k") == GROUP_BY_PROFILE
+            if is_profile_record != (group_by == GROUP_BY_PROFILE):
+                continue
+            key = record.get("p") if is_profile_record else record.get("a")
+            group = timings.setdefault(key, {"count": 0, "failures": 0, "values": {}})
+            group["count"] += 1
+            if record.get("e"):
+                group["failures"] += 1
+            for name, short_key in (("spawn", "s"), ("ready", "r"), ("duration", "d")):
+                if record.get(short_key) is not None:
+                    group["values"].setdefault(name, []).append(record[short_key])
+
+        names = ("duration",) if group_by == GROUP_BY_PROFILE else ("spawn", "ready")
+        summary = {}
+        for key, group in timings.items():
+            summary[key] = {"count": group["count"], "failures": group["failures"]}
+            for name in names:
+                values = group["values"].get(name, [])
+                summary[key][f"{name}_p50"] = percentile(values, 50)
+                summary[key][f"{name}_p95"] = percentile(values, 95)
+        return summary
+
+    def _drop_oldest_half(self):
+        """Rewrite the history file keeping only its newest half."""
+        with open(self.file_path, "r", encoding="utf-8") as history_file:
+            lines = history_file.readlines()
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as history_file:
+            history_file.writelines(lines[len(lines) // 2:])
+        os.replace(temp_path, self.file_path)
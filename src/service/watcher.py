@@ -0,0 +1,220 @@
+"""Watcher for changes to the data files made outside the running process.
+
+StoreWatcher reports changes to a set of data files on a background
+thread. Each data file is watched through the files its storage engine
+writes, see the watched_paths method of the engines in
+src.service.storage, such as the version and journal sidecars of a JSON
+store or the database and write-ahead log of a SQLite store. On Linux it
+waits on inotify events of their directories; elsewhere, or if inotify is
+not available, it polls the files with stat. Bursts of events, such as the
+temp file write and rename of an atomic save, are debounced into a single
+notification.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+DEFAULT_DEBOUNCE_SECONDS = 0.2
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+
+# Flags of inotify(7)
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+logger = logging.getLogger("ProfileService")
+
+
+class _InotifyBackend:
+    """Waits for inotify events on the directories of the watched files."""
+
+    def __init__(self, directories):
+        """Create an inotify instance watching the given directories.
+
+        Args:
+            directories (set): Directories to watch.
+
+        Raises:
+            OSError: If inotify is not available.
+        """
+        library = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(library, use_errno=True)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories = {}
+        # SQLite keeps its write-ahead log open, so its commits are only seen as writes
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+        for directory in directories:
+            watch = libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+            if watch < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"Cannot watch {directory}")
+            self.directories[watch] = directory
+
+    def wait(self, timeout):
+        """Wait for events.
+
+        Args:
+            timeout (float): Seconds to wait at most.
+
+        Returns:
+            set: Paths of the files that changed.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(buffer):
+            watch, _, _, length = _INOTIFY_EVENT.unpack_from(buffer, offset)
+            offset += _INOTIFY_EVENT.size
+            name = buffer[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if watch in self.directories and name:
+                changed.add(os.path.join(self.directories[watch], os.fsdecode(name)))
+        return changed
+
+    def close(self):
+        """Close the inotify instance."""
+        os.close(self.fd)
+
+
+class _PollingBackend:
+    """Polls the watched files with stat."""
+
+    def __init__(self, paths, interval):
+        """Take the initial state of the watched files.
+
+        Args:
+            paths (set): Files to poll.
+            interval (float): Seconds between two polls.
+        """
+        self.interval = interval
+        self.stamps = {path: self._stat(path) for path in paths}
+
+    def wait(self, timeout):
+        """Sleep until the next poll and compare the files.
+
+        Args:
+            timeout (float): Seconds to wait at most.
+
+        Returns:
+            set: Paths of the files that changed.
+        """
+        time.sleep(min(timeout, self.interval))
+        changed = set()
+        for path, stamp in self.stamps.items():
+            current = self._stat(path)
+            if current != stamp:
+                self.stamps[path] = current
+                changed.add(path)
+        return changed
+
+    def close(self):
+        """Nothing to release."""
+
+    @staticmethod
+    def _stat(path):
+        """Get the stat result of a file that identifies its content."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class StoreWatcher:
+    """Calls back with the data files that changed, debounced, from a background thread."""
+
+    def __init__(self, watched_paths, on_change, debounce=DEFAULT_DEBOUNCE_SECONDS,
+                 poll_interval=DEFAULT_POLL_INTERVAL_SECONDS):
+        """Initialize the watcher.
+
+        Args:
+            watched_paths (dict): Files to watch by data file, as returned by
+                the watched_paths method of the data file's storage engine.
+                Several data files can share files, such as the database
+                of the SQLite storage mode.
+            on_change (callable): Called with the set of changed data files. It
+                runs on the watcher thread, so it must not touch Tk widgets.
+            debounce (float): Seconds without events before on_change is called.
+            poll_interval (float): Seconds between two polls without inotify.
+        """
+        self.on_change = on_change
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._watched = {}
+        for file_path, paths in watched_paths.items():
+            for path in paths:
+                self._watched.setdefault(os.path.abspath(path), set()).add(
+                    os.path.abspath(file_path))
+        self._stop = threading.Event()
+        self._thread = None
+        self._backend = None
+
+    def start(self):
+        """Start watching on a daemon thread."""
+        self._backend = self._create_backend()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="store-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching and wait for the thread to end."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+
+    def _create_backend(self):
+        """Use inotify where available and fall back to polling."""
+        directories = {os.path.dirname(path) for path in self._watched}
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
+        if sys.platform.startswith("linux"):
+            try:
+                return _InotifyBackend(directories)
+            except (OSError, AttributeError) as e:
+                logger.warning("inotify unavailable, polling data files: %s", e)
+        return _PollingBackend(set(self._watched), self.poll_interval)
+
+    def _run(self):
+        """Collect changes and report them once no event came for the debounce time."""
+        pending = set()
+        deadline = None
+        while not self._stop.is_set():
+            timeout = self.poll_interval if deadline is None else max(
+                0.0, deadline - time.monotonic())
+            changed = set()
+            for path in self._backend.wait(timeout):
+                changed |= self._watched.get(path, set())
+            if changed:
+                pending |= changed
+                deadline = time.monotonic() + self.debounce
+            elif pending and time.monotonic() >= deadline:
+                try:
+                    self.on_change(pending)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception("Error handling changed data files")
+                pending = set()
+                deadline = None
@@ -0,0 +1,118 @@
+"""Cache of decoded, resized image assets for the GUI.
+
+Decoding the .ico resources with PIL and rescaling them is one of the more
+expensive steps of start-up. AssetCache stores every resized variant as raw
+RGBA pixels, so later starts only read the bytes back. A cached variant is
+rebuilt when the modification time of its source changes.
+"""
+
+import os
+import struct
+from PIL import Image
+
+RESOURCE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "resource"
+)
+DEFAULT_CACHE_DIR = os.path.join("data", "cache", "assets")
+
+# Magic, source modification time in ns, width, height
+_HEADER = struct.Struct(">4sqII")
+_MAGIC = b"WVA1"
+
+
+def resource_path(name):
+    """Resolve the path of a file in the resource directory.
+
+    Args:
+        name (str): File name inside the resource directory.
+
+    Returns:
+        str: Absolute path to the resource.
+    """
+    return os.path.join(RESOURCE_DIR, name)
+
+
+class AssetCache:  # pylint: disable=too-few-public-methods
+    """Loads resource images at a given size, decoding each variant only once."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        """Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory where decoded variants are stored.
+        """
+        self.cache_dir = cache_dir
+        self._images = {}
+
+    def load_image(self, name, size):
+        """Load a resource image resized to the given size.
+
+        Args:
+            name (str): File name inside the resource directory.
+            size (tuple): Width and height of the image.
+
+        Returns:
+            PIL.Image.Image: RGBA image of the requested size.
+        """
+        source = resource_path(name)
+        source_mtime = os.stat(source).st_mtime_ns
+        key = (name, tuple(size))
+        cached = self._images.get(key)
+        if cached is not None and cached[0] == source_mtime:
+            return cached[1]
+
+        cache_file = self._cache_file(name, size)
+        image = self._read_cached(cache_file, source_mtime, size)
+        if image is None:
+            image = self._decode(source, size)
+            self._write_cached(cache_file, source_mtime, image)
+        self._images[key] = (source_mtime, image)
+        return image
+
+    def _cache_file(self, name, size):
+        """Get the cache file of a resized variant."""
+        stem, _ = os.path.splitext(name)
+        return os.path.join(self.cache_dir, f"{stem}_{size[0]}x{size[1]}.rgba")
+
+    @staticmethod
+    def _read_cached(cache_file, source_mtime, size):
+        """Read a cached variant, None if it is missing or out of date."""
+        try:
+            with open(cache_file, "rb") as cached:
+                header = cached.read(_HEADER.size)
+                pixels = cached.read()
+        except OSError:
+            return None
+        if len(header) != _HEADER.size:
+            return None
+        magic, mtime, width, height = _HEADER.unpack(header)
+        if (magic, mtime, (width, height)) != (_MAGIC, source_mtime, tuple(size)):
+            return None
+        if len(pixels) != width * height * 4:
+            return None
+        return Image.frombuffer("RGBA", (width, height), pixels, "raw", "RGBA", 0, 1)
+
+    @staticmethod
+    def _decode(source, size):
+        """Decode a source image and resize it, using the closest icon frame."""
+        with Image.open(source) as image:
+            frames = image.info.get("sizes")
+            if frames:
+                large_enough = [frame for frame in frames
+                                if frame[0] >= size[0] and frame[1] >= size[1]]
+                if large_enough:
+                    image.size = min(large_enough)
+            return image.convert("RGBA").resize(tuple(size), Image.Resampling.LANCZOS)
+
+    def _write_cached(self, cache_file, source_mtime, image):
+        """Store a decoded variant, ignoring failures to write the cache."""
+        temp_file = f"{cache_file}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_file, "wb") as cached:
+                cached.write(_HEADER.pack(_MAGIC, source_mtime, *image.size))
+                cached.write(image.tobytes())
+            os.replace(temp_file, cache_file)
+        except OSError:
+            pass  # The cache only speeds up the next start
@@ -2,35 +2,45 @@
 
 This module provides the main graphical user interface for managing and launching
 workspace profiles. It uses customtkinter for a modern look and feel.
+
+uuid, which is only needed to create profiles, is imported where it is
+used to keep start-up fast. Logging is configured by the entry point, not
+by importing this module.
 """
 
 import tkinter as tk
-from tkinter import filedialog as fd
-import uuid
+from tkinter import filedialog
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
 import logging
-import os
-from PIL import Image
 import customtkinter
 from src.service.settings_service import SettingsService
 from src.service.profile_service import ProfileService
+from src.service.launcher import DEFAULT_LAUNCH_WORKERS, DEFAULT_SKIP_RUNNING
+from src.service.events import (PathAdded, PathRemoved, ProfileCreated, ProfileRemoved,
+                                ProfileRenamed)
+from src.service.watcher import StoreWatcher
+from src.view.assets import AssetCache, resource_path
+from src.view.path_list import PathList
+from src.view.profile_picker import ProfilePicker
+from src.constants.launch import LAUNCH_FAILED
+from src.constants.process import PROCESS_CRASHED, PROCESS_EXITED, PROCESS_RUNNING
 
 WINDOW_HEIGHT = 550
 WINDOW_WIDTH = 900
 DEFAULT_APPEARANCE = "Dark"
 DEFAULT_PROFILE = "No Profiles"
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] [%(name)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+LAUNCH_POLL_INTERVAL_MS = 50
+STORE_POLL_INTERVAL_MS = 250
+HEALTH_CHECK_INTERVAL_MS = 30000
+PROCESS_POLL_INTERVAL_MS = 1000
 
 logger = logging.getLogger("UserInterface")
 
-BASE_PATH = r'C:\Code\Coding\Hobby Projects\Workspace-Viewer\resource'
-icon_path = os.path.join(BASE_PATH, 'icon.ico')
-logo_path = os.path.join(BASE_PATH, 'logo.ico')
-logo_light_path = os.path.join(BASE_PATH, 'logo_light.ico')
+ICON_NAME = 'icon.ico'
+LOGO_NAMES = {"Dark": 'logo.ico', "Light": 'logo_light.ico'}
+LOGO_SIZE = (100, 100)
 
 
 class UserInterface(customtkinter.CTk):
@@ -43,52 +53,90 @@ class UserInterface(customtkinter.CTk):
     def __init__(self):
         """Initialize the main application window and its components."""
         super().__init__()
-        window_geometry = self._get_window_geometry()
 
         self.profiles = ProfileService()
         self.settings = SettingsService()
+        self.asset_cache = AssetCache()
         self.current_profile_id = None
         self.dialog = None
-        self.profile_menu = None
-        self.application_list = []
+        self.profile_picker = None
+
+        # Built after the first paint by _setup_application_area
+        self.launch_profile_button = None
+        self.cancel_launch_button = None
+        self.choose_application_button = None
+        self.path_list = None
+
+        # Launching runs off the Tk thread and reports back through a queue
+        self.launch_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="profile-launch"
+        )
+        self.launch_events = queue.Queue()
+        self.launch_cancel_event = None
+
+        # Path health is checked off the Tk thread too, changes come back through a queue
+        self.health_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="path-health-check"
+        )
+        self.health_events = queue.Queue()
+        self.health_check = None
+
+        # Profile changes arrive as events, which are applied on the Tk thread
+        self.profile_events = queue.Queue()
+        self.profiles.subscribe(self.profile_events.put)
+        self.profile_event_handlers = {
+            ProfileCreated: self._on_profile_created,
+            ProfileRenamed: self._on_profile_renamed,
+            ProfileRemoved: self._on_profile_removed,
+            PathAdded: self._on_path_added,
+            PathRemoved: self._on_path_removed,
+        }
+
+        # Edits of the data files by other processes are applied as they happen
+        self.profiles.track_external_changes()
+        self.store_events = queue.Queue()
+        self.store_watcher = StoreWatcher(
+            {
+                self.profiles.get_data_file_path(): self.profiles.get_watched_paths(),
+                self.settings.get_data_file_path(): self.settings.get_watched_paths(),
+            },
+            self.store_events.put
+        )
 
         # Settings initialization
         self.current_appearance = self.settings.get_user_app_appearance()
         if self.current_appearance is None:
             self.current_appearance = DEFAULT_APPEARANCE
-        self.geometry(window_geometry)
+        self.geometry(self.settings.get_window_geometry() or self._get_window_geometry())
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self._set_current_profile(self.settings.get_current_user_profile())
 
-        # Profiles initialization
-        self.profile_name_list = self.profiles.get_all_profile_names()
-        if len(self.profile_name_list) == 0:
-            self.profile_name_list.append(DEFAULT_PROFILE)
-
-        self.profile_name_id_mapping = {}
-        for profile_id, profile_data in list(self.profiles.get_all_profiles().items()):
-            self.profile_name_id_mapping[profile_data["name"]] = profile_id
-
         self.title("Application Launcher")
-        self.wm_iconbitmap(icon_path)
+        self.wm_iconbitmap(resource_path(ICON_NAME))
         self.grid_columnconfigure((1, 2), weight=1)
         self.grid_rowconfigure(1, weight=1)
 
         self._setup_ui()
 
     def _setup_ui(self):
-        """Set up the user interface components."""
+        """Set up the sidebar and defer the rest of the window to idle callbacks.
+
+        Only the sidebar is built before the first frame is painted. The
+        launch controls and the application list are built by
+        _setup_application_area once Tk is idle.
+        """
         # Create sidebar
         self.sidebar = customtkinter.CTkFrame(self, width=140, corner_radius=0)
         self.sidebar.grid(row=0, column=0, rowspan=4, sticky="nsew")
         self.sidebar.grid_rowconfigure(3, weight=1)
 
         # Profile Select
-        self.logo_image = customtkinter.CTkImage(
-            light_image=Image.open(logo_light_path),
-            dark_image=Image.open(logo_path),
-            size=(100, 100)
-        )
+        customtkinter.set_appearance_mode(self.current_appearance)
+        self.logo_image = None
+        self._load_logo_for_appearance()
 
         self.title_label = customtkinter.CTkLabel(
             self.sidebar,
@@ -131,7 +179,7 @@ class UserInterface(customtkinter.CTk):
             pady=(100, 30)
         )
 
-        self._refresh_profile_list()
+        self._setup_profile_picker()
         # GUI Theme
         self.appearance_mode_label = customtkinter.CTkLabel(
             self.sidebar,
@@ -160,8 +208,10 @@ class UserInterface(customtkinter.CTk):
         )
         # Set following based on saved data
         self.appearance_mode_option_menu.set(self.current_appearance)
-        customtkinter.set_appearance_mode(self.current_appearance)
+        self.after_idle(self._setup_application_area)
 
+    def _setup_application_area(self):
+        """Build the launch controls and the application list after the first paint."""
         self.launch_profile_button = customtkinter.CTkButton(
             self,
             text="Launch Profile",
@@ -175,6 +225,13 @@ class UserInterface(customtkinter.CTk):
             pady=20
         )
 
+        self.cancel_launch_button = customtkinter.CTkButton(
+            self,
+            text="Cancel Launch",
+            command=self._cancel_launch,
+            fg_color="#D8524B"
+        )
+
         self.choose_application_button = customtkinter.CTkButton(
             self,
             text="Choose Application",
@@ -188,12 +245,13 @@ class UserInterface(customtkinter.CTk):
             pady=20
         )
 
-        self.application_list_frame = customtkinter.CTkScrollableFrame(
+        self.path_list = PathList(
             self,
+            delete_callback=self.delete_path,
             label_text="Applications to Launch"
         )
 
-        self.application_list_frame.grid(
+        self.path_list.grid(
             row=1,
             column=1,
             columnspan=2,
@@ -201,26 +259,174 @@ class UserInterface(customtkinter.CTk):
             pady=20,
             sticky="nsew"
         )
+        self.after_idle(self._refresh_path_list)
+        self.store_watcher.start()
+        self.after(STORE_POLL_INTERVAL_MS, self._poll_store_events)
+        self.after_idle(self._check_path_health)
+        self.after(STORE_POLL_INTERVAL_MS, self._poll_health_events)
+        self.after(PROCESS_POLL_INTERVAL_MS, self._poll_process_states)
+
+    def _poll_store_events(self):
+        """Apply changes of the data files made outside this process, then reschedule.
+
+        Profile events published off the Tk thread, such as changes loaded
+        while a launch reads the profiles, are applied here too.
+        """
+        changed = False
+        while True:
+            try:
+                self.store_events.get_nowait()
+            except queue.Empty:
+                break
+            changed = True
+        if changed:
+            self._sync_from_disk()
+        self._apply_profile_events()
+        self.after(STORE_POLL_INTERVAL_MS, self._poll_store_events)
+
+    def _check_path_health(self):
+        """Check every profile path in the background and schedule the next check.
+
+        Only paths that changed on disk since the last check are assessed again.
+        """
+        if self.health_check is None or self.health_check.done():
+            self.health_check = self.health_executor.submit(
+                self.profiles.check_path_health,
+                on_result=self._post_health
+            )
+        self.after(HEALTH_CHECK_INTERVAL_MS, self._check_path_health)
+
+    def _post_health(self, path, health):
+        """Queue a changed path health for the Tk thread.
+
+        Args:
+            path (str): Path that was checked.
+            health (str): Its new health.
+        """
+        self.health_events.put((path, health))
+
+    def _poll_health_events(self):
+        """Show the queued path health changes, then reschedule."""
+        while True:
+            try:
+                path, health = self.health_events.get_nowait()
+            except queue.Empty:
+                break
+            self.path_list.set_health(path, health)
+        self.after(STORE_POLL_INTERVAL_MS, self._poll_health_events)
+
+    def _poll_process_states(self):
+        """Show the state of the supervised processes, then reschedule.
+
+        The launch status is shown instead while a launch is in progress.
+        """
+        if self.launch_cancel_event is None:
+            for path, state in self.profiles.get_process_states().items():
+                self.path_list.set_status(path, _describe_process(state))
+        self.after(PROCESS_POLL_INTERVAL_MS, self._poll_process_states)
+
+    def _sync_from_disk(self):
+        """Reload changed data files; profile changes are queued as events."""
+        try:
+            self.profiles.sync_from_disk()
+            settings_changed = self.settings.sync_from_disk()
+        except ValueError as e:
+            logger.warning("Ignoring data file that is not valid JSON: %s", e)
+            return
+        if settings_changed:
+            appearance = self.settings.get_user_app_appearance()
+            if appearance and appearance != self.appearance_mode_option_menu.get():
+                customtkinter.set_appearance_mode(appearance)
+                self.appearance_mode_option_menu.set(appearance)
+                self._load_logo_for_appearance()
+
+    def _apply_profile_events(self):
+        """Patch the widgets affected by the queued profile events."""
+        while True:
+            try:
+                event = self.profile_events.get_nowait()
+            except queue.Empty:
+                return
+            self.profile_event_handlers[type(event)](event)
+
+    def _on_profile_created(self, event):
+        """Select a new profile if no profile was selected.
+
+        Args:
+            event (ProfileCreated): The event.
+        """
+        self.profile_picker.refresh()
+        if not self.current_profile_id:
+            self._set_current_profile(event.profile_id)
+            self.profile_picker.set(event.name)
+
+    def _on_profile_renamed(self, event):
+        """Show the new name of a renamed profile.
+
+        Args:
+            event (ProfileRenamed): The event.
+        """
+        self.profile_picker.refresh()
+        if event.profile_id == self.current_profile_id:
+            self.profile_picker.set(event.new_name)
+
+    def _on_profile_removed(self, event):
+        """Switch to another profile if the shown profile was removed.
+
+        Args:
+            event (ProfileRemoved): The event.
+        """
+        self.profile_picker.refresh()
+        if event.profile_id != self.current_profile_id:
+            return
+        self._set_current_profile(event.profile_id)
+        if self.current_profile_id:
+            self.profile_picker.set(self.profiles.get_profile_by_id(self.current_profile_id))
+        else:
+            self.profile_picker.set("")
         self._refresh_path_list()
 
+    def _on_path_added(self, event):
+        """Add the row of a new path of the current profile.
+
+        Args:
+            event (PathAdded): The event.
+        """
+        if event.profile_id == self.current_profile_id and self.path_list is not None:
+            self._add_to_application_list(event.path)
+        self.health_executor.submit(
+            self.profiles.check_path_health,
+            [event.path],
+            on_result=self._post_health
+        )
+
+    def _on_path_removed(self, event):
+        """Remove the row of a path removed from the current profile.
+
+        Args:
+            event (PathRemoved): The event.
+        """
+        if event.profile_id == self.current_profile_id and self.path_list is not None:
+            self.path_list.remove(event.path)
+
     def _select_profile(self, new_profile: str):
         """Select and update the current profile.
 
         Args:
             new_profile (str): Name of the profile to select.
         """
-        try:
-            new_profile_id = self.profile_name_id_mapping[new_profile]
-            if new_profile_id == self.current_profile_id:
-                logger.info("No need for update, same profile selected")
-                return
-            logger.info("Updating profile")
-            self.current_profile_id = new_profile_id
-            self.settings.update_current_user_profile(self.current_profile_id)
-            self._refresh_path_list()
-            logger.info("Successfully updated profile")
-        except KeyError as e:
-            logger.error("Profile not found in mapping: %s", e)
+        new_profile_id = self.profiles.get_profile_id_by_name(new_profile)
+        if new_profile_id is None:
+            logger.error("Profile not found: %s", new_profile)
+            return
+        if new_profile_id == self.current_profile_id:
+            logger.info("No need for update, same profile selected")
+            return
+        logger.info("Updating profile")
+        self.current_profile_id = new_profile_id
+        self.settings.update_current_user_profile(self.current_profile_id)
+        self._refresh_path_list()
+        logger.info("Successfully updated profile")
 
     def _change_appearance_mode_event(self, new_appearance_mode: str):
         """Handle appearance mode change event.
@@ -229,17 +435,107 @@ class UserInterface(customtkinter.CTk):
             new_appearance_mode (str): New appearance mode to set.
         """
         customtkinter.set_appearance_mode(new_appearance_mode)
+        self._load_logo_for_appearance()
         self.settings.update_user_app_appearance(new_appearance_mode)
 
+    def _load_logo_for_appearance(self):
+        """Load the logo variant of the active appearance mode if it isn't loaded yet.
+
+        Only the variant that is shown gets decoded; CTkImage falls back to it
+        for the other mode until that mode is selected.
+        """
+        mode = customtkinter.get_appearance_mode()
+        image = self.asset_cache.load_image(LOGO_NAMES[mode], LOGO_SIZE)
+        image_option = "dark_image" if mode == "Dark" else "light_image"
+        if self.logo_image is None:
+            self.logo_image = customtkinter.CTkImage(size=LOGO_SIZE, **{image_option: image})
+        elif self.logo_image.cget(image_option) is not image:
+            self.logo_image.configure(**{image_option: image})
+
     def _launch_profile(self):
-        """Launch all applications in the current profile."""
+        """Launch all applications in the current profile on a background thread."""
+        if self.launch_cancel_event is not None:
+            logger.warning("A launch is already in progress")
+            return
         try:
             profile_name = self.profiles.get_profile_by_id(self.current_profile_id)
-            logger.info("Launching profile %s", profile_name)
-            self.profiles.launch_all_paths_in_profile(self.application_list)
-            logger.info("Successfully launched profile")
-        except (KeyError, FileNotFoundError) as e:
+        except KeyError as e:
             logger.error("Error launching profile: %s", e)
+            return
+        logger.info("Launching profile %s", profile_name)
+        launch_workers = self.settings.get_launch_workers() or DEFAULT_LAUNCH_WORKERS
+        skip_running = self.settings.get_skip_running()
+        self.launch_cancel_event = threading.Event()
+        self.launch_executor.submit(
+            self._run_launch,
+            self.current_profile_id,
+            launch_workers,
+            self.launch_cancel_event,
+            DEFAULT_SKIP_RUNNING if skip_running is None else skip_running
+        )
+        self.launch_profile_button.grid_remove()
+        self.cancel_launch_button.grid(row=0, column=1, padx=20, pady=20)
+        self.after(LAUNCH_POLL_INTERVAL_MS, self._poll_launch_events)
+
+    def _run_launch(self, profile_id, launch_workers, cancel_event, skip_running):
+        """Launch a profile and post progress to the launch event queue.
+
+        Runs on the launch executor, so it must never touch Tk widgets.
+
+        Args:
+            profile_id: ID of the profile to launch.
+            launch_workers (int): Maximum number of concurrent spawns.
+            cancel_event (threading.Event): Event that cancels pending paths.
+            skip_running (bool): Don't spawn paths that are already running.
+        """
+        try:
+            results = self.profiles.launch_profile(
+                profile_id,
+                max_workers=launch_workers,
+                on_status=lambda path, status: self.launch_events.put(("status", path, status)),
+                cancel_event=cancel_event,
+                supervise=True,
+                skip_running=skip_running
+            )
+        except (KeyError, OSError, ValueError) as e:
+            logger.error("Error launching profile: %s", e)
+            results = []
+        self.launch_events.put(("done", results, None))
+
+    def _poll_launch_events(self):
+        """Apply queued launch events to the UI and reschedule until the launch ends."""
+        while True:
+            try:
+                kind, subject, status = self.launch_events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "status":
+                self.path_list.set_status(subject, status)
+            else:
+                self._finish_launch(subject)
+                return
+        self.after(LAUNCH_POLL_INTERVAL_MS, self._poll_launch_events)
+
+    def _finish_launch(self, results):
+        """Restore the launch controls and log the launch outcome.
+
+        Args:
+            results (list): LaunchResult for every launched path.
+        """
+        failed = [result for result in results if result.status == LAUNCH_FAILED]
+        for result in failed:
+            logger.error("Failed to launch %s: %s", result.path, result.error)
+        launched = sum(1 for result in results if result.succeeded)
+        logger.info("Launched %d of %d paths", launched, len(results))
+        self.launch_cancel_event = None
+        self.cancel_launch_button.grid_remove()
+        self.launch_profile_button.grid()
+
+    def _cancel_launch(self):
+        """Cancel the paths of the running launch that have not been spawned yet."""
+        if self.launch_cancel_event is not None:
+            logger.info("Cancelling launch")
+            self.launch_cancel_event.set()
 
     def _create_profile(self):
         """Create a new profile with user input."""
@@ -252,39 +548,38 @@ class UserInterface(customtkinter.CTk):
             )
             if profile_name is None:
                 return  # Input cancelled
-            if DEFAULT_PROFILE in self.profile_name_list:
-                self.profile_name_list.remove(DEFAULT_PROFILE)
-            self.profile_name_list.append(profile_name)
+            import uuid  # pylint: disable=import-outside-toplevel
             uid = str(uuid.uuid4())
             self.profiles.create_profile(uid, profile_name)
-            self.profile_name_id_mapping[profile_name] = uid
-            self._set_current_profile(uid)
-            self._refresh_profile_list()
-            self._refresh_path_list()
+            self._apply_profile_events()
+            if uid != self.current_profile_id:
+                self._set_current_profile(uid)
+                self.profile_picker.set(profile_name)
+                self._refresh_path_list()
             logger.info("Successfully created profile")
         except (ValueError, KeyError) as e:
             logger.error("Error creating profile: %s", e)
 
-    def _refresh_profile_list(self):
-        """Update the profile selection dropdown menu."""
-        self.profile_menu = customtkinter.CTkOptionMenu(
+    def _setup_profile_picker(self):
+        """Create the searchable profile picker."""
+        self.profile_picker = ProfilePicker(
             self.sidebar,
-            dynamic_resizing=False,
-            values=self.profile_name_list,
-            command=self._select_profile
+            search=self.profiles.search_profile_names,
+            command=self._select_profile,
+            placeholder_text=DEFAULT_PROFILE
         )
-        self.profile_menu.grid(row=2, column=0, padx=20, pady=(150, 10))
+        self.profile_picker.grid(row=2, column=0, padx=20, pady=(150, 10))
         if self.current_profile_id:
-            self.profile_menu.set(self.profiles.get_profile_by_id(self.current_profile_id))
+            self.profile_picker.set(self.profiles.get_profile_by_id(self.current_profile_id))
 
     def _refresh_path_list(self):
         """Update the list of applications in the current profile."""
-        for child in self.application_list_frame.winfo_children():
-            child.destroy()
-        self.application_list = []
+        if self.path_list is None:
+            return  # Filled in once the application area is built
         if self.current_profile_id:
-            for path in self.profiles.get_paths_for_profile(self.current_profile_id):
-                self._add_to_application_list(path)
+            self.path_list.set_paths(self.profiles.get_paths_for_profile(self.current_profile_id))
+        else:
+            self.path_list.set_paths([])
 
     def _set_current_profile(self, current_profile):
         """Set the current active profile.
@@ -304,19 +599,26 @@ class UserInterface(customtkinter.CTk):
             self.settings.update_current_user_profile(first_key)
 
     def _open_file_dialog(self):
-        """Open file dialog to select an application to add to the profile."""
+        """Open file dialog to select applications to add to the profile."""
         filetypes = [
             ("executable files", ".exe"),
             ("All Files", ".*")
         ]
-        added_file = fd.askopenfilename(filetypes=filetypes)
-        logger.info("Adding file to list")
-        if self._add_to_application_list(added_file):
-            logger.info("Successfully added file to list")
-            self.profiles.add_path_to_profile(self.current_profile_id, added_file)
+        added_files = filedialog.askopenfilenames(filetypes=filetypes)
+        if not added_files:
+            logger.warning("Selection canceled")
+            return
+        logger.info("Adding %d files to list", len(added_files))
+        new_files = [added_file for added_file in added_files
+                     if not self.profiles.has_path(self.current_profile_id, added_file)]
+        if len(new_files) < len(added_files):
+            logger.warning("%d files already in list", len(added_files) - len(new_files))
+        if new_files and self.profiles.add_paths_to_profile(self.current_profile_id, new_files):
+            self._apply_profile_events()
+            logger.info("Successfully added %d files to list", len(new_files))
 
     def _add_to_application_list(self, added_file):
-        """Add a file to the application list and create its UI element.
+        """Add a file to the application list, shown once its row scrolls into view.
 
         Args:
             added_file (str): Path to the file to add.
@@ -325,25 +627,12 @@ class UserInterface(customtkinter.CTk):
             bool: True if file was added successfully, False otherwise.
         """
         try:
-            if added_file in self.application_list:
-                logger.warning("File already in list")
-                return False
             if added_file == "":
                 logger.warning("Selection canceled")
                 return False
-            self.application_list.append(added_file)
-            label = PathRow(
-                executable_path=added_file,
-                delete_callback=self.delete_path,
-                master=self.application_list_frame
-            )
-            label.grid(
-                row=len(self.application_list) - 1,
-                column=0,
-                padx=10,
-                pady=(0, 10),
-                sticky="news"
-            )
+            if not self.path_list.append(added_file):
+                logger.warning("File already in list")
+                return False
         except (ValueError, tk.TclError) as e:
             logger.error("Error adding application to list: %s", e)
             return False
@@ -356,7 +645,7 @@ class UserInterface(customtkinter.CTk):
             path (str): Path to remove from the profile.
         """
         self.profiles.remove_path_from_profile(self.current_profile_id, path)
-        self._refresh_path_list()
+        self._apply_profile_events()
 
     def _edit_profile(self):
         """Edit the name of the current profile."""
@@ -369,42 +658,34 @@ class UserInterface(customtkinter.CTk):
             )
             if new_name is None:
                 return
-            self._replace_value_in_profile_list(self.current_profile_id, new_name)
             self.profiles.change_profile_name(self.current_profile_id, new_name)
-            self.profile_name_list = self.profiles.get_all_profile_names()
-            self._refresh_profile_list()
+            self._apply_profile_events()
             logger.info("Successfully edited profile")
         except (KeyError, ValueError) as e:
             logger.error("Error editing profile: %s", e)
 
-    def _replace_value_in_profile_list(self, old_value, new_value):
-        """Replace a value in the profile name list.
-
-        Args:
-            old_value: Value to replace.
-            new_value: New value to insert.
-        """
-        for i, value in enumerate(self.profile_name_list):
-            if value == old_value:
-                self.profile_name_list[i] = new_value
-
-    @staticmethod
-    def _get_window_geometry():
+    def _get_window_geometry(self):
         """Calculate window geometry for centering on screen.
 
         Returns:
             str: Window geometry string in format 'WIDTHxHEIGHT+X+Y'.
         """
-        root = tk.Tk()
-        screen_width = root.winfo_screenwidth()
-        screen_height = root.winfo_screenheight()
-        root.destroy()
-
-        window_x = (screen_width - WINDOW_WIDTH) // 2
-        window_y = (screen_height - WINDOW_HEIGHT) // 2
+        window_x = (self.winfo_screenwidth() - WINDOW_WIDTH) // 2
+        window_y = (self.winfo_screenheight() - WINDOW_HEIGHT) // 2
 
         return f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{window_x}+{window_y}"
 
+    def _on_close(self):
+        """Remember the window geometry and close the window."""
+        self.settings.update_window_geometry(self.geometry())
+        self.store_watcher.stop()
+        if self.launch_cancel_event is not None:
+            self.launch_cancel_event.set()
+        self.launch_executor.shutdown(wait=False)
+        self.health_executor.shutdown(wait=False, cancel_futures=True)
+        self.profiles.stop_supervising()
+        self.destroy()
+
     def _popup_input(self, prompt, title, validation_func):
         """Handle popup input dialog with workaround for customtkinter issue.
         
@@ -472,7 +753,7 @@ class UserInterface(customtkinter.CTk):
         Returns:
             str: Error message if invalid, None if valid.
         """
-        if profile_name in self.profile_name_list:
+        if self.profiles.profile_name_exists(profile_name):
             return "Profile name in use, enter a new one"
         if profile_name == "":
             return "Profile names cannot be empty"
@@ -480,33 +761,22 @@ class UserInterface(customtkinter.CTk):
         return None
 
 
-class PathRow(customtkinter.CTkFrame):
-    """UI component for displaying a path in the application list."""
+def _describe_process(state):
+    """Describe the state of a supervised process for the status column.
 
-    def __init__(self, executable_path: str, delete_callback, master: any, **kwargs):
-        """Initialize a path row.
-
-        Args:
-            executable_path (str): Path to the executable.
-            delete_callback (callable): Function to call when delete button is pressed.
-            master: Parent widget.
-            **kwargs: Additional arguments to pass to CTkFrame.
-        """
-        super().__init__(master, **kwargs)
+    Args:
+        state (ProcessState): State of the process.
 
-        split_path = executable_path.split('/')
-        display_path = f"{split_path[0]}/.../{split_path[-1]}"
-
-        delete_button = customtkinter.CTkButton(
-            self,
-            text="Delete",
-            command=lambda: delete_callback(executable_path),
-            fg_color="#D8524B",
-            width=75
-        )
-        delete_button.grid(row=0, column=0)
-
-        text_label = customtkinter.CTkLabel(self, text=display_path, anchor="w")
-        text_label.grid(row=0, column=1, padx=15, sticky="news")
-
-        self.grid_columnconfigure(1, weight=2)
+    Returns:
+        str: Status, uptime, PID and restart count of a running process,
+        status and exit code otherwise.
+    """
+    restarts = f", {state.restarts} restarts" if state.restarts else ""
+    if state.status == PROCESS_RUNNING:
+        minutes, seconds = divmod(int(state.uptime), 60)
+        hours, minutes = divmod(minutes, 60)
+        uptime = f"{hours}h {minutes}m" if hours else f"{minutes}m {seconds}s"
+        return f"{state.status} {uptime}, pid {state.pid}{restarts}"
+    if state.status in (PROCESS_EXITED, PROCESS_CRASHED) and state.exit_code is not None:
+        return f"{state.status} ({state.exit_code}){restarts}"
+    return f"{state.status}{restarts}"
@@ -0,0 +1,336 @@
+"""Virtualized list of the paths of a profile.
+
+PathList shows any number of paths with a small pool of PathRow widgets:
+only the rows in view, plus a few rows of overscan above and below, exist
+as widgets. Scrolling moves the pool and rebinds the rows that leave the
+view to the paths that enter it, so neither scrolling nor switching to a
+large profile creates or destroys widgets.
+"""
+
+import math
+import sys
+import customtkinter
+from src.constants.health import HEALTH_UNKNOWN, UNHEALTHY
+
+ROW_HEIGHT = 44
+ROW_SPACING = 10
+OVERSCAN_ROWS = 2
+UNHEALTHY_COLOR = "#D8524B"
+
+
+def pool_size(view_height):
+    """Get the number of pool rows needed for a view, overscan included.
+
+    Args:
+        view_height (float): Height of the view.
+
+    Returns:
+        int: Rows that cover the view at any scroll offset, plus the overscan.
+    """
+    return math.ceil(view_height / ROW_HEIGHT) + 1 + 2 * OVERSCAN_ROWS
+
+
+def visible_rows(offset, path_count, pool):
+    """Decide which pool row shows each path in or near the view.
+
+    Args:
+        offset (float): Distance of the top of the view from the top of the list.
+        path_count (int): Number of paths in the list.
+        pool (int): Number of pool rows.
+
+    Returns:
+        dict: Mapping of path index to the position of its pool row, in
+        index order. No two indexes share a position.
+    """
+    first = max(0, int(offset // ROW_HEIGHT) - OVERSCAN_ROWS)
+    last = min(path_count, first + pool)
+    return {index: index % pool for index in range(first, last)}
+
+
+class PathRow(customtkinter.CTkFrame):
+    """UI component for displaying a path in the application list.
+
+    A row can be bound to another path at any time with bind_path, which
+    lets PathList recycle it.
+    """
+
+    def __init__(self, executable_path, delete_callback, master: any, **kwargs):
+        """Initialize a path row.
+
+        Args:
+            executable_path (str): Path to the executable, None for an unbound row.
+            delete_callback (callable): Function to call with the bound path
+                when delete button is pressed.
+            master: Parent widget.
+            **kwargs: Additional arguments to pass to CTkFrame.
+        """
+        super().__init__(master, **kwargs)
+        self.path = None
+
+        delete_button = customtkinter.CTkButton(
+            self,
+            text="Delete",
+            command=lambda: self.path is not None and delete_callback(self.path),
+            fg_color="#D8524B",
+            width=75
+        )
+        delete_button.grid(row=0, column=0)
+
+        self.text_label = customtkinter.CTkLabel(self, text="", anchor="w")
+        self.text_label.grid(row=0, column=1, padx=15, sticky="news")
+
+        self.health_label = customtkinter.CTkLabel(self, text="", anchor="e", width=90)
+        self.health_label.grid(row=0, column=2, padx=(0, 10), sticky="e")
+        self.health_text_color = self.health_label.cget("text_color")
+
+        self.status_label = customtkinter.CTkLabel(self, text="", anchor="e", width=160)
+        self.status_label.grid(row=0, column=3, padx=(0, 10), sticky="e")
+
+        self.grid_columnconfigure(1, weight=2)
+        self.grid_rowconfigure(0, weight=1)
+        self.bind_path(executable_path)
+
+    def bind_path(self, executable_path, status="", health=HEALTH_UNKNOWN):
+        """Show another path in the row.
+
+        Args:
+            executable_path (str): Path to show, None to clear the row.
+            status (str): Launch status of the path, empty if it has none.
+            health (str): Health of the path, see src.constants.health.
+        """
+        self.path = executable_path
+        if executable_path is None:
+            display_path = ""
+        else:
+            split_path = executable_path.split('/')
+            display_path = f"{split_path[0]}/.../{split_path[-1]}"
+        self.text_label.configure(text=display_path)
+        self.set_status(status)
+        self.set_health(health)
+
+    def set_status(self, status: str):
+        """Show the launch or process status of the path.
+
+        Args:
+            status (str): Status to display.
+        """
+        self.status_label.configure(text=status.capitalize())
+
+    def set_health(self, health: str):
+        """Show whether the path exists and can be launched.
+
+        Args:
+            health (str): Health of the path, nothing is shown while it is unknown.
+        """
+        self.health_label.configure(
+            text="" if health == HEALTH_UNKNOWN else health.capitalize(),
+            text_color=UNHEALTHY_COLOR if health in UNHEALTHY else self.health_text_color
+        )
+
+
+class PathList(customtkinter.CTkFrame):
+    """Scrollable list of paths that only creates widgets for the rows in view.
+
+    Rows have a fixed height, so the rows in view follow from the scroll
+    offset alone. The path at index i is shown by pool row i modulo the pool
+    size, which means scrolling by one row rebinds a single row.
+    """
+
+    def __init__(self, master: any, delete_callback, label_text="", **kwargs):
+        """Initialize an empty list.
+
+        Args:
+            master: Parent widget.
+            delete_callback (callable): Called with a path when its delete button is pressed.
+            label_text (str): Title shown above the list.
+            **kwargs: Additional arguments to pass to CTkFrame.
+        """
+        super().__init__(master, **kwargs)
+        self.delete_callback = delete_callback
+        self._paths = []
+        self._path_set = set()
+        self._statuses = {}
+        self._health = {}
+        self._rows = []
+        self._bound = {}
+        self._offset = 0
+        self._view_height = 0
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+        if label_text:
+            label = customtkinter.CTkLabel(self, text=label_text)
+            label.grid(row=0, column=0, columnspan=2, padx=10, pady=5)
+
+        self.viewport = customtkinter.CTkFrame(self, fg_color="transparent")
+        self.viewport.grid(row=1, column=0, padx=(10, 0), pady=(0, 10), sticky="nsew")
+        self.viewport.bind("<Configure>", self._on_resize)
+
+        self.scrollbar = customtkinter.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, padx=5, pady=(0, 10), sticky="ns")
+
+        if sys.platform.startswith("linux"):
+            self.bind_all("<Button-4>", self._on_mouse_wheel, add="+")
+            self.bind_all("<Button-5>", self._on_mouse_wheel, add="+")
+        else:
+            self.bind_all("<MouseWheel>", self._on_mouse_wheel, add="+")
+
+    @property
+    def paths(self):
+        """list: Paths in the list, in display order."""
+        return list(self._paths)
+
+    def __contains__(self, path):
+        return path in self._path_set
+
+    def __len__(self):
+        return len(self._paths)
+
+    def set_paths(self, paths):
+        """Replace the paths of the list and scroll back to the top.
+
+        Args:
+            paths (iterable): Paths to show, in display order.
+        """
+        self._paths = list(dict.fromkeys(paths))
+        self._path_set = set(self._paths)
+        self._statuses = {}
+        self._scroll_to(0)
+
+    def append(self, path):
+        """Add a path to the end of the list.
+
+        Args:
+            path (str): Path to add.
+
+        Returns:
+            bool: True if the path was added, False if it is already listed.
+        """
+        if path in self._path_set:
+            return False
+        self._paths.append(path)
+        self._path_set.add(path)
+        self._scroll_to(self._offset)
+        return True
+
+    def remove(self, path):
+        """Remove a path from the list.
+
+        Args:
+            path (str): Path to remove.
+
+        Returns:
+            bool: True if the path was removed, False if it is not listed.
+        """
+        if path not in self._path_set:
+            return False
+        self._paths.remove(path)
+        self._path_set.discard(path)
+        self._statuses.pop(path, None)
+        self._scroll_to(self._offset)
+        return True
+
+    def set_status(self, path, status):
+        """Show the launch status of a path, now or when its row scrolls into view.
+
+        Args:
+            path (str): Path the status belongs to.
+            status (str): Launch status to display.
+        """
+        if path not in self._path_set or self._statuses.get(path) == status:
+            return
+        self._statuses[path] = status
+        row = self._bound.get(path)
+        if row is not None:
+            row.set_status(status)
+
+    def set_health(self, path, health):
+        """Show the health of a path, now or whenever its row scrolls into view.
+
+        The health is kept when other paths are shown, since it does not
+        depend on the profile.
+
+        Args:
+            path (str): Path the health belongs to.
+            health (str): Health of the path, see src.constants.health.
+        """
+        self._health[path] = health
+        row = self._bound.get(path)
+        if row is not None:
+            row.set_health(health)
+
+    def _scroll_to(self, offset):
+        """Scroll to an offset, clamped to the content, and lay out the rows.
+
+        Args:
+            offset (float): Distance of the top of the view from the top of the list.
+        """
+        content_height = len(self._paths) * ROW_HEIGHT
+        self._offset = max(0, min(offset, content_height - self._view_height))
+        if content_height > self._view_height:
+            self.scrollbar.set(self._offset / content_height,
+                               (self._offset + self._view_height) / content_height)
+        else:
+            self.scrollbar.set(0, 1)
+        self._layout()
+
+    def _layout(self):
+        """Bind and place the pool rows for the rows in view and hide the rest."""
+        while len(self._rows) < pool_size(self._view_height):
+            self._rows.append(PathRow(
+                executable_path=None,
+                delete_callback=self.delete_callback,
+                master=self.viewport,
+                height=ROW_HEIGHT - ROW_SPACING
+            ))
+            self._rows[-1].grid_propagate(False)
+        used = set()
+        for index, position in visible_rows(
+                self._offset, len(self._paths), len(self._rows)).items():
+            row = self._rows[position]
+            path = self._paths[index]
+            if row.path != path:
+                row.bind_path(path, self._statuses.get(path, ""),
+                              self._health.get(path, HEALTH_UNKNOWN))
+            row.place(x=0, y=index * ROW_HEIGHT - self._offset, relwidth=1)
+            used.add(position)
+        for position, row in enumerate(self._rows):
+            if position not in used and row.path is not None:
+                row.place_forget()
+                row.bind_path(None)
+        self._bound = {row.path: row for row in self._rows if row.path is not None}
+
+    def _on_resize(self, event):
+        """Lay out the rows for the new height of the view."""
+        scaling = customtkinter.ScalingTracker.get_widget_scaling(self)
+        self._view_height = event.height / scaling
+        self._scroll_to(self._offset)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        """Scroll as requested by the scrollbar.
+
+        Args:
+            action (str): "moveto" or "scroll".
+            value: Fraction of the list for moveto, number of steps for scroll.
+            unit (str): "units" to scroll by rows, "pages" by views.
+        """
+        if action == "moveto":
+            self._scroll_to(float(value) * len(self._paths) * ROW_HEIGHT)
+        elif unit == "pages":
+            self._scroll_to(self._offset + int(value) * self._view_height)
+        else:
+            self._scroll_to(self._offset + int(value) * ROW_HEIGHT)
+
+    def _on_mouse_wheel(self, event):
+        """Scroll by rows when the wheel turns over the list."""
+        viewport = str(self.viewport)
+        widget = str(event.widget)
+        if widget != viewport and not widget.startswith(viewport + "."):
+            return
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 40)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -1 if event.num == 4 else 1
+        self._on_scrollbar("scroll", delta, "units")
@@ -0,0 +1,192 @@
+"""Searchable profile picker.
+
+ProfilePicker is an entry that shows the selected profile and filters the
+profiles as the user types. The best matches are listed in a popup below
+the entry. Matches come from the search index of the profile service, so a
+keystroke costs about the same with a handful or with hundreds of profiles,
+and the popup reuses a fixed set of buttons instead of creating a menu
+entry per profile.
+"""
+
+import tkinter as tk
+import customtkinter
+
+MAX_RESULTS = 8
+HIDE_DELAY_MS = 200
+NAVIGATION_KEYS = {"Up", "Down", "Return", "KP_Enter", "Escape", "Tab"}
+
+
+class ProfilePicker(customtkinter.CTkFrame):
+    """Entry with type-ahead search over the profile names."""
+
+    def __init__(self, master: any, search, command, placeholder_text="", width=140, **kwargs):
+        """Initialize the picker.
+
+        Args:
+            master: Parent widget.
+            search (callable): Called with (query, limit), returns matching names.
+            command (callable): Called with the name of the chosen profile.
+            placeholder_text (str): Text shown while no profile is selected.
+            width (int): Width of the entry.
+            **kwargs: Additional arguments to pass to CTkFrame.
+        """
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.search = search
+        self.command = command
+        self._selected = ""
+        self._matches = []
+        self._highlight = 0
+        self._popup = None
+        self._buttons = []
+
+        self.entry = customtkinter.CTkEntry(self, width=width, placeholder_text=placeholder_text)
+        self.entry.grid(row=0, column=0)
+        self.entry.bind("<FocusIn>", self._on_focus_in)
+        self.entry.bind("<FocusOut>", self._on_focus_out)
+        self.entry.bind("<KeyRelease>", self._on_key_release)
+        self.entry.bind("<Down>", lambda _: self._move_highlight(1))
+        self.entry.bind("<Up>", lambda _: self._move_highlight(-1))
+        self.entry.bind("<Return>", self._on_return)
+        self.entry.bind("<KP_Enter>", self._on_return)
+        self.entry.bind("<Escape>", lambda _: self._close())
+
+    def get(self):
+        """Get the name of the selected profile.
+
+        Returns:
+            str: The selected name, empty if none is selected.
+        """
+        return self._selected
+
+    def set(self, name):
+        """Show a profile as selected, without calling the command.
+
+        Args:
+            name (str): Name of the profile, empty to clear the selection.
+        """
+        self._selected = name
+        self._set_entry_text(name)
+
+    def refresh(self):
+        """Search again if the popup is shown, after profiles changed."""
+        if self._popup is not None and self._popup.winfo_ismapped():
+            self._show_matches(self._query())
+
+    def _query(self):
+        """Get the text to search for, nothing while the selected name is shown."""
+        text = self.entry.get()
+        return "" if text == self._selected else text
+
+    def _set_entry_text(self, text):
+        """Replace the text of the entry."""
+        self.entry.delete(0, tk.END)
+        if text:
+            self.entry.insert(0, text)
+
+    def _on_focus_in(self, _event):
+        """Select the shown name, so typing replaces it, and list the profiles."""
+        self.entry.select_range(0, tk.END)
+        self._show_matches("")
+
+    def _on_focus_out(self, _event):
+        """Close the popup, late enough for a click on a match to arrive first."""
+        self.after(HIDE_DELAY_MS, self._close_if_unfocused)
+
+    def _close_if_unfocused(self):
+        """Close the popup unless the entry got the focus back."""
+        focused = self.focus_get()
+        if focused is None or not str(focused).startswith(str(self.entry)):
+            self._close(keep_focus=True)
+
+    def _on_key_release(self, event):
+        """Filter the matches with the text typed so far."""
+        if event.keysym not in NAVIGATION_KEYS:
+            self._show_matches(self._query())
+
+    def _on_return(self, _event):
+        """Choose the highlighted match."""
+        if self._matches:
+            self._choose(self._matches[self._highlight])
+
+    def _move_highlight(self, step):
+        """Highlight the next or previous match.
+
+        Args:
+            step (int): 1 for the next match, -1 for the previous one.
+        """
+        if self._matches:
+            self._highlight = (self._highlight + step) % len(self._matches)
+            self._paint_highlight()
+
+    def _choose(self, name):
+        """Select a match, close the popup and call the command.
+
+        Args:
+            name (str): The chosen profile name.
+        """
+        self.set(name)
+        self._close()
+        self.command(name)
+
+    def _close(self, keep_focus=False):
+        """Hide the popup and show the selected name again.
+
+        Args:
+            keep_focus (bool): Leave the keyboard focus where it is.
+        """
+        if self._popup is not None:
+            self._popup.withdraw()
+        self._matches = []
+        self._set_entry_text(self._selected)
+        if not keep_focus:
+            self.winfo_toplevel().focus_set()
+
+    def _show_matches(self, query):
+        """Search the profiles and list the matches below the entry.
+
+        Args:
+            query (str): Text to search for.
+        """
+        self._matches = self.search(query, MAX_RESULTS)
+        self._highlight = 0
+        popup = self._get_popup()
+        if not self._matches:
+            popup.withdraw()
+            return
+        for button, name in zip(self._buttons, self._matches):
+            button.configure(text=name)
+            button.grid()
+        for button in self._buttons[len(self._matches):]:
+            button.grid_remove()
+        self._paint_highlight()
+        popup.geometry(f"+{self.entry.winfo_rootx()}"
+                       f"+{self.entry.winfo_rooty() + self.entry.winfo_height()}")
+        popup.deiconify()
+        popup.lift()
+
+    def _paint_highlight(self):
+        """Color the highlighted match like a button and the others like the background."""
+        color = customtkinter.ThemeManager.theme["CTkButton"]["fg_color"]
+        for index, button in enumerate(self._buttons[:len(self._matches)]):
+            button.configure(fg_color=color if index == self._highlight else "transparent")
+
+    def _get_popup(self):
+        """Get the popup window, creating it and its buttons on first use."""
+        if self._popup is None:
+            self._popup = tk.Toplevel(self)
+            self._popup.withdraw()
+            self._popup.overrideredirect(True)
+            frame = customtkinter.CTkFrame(self._popup, corner_radius=0)
+            frame.pack(fill="both", expand=True)
+            for index in range(MAX_RESULTS):
+                button = customtkinter.CTkButton(
+                    frame,
+                    text="",
+                    anchor="w",
+                    width=self.entry.cget("width"),
+                    fg_color="transparent",
+                    command=lambda index=index: self._choose(self._matches[index])
+                )
+                button.grid(row=index, column=0, padx=2, pady=1)
+                self._buttons.append(button)
+        return self._popup
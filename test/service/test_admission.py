@@ -0,0 +1,114 @@
+"""Tests for the launch admission controller."""
+
+import os
+import tempfile
+import threading
+import unittest
+from src.service.admission import (
+    AdmissionController, AdmissionPolicy, SystemLoad, read_system_load
+)
+
+
+class TestAdmission(unittest.TestCase):
+    """Test suite for AdmissionController and its policy."""
+
+    def setUp(self):
+        """Start with an idle system."""
+        self.load = SystemLoad(load_per_cpu=0.1, available_mb=4096)
+
+    def controller(self, **policy):
+        """Create a controller reading the load set by the test."""
+        return AdmissionController(AdmissionPolicy(**policy), max_in_flight=4,
+                                   read_load=lambda: self.load)
+
+    @staticmethod
+    def acquire_within(controller, seconds=0.05):
+        """Try to get admitted, giving up after a short time."""
+        cancel_event = threading.Event()
+        timer = threading.Timer(seconds, cancel_event.set)
+        timer.start()
+        try:
+            return controller.acquire(cancel_event=cancel_event)
+        finally:
+            timer.cancel()
+
+    def test_read_system_load(self):
+        """Test reading the available memory from meminfo."""
+        with tempfile.NamedTemporaryFile("w", delete=False, encoding="ascii") as meminfo:
+            meminfo.write("MemTotal:       16384000 kB\nMemAvailable:    2097152 kB\n")
+        self.addCleanup(os.unlink, meminfo.name)
+
+        load = read_system_load(meminfo.name)
+
+        self.assertEqual(load.available_mb, 2048)
+        self.assertIsNone(read_system_load(meminfo.name + ".missing").available_mb)
+
+    def test_policy_from_config(self):
+        """Test that invalid settings raise ValueError."""
+        self.assertEqual(AdmissionPolicy.from_config({"max_in_flight": 2}).max_in_flight, 2)
+        for config in ({"max_in_flight": 0}, {"workers": 2}, {"latency_window": 0}):
+            with self.assertRaises(ValueError):
+                AdmissionPolicy.from_config(config)
+
+    def test_caps_paths_in_flight(self):
+        """Test that no more paths than the cap are admitted."""
+        controller = self.controller(max_in_flight=2, poll_interval=0.01)
+
+        self.assertTrue(controller.acquire())
+        self.assertTrue(controller.acquire())
+        self.assertFalse(self.acquire_within(controller))
+        controller.release(0.1)
+        self.assertTrue(controller.acquire())
+
+    def test_holds_back_while_overloaded(self):
+        """Test that a loaded system admits a single path at a time."""
+        controller = self.controller(poll_interval=0.01)
+        self.load = SystemLoad(load_per_cpu=0.1, available_mb=100)
+
+        self.assertTrue(controller.acquire())
+        self.assertFalse(self.acquire_within(controller))
+        controller.release(0.1)
+
+        self.load = SystemLoad(load_per_cpu=4.0, available_mb=4096)
+        self.assertTrue(controller.acquire())
+        self.assertFalse(self.acquire_within(controller))
+
+        self.load = SystemLoad(load_per_cpu=0.1, available_mb=4096)
+        self.assertTrue(self.acquire_within(controller))
+
+    def test_slow_spawns_lower_the_cap(self):
+        """Test that the cap halves on slow spawns and recovers on fast ones."""
+        controller = self.controller(slow_spawn_seconds=1, latency_window=1)
+        for latency, limit in ((5, 2), (5, 1), (5, 1), (0.1, 2), (0.1, 3), (0.1, 4), (0.1, 4)):
+            controller.acquire()
+            controller.release(latency)
+            self.assertEqual(controller.limit, limit)
+
+    def test_admits_by_priority(self):
+        """Test that waiting paths with a higher priority are admitted first."""
+        controller = self.controller(max_in_flight=1, poll_interval=0.01)
+        controller.acquire()
+        admitted = []
+        threads = []
+        for priority in (0, 2, 1):
+            thread = threading.Thread(
+                target=lambda priority=priority: admitted.append(
+                    controller.acquire(priority) and priority)
+            )
+            thread.start()
+            threads.append(thread)
+            while len(controller._waiting) < len(threads):  # pylint: disable=protected-access
+                threading.Event().wait(0.001)
+
+        for count in range(1, len(threads) + 1):
+            controller.release(0.1)
+            while len(admitted) < count:
+                threading.Event().wait(0.001)
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(admitted, [2, 1, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,16 @@ This module contains tests for ProfileManager and SettingsManager classes,
 verifying their ability to handle profiles, paths, and settings.
 """
 
+import json
+import threading
 import unittest
 import os
+from unittest.mock import patch
 
 from src.service.data_manager import ProfileManager
 from src.service.data_manager import SettingsManager
+from src.service.events import (PathAdded, PathRemoved, ProfileCreated, ProfileRemoved,
+                                ProfileRenamed)
 
 
 class TestDataManager(unittest.TestCase):
@@ -28,11 +33,11 @@ class TestDataManager(unittest.TestCase):
         self.settings_manager = SettingsManager(file_path=self.test_settings_file_path)
 
     def tearDown(self):
-        # Remove the temporary files after testing
-        if os.path.exists(self.test_profiles_file_path):
-            os.remove(self.test_profiles_file_path)
-        if os.path.exists(self.test_settings_file_path):
-            os.remove(self.test_settings_file_path)
+        # Remove the temporary files and their lock and version sidecars after testing
+        for file_path in (self.test_profiles_file_path, self.test_settings_file_path):
+            for suffix in ("", ".lock", ".version"):
+                if os.path.exists(file_path + suffix):
+                    os.remove(file_path + suffix)
 
     def test_remove_profile(self):
         """Test profile removal functionality."""
@@ -55,8 +60,7 @@ class TestDataManager(unittest.TestCase):
 
         # Add a path to the profile
         self.assertTrue(self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH))
-        self.assertIn("paths", self.profile_manager.data["DK1L-5H38"])
-        self.assertIn(self.TEST_PATH, self.profile_manager.data["DK1L-5H38"]["paths"])
+        self.assertIn(self.TEST_PATH, self.profile_manager.data["DK1L-5H38"].paths)
 
     def test_remove_path_from_profile(self):
         """Test removing paths from a profile."""
@@ -66,12 +70,11 @@ class TestDataManager(unittest.TestCase):
 
         # Add a path to the profile
         self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
-        self.assertIn("paths", self.profile_manager.data["DK1L-5H38"])
-        self.assertIn(self.TEST_PATH, self.profile_manager.data["DK1L-5H38"]["paths"])
+        self.assertIn(self.TEST_PATH, self.profile_manager.data["DK1L-5H38"].paths)
 
         # Remove the path from the profile
         self.assertTrue(self.profile_manager.remove_path_from_profile("DK1L-5H38", self.TEST_PATH))
-        self.assertNotIn(self.TEST_PATH, self.profile_manager.data["DK1L-5H38"]["paths"])
+        self.assertNotIn(self.TEST_PATH, self.profile_manager.data["DK1L-5H38"].paths)
 
     def test_change_profile_name(self):
         """Test profile name modification."""
@@ -82,7 +85,7 @@ class TestDataManager(unittest.TestCase):
         # Change the profile name
         self.assertTrue(self.profile_manager.change_profile_name("DK1L-5H38", "New Profile"))
         self.assertIn("DK1L-5H38", self.profile_manager.data)
-        self.assertEqual(self.profile_manager.data["DK1L-5H38"]["name"], "New Profile")
+        self.assertEqual(self.profile_manager.data["DK1L-5H38"].name, "New Profile")
 
         # Changing the name of a non-existent profile should return False
         self.assertFalse(self.profile_manager.change_profile_name("NonExistentProfile", "New Name"))
@@ -136,3 +139,340 @@ class TestDataManager(unittest.TestCase):
     def test_remove_path_from_nonexistent_profile(self):
         """Test removing a path from a non-existent profile."""
         self.assertFalse(self.profile_manager.remove_path_from_profile("NonExistentProfile", self.TEST_PATH))
+
+    def test_set_path_dependencies(self):
+        """Test declaring which paths a profile path starts after."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        self.profile_manager.add_path_to_profile("DK1L-5H38", "C:/vpn.exe")
+        self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+
+        self.assertTrue(self.profile_manager.set_path_dependencies(
+            "DK1L-5H38", self.TEST_PATH, ["C:/vpn.exe"]))
+        self.assertEqual(
+            self.profile_manager.get_path_dependencies("DK1L-5H38"),
+            {self.TEST_PATH: ["C:/vpn.exe"]}
+        )
+
+        # Dependencies on paths outside the profile are rejected
+        self.assertFalse(self.profile_manager.set_path_dependencies(
+            "DK1L-5H38", self.TEST_PATH, ["C:/unknown.exe"]))
+        self.assertFalse(self.profile_manager.set_path_dependencies(
+            "NonExistentProfile", self.TEST_PATH, []))
+
+    def test_remove_path_drops_dependencies(self):
+        """Test that removing a path removes dependencies on it."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        self.profile_manager.add_path_to_profile("DK1L-5H38", "C:/vpn.exe")
+        self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+        self.profile_manager.set_path_dependencies("DK1L-5H38", self.TEST_PATH, ["C:/vpn.exe"])
+
+        self.profile_manager.remove_path_from_profile("DK1L-5H38", "C:/vpn.exe")
+
+        self.assertEqual(self.profile_manager.get_path_dependencies("DK1L-5H38"), {})
+
+    def test_set_path_probes(self):
+        """Test storing readiness probes for a profile path."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+        probes = [{"type": "tcp", "port": 5432}]
+
+        self.assertTrue(self.profile_manager.set_path_probes("DK1L-5H38", self.TEST_PATH, probes))
+        self.assertEqual(self.profile_manager.get_path_probes("DK1L-5H38"), {self.TEST_PATH: probes})
+
+        # Clearing the probes removes the option
+        self.assertTrue(self.profile_manager.set_path_probes("DK1L-5H38", self.TEST_PATH, []))
+        self.assertEqual(self.profile_manager.get_path_probes("DK1L-5H38"), {})
+
+        # Probes can only be set on paths of the profile
+        self.assertFalse(self.profile_manager.set_path_probes("DK1L-5H38", "C:/other.exe", probes))
+
+    def test_set_path_restart_policy(self):
+        """Test storing a restart policy for a profile path."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+        policy = {"mode": "on-crash", "max_restarts": 3}
+
+        self.assertTrue(self.profile_manager.set_path_restart_policy(
+            "DK1L-5H38", self.TEST_PATH, policy))
+        self.assertEqual(self.profile_manager.get_path_restart_policies("DK1L-5H38"),
+                         {self.TEST_PATH: policy})
+        reloaded = ProfileManager(file_path=self.profile_manager.file_path)
+        self.assertEqual(reloaded.get_path_restart_policies("DK1L-5H38"),
+                         {self.TEST_PATH: policy})
+
+        # Clearing the policy removes the option
+        self.assertTrue(self.profile_manager.set_path_restart_policy(
+            "DK1L-5H38", self.TEST_PATH, None))
+        self.assertEqual(self.profile_manager.get_path_restart_policies("DK1L-5H38"), {})
+
+    def test_set_profile_admission(self):
+        """Test storing admission control overrides for a profile."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+
+        self.assertTrue(self.profile_manager.set_profile_admission(
+            "DK1L-5H38", {"max_in_flight": 2}))
+        reloaded = ProfileManager(file_path=self.profile_manager.file_path)
+        self.assertEqual(reloaded.get_profile_admission("DK1L-5H38"), {"max_in_flight": 2})
+
+        self.assertTrue(self.profile_manager.set_profile_admission("DK1L-5H38", None))
+        self.assertEqual(self.profile_manager.get_profile_admission("DK1L-5H38"), {})
+        self.assertFalse(self.profile_manager.set_profile_admission("missing", {}))
+
+    def test_transaction_writes_once(self):
+        """Test that a transaction flushes all of its changes with a single write."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        with patch.object(self.profile_manager, "_write_data",
+                          wraps=self.profile_manager._write_data) as write_data:
+            with self.profile_manager.transaction():
+                for index in range(200):
+                    self.profile_manager.add_path_to_profile("DK1L-5H38", f"C:/app{index}.exe")
+                self.assertEqual(write_data.call_count, 0)
+
+        self.assertEqual(write_data.call_count, 1)
+        reloaded = ProfileManager(file_path=self.test_profiles_file_path)
+        self.assertEqual(len(reloaded.data["DK1L-5H38"].paths), 200)
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test that an exception inside a transaction restores the data and writes nothing."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        with patch.object(self.profile_manager, "_write_data") as write_data:
+            with self.assertRaises(RuntimeError):
+                with self.profile_manager.transaction():
+                    self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+                    self.profile_manager.change_profile_name("DK1L-5H38", "Renamed")
+                    self.profile_manager.add_profile("NEW-ID", "Profile 3")
+                    raise RuntimeError("abort")
+
+        write_data.assert_not_called()
+        self.assertEqual(self.profile_manager.data["DK1L-5H38"].to_dict(),
+                         {"name": "Profile 2", "paths": []})
+        self.assertNotIn("NEW-ID", self.profile_manager.data)
+
+    def test_transaction_blocks_other_threads(self):
+        """Test that operations of other threads wait for an open transaction."""
+        with self.profile_manager.transaction():
+            self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+            thread = threading.Thread(
+                target=self.profile_manager.add_path_to_profile,
+                args=("DK1L-5H38", self.TEST_PATH)
+            )
+            thread.start()
+            thread.join(0.1)
+            self.assertTrue(thread.is_alive())
+            self.assertEqual(self.profile_manager.data["DK1L-5H38"].paths, [])
+        thread.join()
+
+        self.assertEqual(self.profile_manager.data["DK1L-5H38"].paths, [self.TEST_PATH])
+
+    def test_nested_transactions_join_outermost(self):
+        """Test that nested transactions write once, when the outermost commits."""
+        with patch.object(self.settings_manager, "_write_data") as write_data:
+            with self.settings_manager.transaction():
+                with self.settings_manager.transaction():
+                    self.settings_manager.add_entry("Setting 1", "value1")
+                self.assertEqual(write_data.call_count, 0)
+                self.settings_manager.add_entry("Setting 2", "value2")
+
+        self.assertEqual(write_data.call_count, 1)
+
+    def test_unchanged_values_are_not_written(self):
+        """Test that updates that change nothing skip the write."""
+        self.settings_manager.add_entry("Setting 1", "value1")
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        with patch.object(self.settings_manager, "_write_data") as settings_write, \
+                patch.object(self.profile_manager, "_write_data") as profile_write:
+            self.assertTrue(self.settings_manager.update_entry("Setting 1", "value1"))
+            self.assertTrue(self.profile_manager.change_profile_name("DK1L-5H38", "Profile 2"))
+            with self.profile_manager.transaction():
+                pass
+
+        settings_write.assert_not_called()
+        profile_write.assert_not_called()
+
+    def test_name_index(self):
+        """Test that profile names are unique and resolve to their IDs."""
+        self.assertTrue(self.profile_manager.add_profile("DK1L-5H38", "Profile 2"))
+        self.assertFalse(self.profile_manager.add_profile("NEW-ID", "Profile 2"))
+        self.assertTrue(self.profile_manager.add_profile("NEW-ID", "Profile 3"))
+        self.assertEqual(self.profile_manager.find_profile_id("Profile 2"), "DK1L-5H38")
+
+        # Renaming moves the index entry and cannot take another profile's name
+        self.assertTrue(self.profile_manager.change_profile_name("DK1L-5H38", "Renamed"))
+        self.assertFalse(self.profile_manager.change_profile_name("NEW-ID", "Renamed"))
+        self.assertFalse(self.profile_manager.has_profile_name("Profile 2"))
+        self.assertEqual(self.profile_manager.find_profile_id("Renamed"), "DK1L-5H38")
+
+        self.profile_manager.remove_profile("DK1L-5H38")
+        self.assertIsNone(self.profile_manager.find_profile_id("Renamed"))
+
+    def test_path_set(self):
+        """Test that a profile holds every path once, in insertion order."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        for path in ("C:/b.exe", "C:/a.exe", "C:/b.exe"):
+            self.assertTrue(self.profile_manager.add_path_to_profile("DK1L-5H38", path))
+
+        self.assertEqual(self.profile_manager.data["DK1L-5H38"].paths, ["C:/b.exe", "C:/a.exe"])
+        self.assertTrue(self.profile_manager.has_path("DK1L-5H38", "C:/a.exe"))
+        self.assertFalse(self.profile_manager.remove_path_from_profile("DK1L-5H38", "C:/c.exe"))
+        self.assertTrue(self.profile_manager.remove_path_from_profile("DK1L-5H38", "C:/b.exe"))
+        self.assertFalse(self.profile_manager.has_path("DK1L-5H38", "C:/b.exe"))
+
+    def test_rollback_restores_indexes(self):
+        """Test that a rolled back transaction restores the name index and path sets."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        with patch.object(self.profile_manager, "_write_data"):
+            with self.assertRaises(RuntimeError):
+                with self.profile_manager.transaction():
+                    self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+                    self.profile_manager.change_profile_name("DK1L-5H38", "Renamed")
+                    self.profile_manager.add_profile("NEW-ID", "Profile 3")
+                    raise RuntimeError("abort")
+
+        self.assertEqual(self.profile_manager.find_profile_id("Profile 2"), "DK1L-5H38")
+        self.assertFalse(self.profile_manager.has_profile_name("Renamed"))
+        self.assertFalse(self.profile_manager.has_profile_name("Profile 3"))
+        self.assertFalse(self.profile_manager.has_path("DK1L-5H38", self.TEST_PATH))
+
+    def test_other_process_changes_are_picked_up(self):
+        """Test that a manager reloads after another manager on the same file commits."""
+        other = ProfileManager(file_path=self.test_profiles_file_path)
+        other.add_profile("OTHER-ID", "Other")
+
+        self.assertEqual(self.profile_manager.find_profile_id("Other"), "OTHER-ID")
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        self.assertTrue(other.has_profile_name("Profile 2"))
+
+    def test_unchanged_store_is_not_reloaded(self):
+        """Test that checking for changes does not re-read an unchanged store."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        with patch.object(self.profile_manager, "_load_data") as load_data:
+            for _ in range(10):
+                self.profile_manager.get_entry("DK1L-5H38")
+                self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+
+        load_data.assert_not_called()
+
+    def test_commit_merges_concurrent_changes(self):
+        """Test that a commit keeps the changes another process made to other keys."""
+        other = ProfileManager(file_path=self.test_profiles_file_path)
+        with self.profile_manager.transaction():
+            self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+            other.add_profile("OTHER-ID", "Other")
+
+        reloaded = ProfileManager(file_path=self.test_profiles_file_path)
+        self.assertEqual(set(reloaded.data), {"DK1L-5H38", "OTHER-ID"})
+        self.assertEqual(self.profile_manager.find_profile_id("Other"), "OTHER-ID")
+
+    def write_profiles_by_hand(self, content):
+        """Replace the profiles file without going through a data manager."""
+        with open(self.test_profiles_file_path, "w", encoding="utf-8") as profiles_file:
+            profiles_file.write(content)
+        # Make sure the stamp differs even on file systems with coarse timestamps
+        os.utime(self.test_profiles_file_path, ns=(0, 0))
+
+    def test_sync_from_disk_picks_up_edits_by_hand(self):
+        """Test that an edit that bypassed the managers is loaded and diffed."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        self.profile_manager.add_profile("OLD-ID", "Old")
+        self.profile_manager.add_path_to_profile("DK1L-5H38", "C:/a.exe")
+        self.profile_manager.track_changes = True
+
+        self.write_profiles_by_hand(json.dumps({
+            "DK1L-5H38": {"name": "Renamed", "paths": ["C:/b.exe"]},
+            "NEW-ID": {"name": "New", "paths": []},
+        }))
+
+        self.assertTrue(self.profile_manager.sync_from_disk())
+        self.assertFalse(self.profile_manager.sync_from_disk())
+        [diff] = self.profile_manager.take_changes()
+        self.assertEqual(diff.added, {"NEW-ID": "New"})
+        self.assertEqual(diff.removed, {"OLD-ID": "Old"})
+        self.assertEqual(diff.renamed, {"DK1L-5H38": ("Profile 2", "Renamed")})
+        self.assertEqual(diff.paths_added, {"DK1L-5H38": ["C:/b.exe"]})
+        self.assertEqual(diff.paths_removed, {"DK1L-5H38": ["C:/a.exe"]})
+        self.assertEqual(self.profile_manager.take_changes(), [])
+        self.assertEqual(self.profile_manager.find_profile_id("Renamed"), "DK1L-5H38")
+
+    def test_changes_are_not_tracked_by_default(self):
+        """Test that reloads record nothing unless tracking is enabled."""
+        other = ProfileManager(file_path=self.test_profiles_file_path)
+        other.add_profile("OTHER-ID", "Other")
+
+        self.assertTrue(self.profile_manager.sync_from_disk())
+        self.assertEqual(self.profile_manager.take_changes(), [])
+
+    def test_sync_from_disk_keeps_data_on_invalid_file(self):
+        """Test that a half-written file raises and leaves the loaded profiles alone."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+
+        self.write_profiles_by_hand('{"DK1L-5H38": {"name": ')
+
+        with self.assertRaises(ValueError):
+            self.profile_manager.sync_from_disk()
+        self.assertEqual(self.profile_manager.find_profile_id("Profile 2"), "DK1L-5H38")
+
+    def test_mutations_publish_events(self):
+        """Test that every profile mutation publishes the matching event."""
+        received = []
+        self.profile_manager.events.subscribe(received.append)
+
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+        self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+        self.profile_manager.change_profile_name("DK1L-5H38", "Renamed")
+        self.profile_manager.remove_path_from_profile("DK1L-5H38", self.TEST_PATH)
+        self.profile_manager.remove_profile("DK1L-5H38")
+
+        self.assertEqual(received, [
+            ProfileCreated("DK1L-5H38", "Profile 2"),
+            PathAdded("DK1L-5H38", self.TEST_PATH),
+            ProfileRenamed("DK1L-5H38", "Profile 2", "Renamed"),
+            PathRemoved("DK1L-5H38", self.TEST_PATH),
+            ProfileRemoved("DK1L-5H38", "Renamed"),
+        ])
+
+    def test_transaction_publishes_on_commit(self):
+        """Test that events of a transaction wait for the commit and are dropped on rollback."""
+        received = []
+        self.profile_manager.events.subscribe(received.append)
+
+        with self.profile_manager.transaction():
+            self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+            self.profile_manager.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+            self.assertEqual(received, [])
+        self.assertEqual(len(received), 2)
+
+        with self.assertRaises(RuntimeError):
+            with self.profile_manager.transaction():
+                self.profile_manager.change_profile_name("DK1L-5H38", "Renamed")
+                raise RuntimeError("abort")
+        self.assertEqual(len(received), 2)
+
+    def test_reload_publishes_changes_of_other_processes(self):
+        """Test that tracked reloads publish what another manager changed."""
+        self.profile_manager.add_profile("DK1L-5H38", "Profile 2")
+        self.profile_manager.track_changes = True
+        received = []
+        self.profile_manager.events.subscribe(received.append)
+        other = ProfileManager(file_path=self.test_profiles_file_path)
+
+        other.add_path_to_profile("DK1L-5H38", self.TEST_PATH)
+        self.assertTrue(self.profile_manager.refresh())
+
+        self.assertEqual(received, [PathAdded("DK1L-5H38", self.TEST_PATH)])
+
+    def test_search_profile_names(self):
+        """Test that the search index follows creations, renames, removals and rollbacks."""
+        self.profile_manager.add_profile("DK1L-5H38", "Work")
+        self.profile_manager.add_profile("OTHER-ID", "Homework")
+        self.profile_manager.change_profile_name("DK1L-5H38", "Office")
+        with self.assertRaises(RuntimeError):
+            with self.profile_manager.transaction():
+                self.profile_manager.remove_profile("OTHER-ID")
+                raise RuntimeError("abort")
+
+        self.assertEqual(self.profile_manager.search_profile_names("o"), ["Office", "Homework"])
+        self.assertEqual(self.profile_manager.search_profile_names("work"), ["Homework"])
+
+        self.profile_manager.remove_profile("OTHER-ID")
+        self.assertEqual(self.profile_manager.search_profile_names("work"), [])
@@ -0,0 +1,66 @@
+"""Tests for the change event bus."""
+
+import unittest
+from src.service.events import (EventBus, PathAdded, PathRemoved, ProfileCreated,
+                                ProfileRemoved, ProfileRenamed, events_from_diff)
+from src.service.model import ProfileDiff
+
+
+class TestEventBus(unittest.TestCase):
+    """Test suite for EventBus and the event conversion of diffs."""
+
+    def test_subscribers_receive_their_event_types(self):
+        """Test that a subscription filtered by type only receives those events."""
+        bus = EventBus()
+        received, paths = [], []
+        bus.subscribe(received.append)
+        bus.subscribe(paths.append, (PathAdded, PathRemoved))
+
+        bus.publish(ProfileCreated("ID", "Work"))
+        bus.publish(PathAdded("ID", "C:/a.exe"))
+
+        self.assertEqual(received, [ProfileCreated("ID", "Work"), PathAdded("ID", "C:/a.exe")])
+        self.assertEqual(paths, [PathAdded("ID", "C:/a.exe")])
+
+    def test_unsubscribe(self):
+        """Test that a cancelled subscription receives nothing."""
+        bus = EventBus()
+        received = []
+        unsubscribe = bus.subscribe(received.append)
+
+        unsubscribe()
+        bus.publish(ProfileCreated("ID", "Work"))
+
+        self.assertEqual(received, [])
+
+    def test_failing_handler_does_not_stop_others(self):
+        """Test that an exception in one handler is logged and the others still run."""
+        bus = EventBus()
+        received = []
+
+        def fail(_):
+            raise RuntimeError("broken handler")
+        bus.subscribe(fail)
+        bus.subscribe(received.append)
+
+        with self.assertLogs("ProfileService", level="ERROR"):
+            bus.publish(ProfileRemoved("ID", "Work"))
+        self.assertEqual(received, [ProfileRemoved("ID", "Work")])
+
+    def test_events_from_diff(self):
+        """Test converting a reload diff to events."""
+        diff = ProfileDiff(
+            added={"NEW": "New"},
+            removed={"OLD": "Old"},
+            renamed={"ID": ("Work", "Office")},
+            paths_added={"ID": ["C:/b.exe"]},
+            paths_removed={"ID": ["C:/a.exe"]},
+        )
+
+        self.assertEqual(events_from_diff(diff), [
+            ProfileRemoved("OLD", "Old"),
+            ProfileCreated("NEW", "New"),
+            ProfileRenamed("ID", "Work", "Office"),
+            PathRemoved("ID", "C:/a.exe"),
+            PathAdded("ID", "C:/b.exe"),
+        ])
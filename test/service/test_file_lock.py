@@ -0,0 +1,29 @@
+"""Tests for the inter-process file lock."""
+
+import os
+import tempfile
+import threading
+import unittest
+from src.service.file_lock import FileLock
+
+
+class TestFileLock(unittest.TestCase):
+    """Test suite for FileLock."""
+
+    def test_lock_is_exclusive(self):
+        """Test that a second holder waits until the lock is released."""
+        with tempfile.TemporaryDirectory() as directory:
+            lock_path = os.path.join(directory, "store.lock")
+            acquired = threading.Event()
+
+            def take_lock():
+                with FileLock(lock_path):
+                    acquired.set()
+
+            with FileLock(lock_path):
+                waiter = threading.Thread(target=take_lock)
+                waiter.start()
+                self.assertFalse(acquired.wait(0.1))
+            waiter.join(timeout=5)
+
+            self.assertTrue(acquired.is_set())
@@ -0,0 +1,349 @@
+"""Tests for the concurrent profile launch engine."""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from src.constants.launch import (
+    LAUNCH_ALREADY_RUNNING, LAUNCH_CANCELLED, LAUNCH_FAILED, LAUNCH_QUEUED, LAUNCH_RUNNING,
+    LAUNCH_SPAWNING, LAUNCH_WAITING
+)
+from src.service.launcher import (ProfileLauncher, compile_launch_plan, compute_launch_waves,
+                                  spawn_path)
+from src.service.admission import AdmissionController, AdmissionPolicy, SystemLoad
+from src.service.process_table import ProcessTable
+from src.service.readiness import ReadinessProbe
+
+
+class FakeProbe(ReadinessProbe):
+    """Probe whose readiness is controlled by the test."""
+
+    def __init__(self, ready_event, timeout=2):
+        super().__init__(timeout=timeout, interval=0.01)
+        self.ready_event = ready_event
+
+    def check(self, process):
+        return self.ready_event.is_set()
+
+
+class TestLauncher(unittest.TestCase):
+    """Test suite for ProfileLauncher and spawn_path."""
+
+    @patch('subprocess.Popen')
+    def test_spawn_path_records_pid_and_latency(self, mock_popen):
+        """Test that a successful spawn reports its PID and latency."""
+        mock_popen.return_value = MagicMock(pid=4321)
+
+        result = spawn_path("C:/test/app.exe")
+
+        self.assertTrue(result.succeeded)
+        self.assertEqual(result.pid, 4321)
+        self.assertGreaterEqual(result.spawn_latency, 0.0)
+        self.assertIs(result.process, mock_popen.return_value)
+
+    @patch('subprocess.Popen')
+    def test_spawn_path_captures_error(self, mock_popen):
+        """Test that a failed spawn is reported instead of raised."""
+        mock_popen.side_effect = FileNotFoundError("missing")
+
+        result = spawn_path("C:/test/missing.exe")
+
+        self.assertFalse(result.succeeded)
+        self.assertIsNone(result.pid)
+        self.assertIn("missing", result.error)
+
+    @patch('subprocess.Popen')
+    def test_launch_preserves_order(self, mock_popen):
+        """Test that results come back in the order of the path list."""
+        mock_popen.side_effect = lambda args, **kwargs: MagicMock(pid=len(args[0]))
+        paths = [f"C:/test/{'a' * i}.exe" for i in range(1, 6)]
+
+        results = ProfileLauncher(max_workers=3).launch(paths)
+
+        self.assertEqual([result.path for result in results], paths)
+
+    @patch('subprocess.Popen')
+    def test_launch_is_concurrent(self, mock_popen):
+        """Test that total launch time is close to the slowest spawn."""
+        def slow_spawn(*_args, **_kwargs):
+            time.sleep(0.2)
+            return MagicMock(pid=1)
+        mock_popen.side_effect = slow_spawn
+        paths = [f"C:/test/app{i}.exe" for i in range(5)]
+
+        start = time.perf_counter()
+        results = ProfileLauncher(max_workers=5).launch(paths)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(results), 5)
+        self.assertLess(elapsed, 0.6)
+
+    def test_launch_empty_list(self):
+        """Test that launching nothing returns no results."""
+        self.assertEqual(ProfileLauncher().launch([]), [])
+
+    def test_invalid_worker_count(self):
+        """Test that a worker count below one is rejected."""
+        with self.assertRaises(ValueError):
+            ProfileLauncher(max_workers=0)
+
+    @patch('subprocess.Popen')
+    def test_launch_reports_statuses(self, mock_popen):
+        """Test that every path reports queued, spawning and a final status."""
+        mock_popen.side_effect = [MagicMock(pid=1), OSError("boom")]
+        events = []
+
+        ProfileLauncher(max_workers=1).launch(
+            ["C:/test/ok.exe", "C:/test/bad.exe"],
+            on_status=lambda path, status: events.append((path, status))
+        )
+
+        self.assertEqual(
+            [status for path, status in events if path == "C:/test/ok.exe"],
+            [LAUNCH_QUEUED, LAUNCH_SPAWNING, LAUNCH_RUNNING]
+        )
+        self.assertEqual(
+            [status for path, status in events if path == "C:/test/bad.exe"],
+            [LAUNCH_QUEUED, LAUNCH_SPAWNING, LAUNCH_FAILED]
+        )
+
+    @patch('subprocess.Popen')
+    def test_launch_cancel_skips_pending_paths(self, mock_popen):
+        """Test that setting the cancel event skips paths not yet spawned."""
+        cancel_event = threading.Event()
+
+        def spawn_then_cancel(*_args, **_kwargs):
+            cancel_event.set()
+            return MagicMock(pid=1)
+        mock_popen.side_effect = spawn_then_cancel
+
+        results = ProfileLauncher(max_workers=1).launch(
+            ["C:/test/app1.exe", "C:/test/app2.exe", "C:/test/app3.exe"],
+            cancel_event=cancel_event
+        )
+
+        self.assertEqual(mock_popen.call_count, 1)
+        self.assertEqual(
+            [result.status for result in results],
+            [LAUNCH_RUNNING, LAUNCH_CANCELLED, LAUNCH_CANCELLED]
+        )
+
+    @patch('subprocess.Popen')
+    def test_launch_cancel_during_readiness_wait(self, mock_popen):
+        """Test that a path cancelled while waiting for its probes is reported cancelled."""
+        cancel_event = threading.Event()
+        mock_popen.return_value = MagicMock(pid=1)
+
+        def on_status(path, status):
+            if path == "vpn.exe" and status == LAUNCH_WAITING:
+                cancel_event.set()
+
+        results = ProfileLauncher().launch(
+            ["vpn.exe", "ide.exe"],
+            dependencies={"ide.exe": ["vpn.exe"]},
+            probes={"vpn.exe": [FakeProbe(threading.Event(), timeout=5)]},
+            cancel_event=cancel_event,
+            on_status=on_status
+        )
+
+        self.assertEqual(mock_popen.call_count, 1)
+        self.assertEqual([result.status for result in results],
+                         [LAUNCH_CANCELLED, LAUNCH_CANCELLED])
+        self.assertEqual(results[0].pid, 1)
+        self.assertIsNone(results[0].ready_latency)
+
+    def test_compute_launch_waves(self):
+        """Test that paths are grouped into dependency-ordered waves."""
+        paths = ["vpn.exe", "drive.bat", "ide.exe", "chat.exe"]
+        dependencies = {"drive.bat": ["vpn.exe"], "ide.exe": ["drive.bat", "vpn.exe"]}
+
+        waves = compute_launch_waves(paths, dependencies)
+
+        self.assertEqual(waves, [["vpn.exe", "chat.exe"], ["drive.bat"], ["ide.exe"]])
+
+    def test_compute_launch_waves_ignores_unknown_paths(self):
+        """Test that dependencies on paths outside the list are ignored."""
+        waves = compute_launch_waves(["a.exe", "b.exe"], {"b.exe": ["missing.exe"]})
+
+        self.assertEqual(waves, [["a.exe", "b.exe"]])
+
+    def test_compute_launch_waves_rejects_cycles(self):
+        """Test that a dependency cycle is reported."""
+        with self.assertRaises(ValueError):
+            compute_launch_waves(["a.exe", "b.exe"], {"a.exe": ["b.exe"], "b.exe": ["a.exe"]})
+
+    @patch('subprocess.Popen')
+    def test_launch_waves_in_order(self, mock_popen):
+        """Test that a path is spawned only after the paths it starts after."""
+        spawned = []
+
+        def record_spawn(args, **_kwargs):
+            spawned.append(args[0])
+            return MagicMock(pid=1)
+        mock_popen.side_effect = record_spawn
+
+        ProfileLauncher().launch(
+            ["ide.exe", "vpn.exe"],
+            dependencies={"ide.exe": ["vpn.exe"]}
+        )
+
+        self.assertEqual(spawned, ["vpn.exe", "ide.exe"])
+
+    @patch('subprocess.Popen')
+    def test_launch_skips_paths_with_failed_dependency(self, mock_popen):
+        """Test that dependents of a failed path are not spawned."""
+        mock_popen.side_effect = FileNotFoundError("missing")
+
+        results = ProfileLauncher().launch(
+            ["vpn.exe", "ide.exe"],
+            dependencies={"ide.exe": ["vpn.exe"]}
+        )
+
+        self.assertEqual(mock_popen.call_count, 1)
+        self.assertEqual(results[1].status, LAUNCH_FAILED)
+        self.assertIn("vpn.exe", results[1].error)
+
+    @patch('subprocess.Popen')
+    def test_launch_fails_unavailable_paths_without_spawning(self, mock_popen):
+        """Test that unavailable paths and their dependents fail at once."""
+        mock_popen.return_value = MagicMock(pid=1)
+
+        results = ProfileLauncher().launch(
+            ["vpn.exe", "ide.exe", "notes.exe"],
+            dependencies={"ide.exe": ["vpn.exe"]},
+            unavailable={"vpn.exe": "Path is missing"}
+        )
+
+        mock_popen.assert_called_once_with(["notes.exe"])
+        self.assertEqual([result.status for result in results],
+                         [LAUNCH_FAILED, LAUNCH_FAILED, LAUNCH_RUNNING])
+        self.assertEqual(results[0].error, "Path is missing")
+
+    @patch('subprocess.Popen')
+    def test_dependent_starts_when_probes_pass(self, mock_popen):
+        """Test that a dependent path waits for the readiness probes of its dependency."""
+        vpn_ready = threading.Event()
+        spawned = []
+
+        def record_spawn(args, **_kwargs):
+            spawned.append(args[0])
+            if args[0] == "vpn.exe":
+                threading.Timer(0.05, vpn_ready.set).start()
+            else:
+                self.assertTrue(vpn_ready.is_set())
+            return MagicMock(pid=1)
+        mock_popen.side_effect = record_spawn
+
+        results = ProfileLauncher().launch(
+            ["vpn.exe", "ide.exe"],
+            dependencies={"ide.exe": ["vpn.exe"]},
+            probes={"vpn.exe": [FakeProbe(vpn_ready)]}
+        )
+
+        self.assertEqual(spawned, ["vpn.exe", "ide.exe"])
+        self.assertIsNotNone(results[0].ready_latency)
+        self.assertIsNone(results[1].ready_latency)
+
+    @patch('subprocess.Popen')
+    def test_failed_probe_blocks_dependents(self, mock_popen):
+        """Test that a path whose probes time out is failed and blocks its dependents."""
+        mock_popen.return_value = MagicMock(pid=1)
+
+        results = ProfileLauncher().launch(
+            ["vpn.exe", "ide.exe"],
+            dependencies={"ide.exe": ["vpn.exe"]},
+            probes={"vpn.exe": [FakeProbe(threading.Event(), timeout=0.05)]}
+        )
+
+        self.assertEqual(mock_popen.call_count, 1)
+        self.assertEqual(results[0].status, LAUNCH_FAILED)
+        self.assertEqual(results[0].pid, 1)
+        self.assertEqual(results[1].status, LAUNCH_FAILED)
+
+    @patch('subprocess.Popen')
+    def test_dependent_does_not_wait_for_unrelated_paths(self, mock_popen):
+        """Test that a dependent starts without waiting for slow paths it doesn't need."""
+        slow_ready = threading.Event()
+        mock_popen.return_value = MagicMock(pid=1)
+
+        def on_status(path, status):
+            if path == "ide.exe" and status == LAUNCH_RUNNING:
+                slow_ready.set()
+
+        results = ProfileLauncher().launch(
+            ["slow.exe", "vpn.exe", "ide.exe"],
+            dependencies={"ide.exe": ["vpn.exe"]},
+            probes={"slow.exe": [FakeProbe(slow_ready)]},
+            on_status=on_status
+        )
+
+        self.assertTrue(all(result.succeeded for result in results))
+
+    def test_compile_launch_plan(self):
+        """Test that a plan resolves spawn modes and dependency order up front."""
+        plan = compile_launch_plan(
+            ["ide.exe", "vpn.exe", "C:/start.bat"],
+            dependencies={"ide.exe": ["vpn.exe", "missing.exe"]}
+        )
+
+        self.assertEqual(plan.paths, ("ide.exe", "vpn.exe", "C:/start.bat"))
+        self.assertEqual(plan.specs["C:/start.bat"].options, {"shell": True})
+        self.assertEqual(plan.specs["C:/start.bat"].args, "C:/start.bat")
+        self.assertEqual(plan.specs["vpn.exe"].options, {})
+        self.assertEqual(plan.start_after, {"vpn.exe": (), "C:/start.bat": (),
+                                            "ide.exe": ("vpn.exe",)})
+        self.assertEqual(plan.dependents, {"vpn.exe": ("ide.exe",)})
+        self.assertEqual(plan.priorities, {"vpn.exe": 1, "C:/start.bat": 0, "ide.exe": 0})
+        with self.assertRaises(ValueError):
+            compile_launch_plan(["a.exe", "b.exe"], {"a.exe": ["b.exe"], "b.exe": ["a.exe"]})
+
+    @patch('subprocess.Popen')
+    def test_plan_can_be_launched_again(self, mock_popen):
+        """Test that running the same plan twice spawns every path each time."""
+        mock_popen.return_value = MagicMock(pid=1)
+        plan = compile_launch_plan(["vpn.exe", "ide.exe"], {"ide.exe": ["vpn.exe"]})
+        launcher = ProfileLauncher()
+
+        first = launcher.launch_plan(plan)
+        second = launcher.launch_plan(plan)
+
+        self.assertEqual(mock_popen.call_count, 4)
+        self.assertTrue(all(result.succeeded for result in first + second))
+
+    @patch('subprocess.Popen')
+    def test_skip_running(self, mock_popen):
+        """Test that running paths are skipped with one process table snapshot per launch."""
+        mock_popen.return_value = MagicMock(pid=1)
+        table = ProcessTable({"/opt/vpn": (77,)})
+        plan = compile_launch_plan(["/opt/vpn", "/opt/ide"], {"/opt/ide": ["/opt/vpn"]})
+
+        with patch.object(ProcessTable, "snapshot", return_value=table) as snapshot:
+            results = ProfileLauncher().launch_plan(plan, skip_running=True)
+
+        snapshot.assert_called_once_with()
+        mock_popen.assert_called_once_with(["/opt/ide"])
+        self.assertEqual((results[0].status, results[0].pid), (LAUNCH_ALREADY_RUNNING, 77))
+        self.assertTrue(results[1].succeeded)
+
+    @patch('subprocess.Popen')
+    def test_admission_limits_paths_in_flight(self, mock_popen):
+        """Test that paths wait for admission until the paths in flight are ready."""
+        in_flight = []
+        peak = []
+
+        def record_spawn(*_args, **_kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            time.sleep(0.01)
+            in_flight.pop()
+            return MagicMock(pid=1)
+        mock_popen.side_effect = record_spawn
+        admission = AdmissionController(AdmissionPolicy(max_in_flight=2), max_in_flight=8,
+                                        read_load=SystemLoad)
+
+        results = ProfileLauncher(max_workers=8).launch(
+            [f"app{index}.exe" for index in range(6)], admission=admission)
+
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(max(peak), 2)
+
@@ -0,0 +1,56 @@
+"""Tests for the in-memory profile model."""
+
+import json
+import unittest
+from src.service.model import PathEntry, Profile
+
+
+class TestModel(unittest.TestCase):
+    """Test suite for Profile and PathEntry."""
+
+    def test_round_trip(self):
+        """Test converting a profile from and to its stored format."""
+        data = {
+            "name": "Work",
+            "paths": ["C:/vpn.exe", "C:/ide.exe"],
+            "options": {"C:/ide.exe": {"after": ["C:/vpn.exe"],
+                                       "probes": [{"type": "tcp", "port": 5432}],
+                                       "restart": {"mode": "on-crash"}}},
+            "admission": {"max_in_flight": 2},
+        }
+
+        profile = Profile.from_dict(data)
+
+        self.assertEqual(profile.paths, ["C:/vpn.exe", "C:/ide.exe"])
+        self.assertEqual(profile.entries["C:/ide.exe"].after, ("C:/vpn.exe",))
+        self.assertEqual(profile.to_dict(), data)
+        self.assertEqual(Profile.from_dict(json.loads(json.dumps(profile.to_dict()))), profile)
+
+    def test_duplicate_paths_are_dropped(self):
+        """Test that a path is kept once, at its first position."""
+        profile = Profile.from_dict({"name": "Work", "paths": ["C:/a.exe", "C:/b.exe", "C:/a.exe"]})
+
+        self.assertEqual(profile.paths, ["C:/a.exe", "C:/b.exe"])
+
+    def test_paths_are_interned(self):
+        """Test that equal paths in different profiles share one string object."""
+        stored = json.loads('[{"name": "A", "paths": ["C:/shared.exe"]},'
+                            ' {"name": "B", "paths": ["C:/shared.exe"]}]')
+        first, second = (Profile.from_dict(data) for data in stored)
+
+        self.assertIs(first.paths[0], second.paths[0])
+        self.assertIs(first.entries["C:/shared.exe"], second.entries["C:/shared.exe"])
+
+    def test_with_options(self):
+        """Test that changing options creates a new entry and leaves shared ones alone."""
+        plain = PathEntry.create("C:/a.exe")
+        with_after = plain.with_options(after=["C:/b.exe"])
+
+        self.assertEqual(plain.after, ())
+        self.assertEqual(with_after.after, ("C:/b.exe",))
+        self.assertIs(with_after.with_options(after=()), plain)
+
+    def test_slots(self):
+        """Test that model objects carry no per-instance dictionary."""
+        self.assertFalse(hasattr(Profile("Work"), "__dict__"))
+        self.assertFalse(hasattr(PathEntry("C:/a.exe"), "__dict__"))
@@ -0,0 +1,39 @@
+"""Tests for the profile name search index."""
+
+import unittest
+from src.service.name_search import NameSearchIndex
+
+
+class TestNameSearchIndex(unittest.TestCase):
+    """Test suite for NameSearchIndex."""
+
+    def setUp(self):
+        self.index = NameSearchIndex(["Work", "Gaming", "Homework", "web dev", "Writing"])
+
+    def test_prefix_matches_come_first(self):
+        """Test that names starting with the query precede other matches."""
+        self.assertEqual(self.index.search("w"), ["web dev", "Work", "Writing", "Homework"])
+        self.assertEqual(self.index.search("work"), ["Work", "Homework"])
+
+    def test_substring_and_case(self):
+        """Test matching inside names, ignoring case, for short and long queries."""
+        self.assertEqual(self.index.search("MIN"), ["Gaming"])
+        self.assertEqual(self.index.search("mewor"), ["Homework"])
+        self.assertEqual(self.index.search("xyz"), [])
+
+    def test_empty_query_and_limit(self):
+        """Test that an empty query lists every name and that the limit applies."""
+        self.assertEqual(self.index.search(""),
+                         ["Gaming", "Homework", "web dev", "Work", "Writing"])
+        self.assertEqual(self.index.search("", limit=2), ["Gaming", "Homework"])
+        self.assertEqual(self.index.search("or", limit=1), ["Homework"])
+
+    def test_incremental_updates(self):
+        """Test that added and removed names are found or forgotten at once."""
+        self.index.remove("Homework")
+        self.index.add("Network")
+        self.index.remove("missing")
+
+        self.assertEqual(self.index.search("work"), ["Work", "Network"])
+        self.assertNotIn("Homework", self.index)
+        self.assertEqual(len(self.index), 5)
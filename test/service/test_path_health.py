@@ -0,0 +1,95 @@
+"""Tests for the path health cache."""
+
+import os
+import stat
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.constants.health import (
+    HEALTH_HEALTHY, HEALTH_MISSING, HEALTH_NOT_EXECUTABLE, HEALTH_UNKNOWN
+)
+from src.service import path_health
+from src.service.path_health import PathHealthCache
+
+
+@unittest.skipIf(os.name == "nt", "Windows has no executable permission bit")
+class TestPathHealthCache(unittest.TestCase):
+    """Test suite for PathHealthCache."""
+
+    def setUp(self):
+        """Create an executable, a plain file, a batch file and a directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.executable = self.create_file("app", stat.S_IRWXU)
+        self.plain_file = self.create_file("notes.txt", stat.S_IRUSR | stat.S_IWUSR)
+        self.batch_file = self.create_file("start.bat", stat.S_IRUSR | stat.S_IWUSR)
+        self.missing = os.path.join(self.temp_dir.name, "missing.exe")
+        self.cache = PathHealthCache(max_workers=4)
+
+    def tearDown(self):
+        """Remove the temporary files."""
+        self.temp_dir.cleanup()
+
+    def create_file(self, name, mode):
+        """Create a file with the given permissions."""
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w", encoding="utf-8") as created_file:
+            created_file.write("echo")
+        os.chmod(path, mode)
+        return path
+
+    def test_health(self):
+        """Test the health reported for every kind of path."""
+        results = self.cache.check_all([self.executable, self.plain_file, self.batch_file,
+                                        self.missing, self.temp_dir.name])
+
+        self.assertEqual(results, {
+            self.executable: HEALTH_HEALTHY,
+            self.plain_file: HEALTH_NOT_EXECUTABLE,
+            self.batch_file: HEALTH_HEALTHY,
+            self.missing: HEALTH_MISSING,
+            self.temp_dir.name: HEALTH_NOT_EXECUTABLE,
+        })
+        self.assertEqual(self.cache.get(self.missing), HEALTH_MISSING)
+        self.assertEqual(self.cache.get("C:/never/checked.exe"), HEALTH_UNKNOWN)
+
+    def test_only_changed_paths_are_assessed_again(self):
+        """Test that unchanged paths reuse their cached health."""
+        self.cache.check_all([self.executable, self.plain_file])
+        os.chmod(self.plain_file, stat.S_IRWXU)
+
+        with patch.object(path_health, "assess_path", wraps=path_health.assess_path) as assess:
+            results = self.cache.check_all([self.executable, self.plain_file])
+
+        assess.assert_called_once()
+        self.assertEqual(results[self.plain_file], HEALTH_HEALTHY)
+
+    def test_on_result_reports_changes_only(self):
+        """Test that the callback is only called for paths whose health changed."""
+        changes = []
+        self.cache.check_all([self.executable, self.missing])
+        os.remove(self.executable)
+
+        self.cache.check_all([self.executable, self.missing],
+                             on_result=lambda path, health: changes.append((path, health)))
+
+        self.assertEqual(changes, [(self.executable, HEALTH_MISSING)])
+
+    def test_bare_names_are_looked_up_on_path(self):
+        """Test that a program name is checked where PATH finds it, as the launcher runs it."""
+        with patch.dict(os.environ, {"PATH": self.temp_dir.name}):
+            results = self.cache.check_all(["app", "notes.txt", "unknown-program"])
+
+        self.assertEqual(results, {
+            "app": HEALTH_HEALTHY,
+            "notes.txt": HEALTH_MISSING,
+            "unknown-program": HEALTH_MISSING,
+        })
+
+    def test_retain(self):
+        """Test forgetting paths that are no longer used."""
+        self.cache.check_all([self.executable, self.missing])
+
+        self.cache.retain({self.executable})
+
+        self.assertEqual(self.cache.get(self.executable), HEALTH_HEALTHY)
+        self.assertEqual(self.cache.get(self.missing), HEALTH_UNKNOWN)
@@ -0,0 +1,57 @@
+"""Tests for the process table snapshot."""
+
+import os
+import tempfile
+import unittest
+from src.service.launcher import SpawnSpec
+from src.service.process_table import ProcessTable
+
+
+class TestProcessTable(unittest.TestCase):
+    """Test suite for ProcessTable."""
+
+    def setUp(self):
+        """Create a fake proc file system."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.proc_root = self.temp_dir.name
+        self.add_process(10, "/usr/bin/editor")
+        self.add_process(11, "/usr/bin/editor (deleted)")
+        self.add_process(12, "/opt/vpn")
+        os.makedirs(os.path.join(self.proc_root, "13"))  # Executable not readable
+        os.makedirs(os.path.join(self.proc_root, "self"))
+
+    def tearDown(self):
+        """Remove the fake proc file system."""
+        self.temp_dir.cleanup()
+
+    def add_process(self, pid, executable):
+        """Add a process running an executable."""
+        os.makedirs(os.path.join(self.proc_root, str(pid)))
+        os.symlink(executable, os.path.join(self.proc_root, str(pid), "exe"))
+
+    def test_snapshot(self):
+        """Test that processes are indexed by executable."""
+        table = ProcessTable.snapshot(self.proc_root)
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(sorted(table.pids("/usr/bin/editor")), [10, 11])
+        self.assertEqual(table.pids("/opt/vpn"), (12,))
+        self.assertEqual(table.pids("/opt/other"), ())
+
+    def test_find(self):
+        """Test looking up the program of a spawn spec."""
+        table = ProcessTable.snapshot(self.proc_root)
+
+        self.assertEqual(table.find(SpawnSpec("/opt/vpn", ["/opt/vpn"])), (12,))
+        self.assertEqual(table.find(SpawnSpec("/opt/vpn", "/opt/vpn", {"shell": True})), ())
+
+    def test_snapshot_without_proc(self):
+        """Test that nothing counts as running where the process table cannot be read."""
+        table = ProcessTable.snapshot(os.path.join(self.proc_root, "missing"))
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.find(SpawnSpec("/opt/vpn", ["/opt/vpn"])), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,9 +4,16 @@ import unittest
 import os
 import tempfile
 import json
+import shutil
+import sys
+import time
 from unittest.mock import patch, MagicMock
+from src.constants.health import HEALTH_HEALTHY, HEALTH_MISSING
+from src.constants.launch import LAUNCH_FAILED
+from src.constants.process import PROCESS_EXITED
 from src.service.profile_service import ProfileService
 from src.service.data_manager import ProfileManager
+from src.service.telemetry import LaunchHistory
 import subprocess
 
 
@@ -26,6 +33,8 @@ class TestProfileService(unittest.TestCase):
         # Initialize service with temporary file
         self.service = ProfileService()
         self.service.profiles = ProfileManager(file_path=self.temp_file.name)
+        self.history_file_path = f"{self.temp_file.name}.history"
+        self.service.history = LaunchHistory(file_path=self.history_file_path)
 
         self.test_profile_id = "test123"
         self.test_profile_name = "Test Profile"
@@ -37,8 +46,13 @@ class TestProfileService(unittest.TestCase):
         for profile_id in list(self.service.get_all_profiles().keys()):
             self.service.delete_profile(profile_id)
 
-        # Remove temporary file
+        # Remove temporary files
         os.unlink(self.temp_file.name)
+        for suffix in (".lock", ".version"):
+            if os.path.exists(self.temp_file.name + suffix):
+                os.unlink(self.temp_file.name + suffix)
+        if os.path.exists(self.history_file_path):
+            os.unlink(self.history_file_path)
 
         # Clean up actual profiles.json if it exists
         actual_profiles_path = os.path.join('data', 'profiles.json')
@@ -156,43 +170,45 @@ class TestProfileService(unittest.TestCase):
     def test_launch_all_paths_normal_exe(self, mock_popen):
         """Test launching normal .exe files."""
         # Setup mock
-        mock_process = MagicMock()
-        mock_popen.return_value.__enter__.return_value = mock_process
+        mock_process = MagicMock(pid=1234)
+        mock_popen.return_value = mock_process
 
         # Test data
         paths = ["C:/test/app1.exe", "C:/test/app2.exe"]
 
         # Execute
-        ProfileService.launch_all_paths_in_profile(paths)
+        results = ProfileService.launch_all_paths_in_profile(paths)
 
-        # Verify
+        # Verify processes are spawned without waiting for them to exit
         self.assertEqual(mock_popen.call_count, 2)
         mock_popen.assert_any_call([paths[0]])
         mock_popen.assert_any_call([paths[1]])
-        self.assertEqual(mock_process.wait.call_count, 2)
+        mock_process.wait.assert_not_called()
+        self.assertEqual([result.path for result in results], paths)
+        self.assertEqual([result.pid for result in results], [1234, 1234])
 
     @patch('subprocess.Popen')
     def test_launch_all_paths_rdp_bat(self, mock_popen):
         """Test launching .rdp and .bat files."""
         # Setup mock
-        mock_process = MagicMock()
-        mock_popen.return_value.__enter__.return_value = mock_process
+        mock_process = MagicMock(pid=1234)
+        mock_popen.return_value = mock_process
 
         # Test data
         paths = ["C:/test/script.bat", "C:/test/remote.rdp"]
 
         # Execute
-        ProfileService.launch_all_paths_in_profile(paths)
+        results = ProfileService.launch_all_paths_in_profile(paths)
 
         # Verify
         self.assertEqual(mock_popen.call_count, 2)
         mock_popen.assert_any_call(paths[0], shell=True)
         mock_popen.assert_any_call(paths[1], shell=True)
-        self.assertEqual(mock_process.wait.call_count, 2)
+        mock_process.wait.assert_not_called()
+        self.assertTrue(all(result.succeeded for result in results))
 
     @patch('subprocess.Popen')
-    @patch('builtins.print')
-    def test_launch_all_paths_error(self, mock_print, mock_popen):
+    def test_launch_all_paths_error(self, mock_popen):
         """Test handling of subprocess errors."""
         # Setup mock to raise an error
         mock_popen.side_effect = subprocess.CalledProcessError(1, "test")
@@ -201,8 +217,150 @@ class TestProfileService(unittest.TestCase):
         paths = ["C:/test/error.exe"]
 
         # Execute
-        ProfileService.launch_all_paths_in_profile(paths)
+        with self.assertLogs("ProfileService", level="ERROR") as logs:
+            results = ProfileService.launch_all_paths_in_profile(paths)
+
+        # Verify error was handled, logged and reported in the result
+        self.assertEqual(len(logs.output), 1)
+        self.assertIsNone(results[0].pid)
+        self.assertIsNotNone(results[0].error)
+ 
+    @patch('subprocess.Popen')
+    def test_launch_profile_uses_dependencies(self, mock_popen):
+        """Test that a stored profile launches in dependency order."""
+        spawned = []
+
+        def record_spawn(args, **_kwargs):
+            spawned.append(args[0])
+            return MagicMock(pid=1, **{"poll.return_value": None})
+        mock_popen.side_effect = record_spawn
+
+        self.service.create_profile(self.test_profile_id, self.test_profile_name)
+        self.service.add_path_to_profile(self.test_profile_id, "C:/ide.exe")
+        self.service.add_path_to_profile(self.test_profile_id, "C:/vpn.exe")
+        self.assertTrue(self.service.set_path_dependencies(
+            self.test_profile_id, "C:/ide.exe", ["C:/vpn.exe"]))
+
+        results = self.service.launch_profile(self.test_profile_id)
+
+        self.assertEqual(spawned, ["C:/vpn.exe", "C:/ide.exe"])
+        self.assertEqual([result.path for result in results], ["C:/ide.exe", "C:/vpn.exe"])
+
+    @patch('subprocess.Popen')
+    def test_launch_profile_skips_unhealthy_paths(self, mock_popen):
+        """Test that paths found missing by the health check are not spawned."""
+        mock_popen.return_value = MagicMock(pid=1, **{"poll.return_value": None})
+        self.service.create_profile(self.test_profile_id, self.test_profile_name)
+        self.service.add_path_to_profile(self.test_profile_id, self.test_path)
+        self.service.add_path_to_profile(self.test_profile_id, sys.executable)
+
+        health = self.service.check_path_health()
+        results = self.service.launch_profile(self.test_profile_id)
+
+        self.assertEqual(health, {self.test_path: HEALTH_MISSING,
+                                  sys.executable: HEALTH_HEALTHY})
+        mock_popen.assert_called_once_with([sys.executable])
+        self.assertEqual(results[0].status, LAUNCH_FAILED)
+        self.assertEqual(results[0].error, "Path is missing")
+        self.assertTrue(results[1].succeeded)
+
+    def test_launch_plan_is_cached_until_the_profile_changes(self):
+        """Test that launch plans are compiled again only for changed profiles."""
+        self.service.create_profile(self.test_profile_id, self.test_profile_name)
+        self.service.create_profile("other", "Other")
+        self.service.add_path_to_profile(self.test_profile_id, "C:/vpn.exe")
+
+        plan = self.service.get_launch_plan(self.test_profile_id)
+        self.service.add_path_to_profile("other", self.test_path)
+        self.assertIs(self.service.get_launch_plan(self.test_profile_id), plan)
+
+        self.service.add_path_to_profile(self.test_profile_id, "C:/ide.exe")
+        self.service.set_path_dependencies(self.test_profile_id, "C:/ide.exe", ["C:/vpn.exe"])
+        changed = self.service.get_launch_plan(self.test_profile_id)
+        self.assertIsNot(changed, plan)
+        self.assertEqual(changed.start_after["C:/ide.exe"], ("C:/vpn.exe",))
+
+        other_process = ProfileManager(file_path=self.temp_file.name)
+        other_process.remove_path_from_profile(self.test_profile_id, "C:/ide.exe")
+        self.assertEqual(self.service.get_launch_plan(self.test_profile_id).paths,
+                         ("C:/vpn.exe",))
+
+    def test_admission_policy_overrides(self):
+        """Test that profiles override the admission defaults and invalid settings are rejected."""
+        self.service.create_profile(self.test_profile_id, self.test_profile_name)
+
+        with self.assertRaises(ValueError):
+            self.service.set_profile_admission(self.test_profile_id, {"max_in_flight": 0})
+        self.assertIsNone(self.service.get_admission_policy(self.test_profile_id).max_in_flight)
+        self.assertTrue(self.service.set_profile_admission(
+            self.test_profile_id, {"max_in_flight": 2, "max_load_per_cpu": 3}))
+        policy = self.service.get_admission_policy(self.test_profile_id)
+        self.assertEqual((policy.max_in_flight, policy.max_load_per_cpu), (2, 3))
+
+    def test_set_invalid_path_probes(self):
+        """Test that invalid probe configurations are rejected."""
+        self.service.create_profile(self.test_profile_id, self.test_profile_name)
+        self.service.add_path_to_profile(self.test_profile_id, self.test_path)
+
+        with self.assertRaises(ValueError):
+            self.service.set_path_probes(self.test_profile_id, self.test_path, [{"type": "bad"}])
+        self.assertTrue(self.service.set_path_probes(
+            self.test_profile_id, self.test_path, [{"type": "alive", "delay_ms": 100}]))
+        self.assertEqual(
+            self.service.get_path_probes(self.test_profile_id),
+            {self.test_path: [{"type": "alive", "delay_ms": 100}]}
+        )
+
+    @unittest.skipUnless(shutil.which("true"), "needs the true command")
+    def test_launch_profile_supervises_processes(self):
+        """Test that supervised launches restart crashed paths with their policy."""
+        self.service.create_profile(self.test_profile_id, self.test_profile_name)
+        self.service.add_path_to_profile(self.test_profile_id, "true")
+        with self.assertRaises(ValueError):
+            self.service.set_path_restart_policy(
+                self.test_profile_id, "true", {"mode": "sometimes"})
+        self.assertTrue(self.service.set_path_restart_policy(
+            self.test_profile_id, "true",
+            {"mode": "always", "max_restarts": 1, "backoff": 0}))
+
+        try:
+            results = self.service.launch_profile(self.test_profile_id, supervise=True)
+            results[0].process.wait()
+            for _ in range(200):
+                state = self.service.get_process_states()["true"]
+                if state.restarts and state.status == PROCESS_EXITED:
+                    break
+                time.sleep(0.01)
+        finally:
+            self.service.stop_supervising()
+
+        self.assertEqual(state.restarts, 1)
+        self.assertEqual(state.status, PROCESS_EXITED)
+        self.assertEqual(state.exit_code, 0)
+
+    @patch('subprocess.Popen')
+    def test_launch_profile_records_history(self, mock_popen):
+        """Test that launching a profile appends to the launch history."""
+        mock_popen.return_value = MagicMock(pid=1, **{"poll.return_value": None})
+        self.service.create_profile(self.test_profile_id, self.test_profile_name)
+        self.service.add_path_to_profile(self.test_profile_id, self.test_path)
+
+        self.service.launch_profile(self.test_profile_id)
+        self.service.launch_profile(self.test_profile_id)
+
+        per_path = self.service.get_launch_report("path")
+        per_profile = self.service.get_launch_report("profile")
+        self.assertEqual(per_path[self.test_path]["count"], 2)
+        self.assertEqual(per_profile[self.test_profile_id]["count"], 2)
+
+    def test_add_paths_to_profile(self):
+        """Test adding several paths with a single write."""
+        self.service.create_profile(self.test_profile_id, self.test_profile_name)
+        paths = ["C:/path1.exe", "C:/path2.exe"]
+
+        with patch.object(self.service.profiles, "_write_data") as write_data:
+            self.assertTrue(self.service.add_paths_to_profile(self.test_profile_id, paths))
 
-        # Verify error was handled and printed
-        mock_print.assert_called_once()
- 
\ No newline at end of file
+        write_data.assert_called_once()
+        self.assertEqual(self.service.get_paths_for_profile(self.test_profile_id), paths)
+        self.assertFalse(self.service.add_paths_to_profile("missing", paths))
@@ -0,0 +1,117 @@
+"""Tests for the launch readiness probes."""
+
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from src.service.readiness import (
+    PathExistsProbe, ProcessAliveProbe, ReadinessProbe, TcpPortProbe,
+    probe_from_config, register_probe_type
+)
+
+
+class TestReadiness(unittest.TestCase):
+    """Test suite for readiness probes and their configuration."""
+
+    def test_path_exists_probe(self):
+        """Test that the path probe passes once the file exists."""
+        with tempfile.TemporaryDirectory() as directory:
+            marker = os.path.join(directory, "ready.sock")
+            probe = PathExistsProbe(marker, timeout=2, interval=0.01)
+            threading.Timer(0.05, lambda: open(marker, "w", encoding="utf-8").close()).start()
+
+            self.assertTrue(probe.wait(None))
+
+    def test_path_exists_probe_times_out(self):
+        """Test that the path probe fails after its timeout."""
+        probe = PathExistsProbe("/nonexistent/ready.sock", timeout=0.05, interval=0.01)
+
+        self.assertFalse(probe.wait(None))
+
+    def test_tcp_port_probe(self):
+        """Test that the TCP probe passes when the port accepts connections."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            probe = TcpPortProbe(server.getsockname()[1], timeout=1)
+
+            self.assertTrue(probe.wait(None))
+
+    def test_process_alive_probe(self):
+        """Test that the alive probe passes for a running process only."""
+        running = MagicMock()
+        running.poll.return_value = None
+        exited = MagicMock()
+        exited.poll.return_value = 1
+
+        self.assertTrue(ProcessAliveProbe(delay_ms=20, interval=0.01).wait(running))
+        self.assertFalse(ProcessAliveProbe(delay_ms=20, interval=0.01).wait(exited))
+
+    def test_process_alive_probe_fails_when_process_exits(self):
+        """Test that the alive probe fails as soon as the process exits during the delay."""
+        process = MagicMock()
+        process.poll.side_effect = [None, None, 1]
+        probe = ProcessAliveProbe(delay_ms=5000, interval=0.01)
+
+        self.assertFalse(probe.wait(process, threading.Event()))
+        self.assertEqual(process.poll.call_count, 3)
+
+    def test_process_alive_probe_is_reusable(self):
+        """Test that concurrent waits on a shared alive probe each wait the full delay."""
+        running = MagicMock()
+        running.poll.return_value = None
+        probe = ProcessAliveProbe(delay_ms=200, interval=0.01)
+        state = dict(vars(probe))
+        durations = []
+
+        def timed_wait():
+            start = time.monotonic()
+            self.assertTrue(probe.wait(running))
+            durations.append(time.monotonic() - start)
+        first = threading.Thread(target=timed_wait)
+        first.start()
+        time.sleep(0.1)
+        timed_wait()
+        first.join()
+
+        self.assertEqual(len(durations), 2)
+        self.assertTrue(all(duration >= 0.2 for duration in durations))
+        self.assertEqual(vars(probe), state)
+
+    def test_wait_aborts_on_cancel(self):
+        """Test that a cancelled launch stops waiting for readiness."""
+        cancel_event = threading.Event()
+        cancel_event.set()
+        probe = PathExistsProbe("/nonexistent/ready.sock", timeout=5, interval=0.01)
+
+        self.assertFalse(probe.wait(None, cancel_event))
+
+    def test_probe_from_config(self):
+        """Test creating probes from stored configuration."""
+        probe = probe_from_config({"type": "tcp", "port": 5432, "timeout": 10})
+
+        self.assertIsInstance(probe, TcpPortProbe)
+        self.assertEqual(probe.port, 5432)
+        self.assertEqual(probe.timeout, 10)
+
+    def test_probe_from_invalid_config(self):
+        """Test that unknown types and arguments are rejected."""
+        with self.assertRaises(ValueError):
+            probe_from_config({"type": "unknown"})
+        with self.assertRaises(ValueError):
+            probe_from_config({"type": "path", "unexpected": True})
+
+    def test_register_probe_type(self):
+        """Test plugging in a custom probe type."""
+        class AlwaysReadyProbe(ReadinessProbe):
+            """Probe that is always ready."""
+
+            def check(self, process):
+                return True
+
+        register_probe_type("always", AlwaysReadyProbe)
+
+        self.assertTrue(probe_from_config({"type": "always"}).wait(None))
@@ -31,8 +31,11 @@ class TestSettingsService(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test environment."""
-        # Remove temporary file
+        # Remove temporary file and its lock and version sidecars
         os.unlink(self.temp_file.name)
+        for suffix in (".lock", ".version"):
+            if os.path.exists(self.temp_file.name + suffix):
+                os.unlink(self.temp_file.name + suffix)
 
     def test_update_and_get_appearance(self):
         """Test updating and retrieving appearance setting."""
@@ -57,3 +60,27 @@ class TestSettingsService(unittest.TestCase):
         # Verify default values
         self.assertIsNone(self.service.get_user_app_appearance())
         self.assertIsNone(self.service.get_current_user_profile())
+
+    def test_update_and_get_launch_workers(self):
+        """Test updating and retrieving the launch worker count."""
+        self.assertIsNone(self.service.get_launch_workers())
+
+        self.service.update_launch_workers(4)
+
+        self.assertEqual(self.service.get_launch_workers(), 4)
+
+    def test_update_and_get_skip_running(self):
+        """Test updating and retrieving whether running paths are skipped."""
+        self.assertIsNone(self.service.get_skip_running())
+
+        self.service.update_skip_running(False)
+
+        self.assertFalse(self.service.get_skip_running())
+
+    def test_update_and_get_window_geometry(self):
+        """Test remembering the main window geometry."""
+        self.assertIsNone(self.service.get_window_geometry())
+
+        self.service.update_window_geometry("900x550+10+20")
+
+        self.assertEqual(self.service.get_window_geometry(), "900x550+10+20")
@@ -0,0 +1,404 @@
+"""Tests for the storage engines behind the data managers."""
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.service.data_manager import ProfileManager, SettingsManager
+from src.service.storage import (
+    STORAGE_JOURNAL, STORAGE_LAZY, STORAGE_MODE_ENV, STORAGE_SQLITE, JournalStorage,
+    JsonStorage, LazyJsonStorage, SqliteProfileStorage, SqliteStorage, create_storage
+)
+
+
+class TestStorage(unittest.TestCase):
+    """Test suite for JsonStorage, JournalStorage and create_storage."""
+
+    def setUp(self):
+        """Set up a temporary data directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        # Registered first, so it runs after every storage is closed
+        self.addCleanup(self.temp_dir.cleanup)
+        self.file_path = os.path.join(self.temp_dir.name, "profiles.json")
+
+    def opened(self, storage):
+        """Close a storage engine on cleanup.
+
+        Args:
+            storage: Storage engine opened by the test.
+
+        Returns:
+            The storage engine.
+        """
+        self.addCleanup(storage.close)
+        return storage
+
+    def open_profile_storage(self):
+        """Open a SQLite profile storage in the temporary directory.
+
+        Returns:
+            SqliteProfileStorage: The opened storage, closed on cleanup.
+        """
+        return self.opened(SqliteProfileStorage(self.file_path))
+
+    def test_json_storage_round_trip(self):
+        """Test that the JSON engine writes the whole store atomically."""
+        storage = self.opened(JsonStorage(self.file_path))
+        storage.commit({"a": 1, "b": [2]}, {"a"})
+
+        self.assertEqual(storage.load(), {"a": 1, "b": [2]})
+        self.assertFalse(os.path.exists(f"{self.file_path}.tmp"))
+
+    def test_journal_appends_changed_keys_only(self):
+        """Test that a commit appends one record per changed key and leaves the snapshot alone."""
+        storage = self.opened(JournalStorage(self.file_path))
+        data = {"a": 1, "b": 2}
+        storage.commit(data, {"a", "b"})
+        data["a"] = 3
+        del data["b"]
+        storage.commit(data, {"a", "b"})
+
+        with open(storage.journal_path, "r", encoding="utf-8") as journal_file:
+            records = [json.loads(line) for line in journal_file]
+        self.assertEqual(len(records), 4)
+        self.assertFalse(os.path.exists(self.file_path))
+        self.assertEqual(self.opened(JournalStorage(self.file_path)).load(), {"a": 3})
+
+    def test_journal_ignores_truncated_record(self):
+        """Test that a record cut short by a crash does not break loading."""
+        storage = self.opened(JournalStorage(self.file_path))
+        storage.commit({"a": 1}, {"a"})
+        with open(storage.journal_path, "a", encoding="utf-8") as journal_file:
+            journal_file.write('{"k":"a","v":')
+
+        self.assertEqual(self.opened(JournalStorage(self.file_path)).load(), {"a": 1})
+
+    def test_journal_commit_after_truncated_record(self):
+        """Test that a commit after a record cut short by a crash is not lost."""
+        storage = self.opened(JournalStorage(self.file_path))
+        storage.commit({"a": 1}, {"a"})
+        with open(storage.journal_path, "a", encoding="utf-8") as journal_file:
+            journal_file.write('{"k":"b","v":')
+
+        recovered = self.opened(JournalStorage(self.file_path))
+        data = recovered.load()
+        data["c"] = 3
+        recovered.commit(data, {"c"})
+
+        self.assertEqual(self.opened(JournalStorage(self.file_path)).load(), {"a": 1, "c": 3})
+
+    def test_journal_compaction(self):
+        """Test that a large journal is folded into a snapshot."""
+        storage = self.opened(JournalStorage(self.file_path, compact_bytes=200))
+        data = {}
+        for index in range(20):
+            data[f"key{index}"] = index
+            storage.commit(data, {f"key{index}"})
+        storage.wait_for_compaction()
+
+        with open(self.file_path, "r", encoding="utf-8") as snapshot_file:
+            self.assertGreater(len(json.load(snapshot_file)), 0)
+        self.assertFalse(os.path.exists(storage.rotated_journal_path))
+        self.assertLess(os.path.getsize(storage.journal_path), 200)
+        self.assertEqual(self.opened(JournalStorage(self.file_path)).load(), data)
+
+    def test_journal_recovers_interrupted_compaction(self):
+        """Test that a rotated journal left by a crash is replayed and then folded in."""
+        storage = self.opened(JournalStorage(self.file_path, compact_bytes=50))
+        storage.commit({"a": 1}, {"a"})
+        os.replace(storage.journal_path, storage.rotated_journal_path)
+
+        recovered = self.opened(JournalStorage(self.file_path, compact_bytes=50))
+        data = recovered.load()
+        self.assertEqual(data, {"a": 1})
+        data["b"] = "x" * 60
+        recovered.commit(data, {"b"})
+        recovered.wait_for_compaction()
+
+        self.assertFalse(os.path.exists(recovered.rotated_journal_path))
+        self.assertEqual(self.opened(JournalStorage(self.file_path)).load(), data)
+
+    def test_journal_load_retries_after_compaction(self):
+        """Test that a load that races a compaction of another process starts over."""
+        storage = self.opened(JournalStorage(self.file_path))
+        storage.commit({"a": 1, "b": 2}, {"a", "b"})
+        os.replace(storage.journal_path, storage.rotated_journal_path)
+        replay = JournalStorage._replay  # pylint: disable=protected-access
+        replays = []
+
+        def compact_during_replay(reader):
+            replays.append(reader)
+            if len(replays) > 1:
+                return replay(reader)
+            # The old snapshot was read, then the journal was folded in before its replay
+            reader._write_snapshot(json.dumps({"a": 1, "b": 2}))  # pylint: disable=protected-access
+            return {}
+
+        with patch.object(JournalStorage, "_replay", compact_during_replay):
+            self.assertEqual(storage.load(), {"a": 1, "b": 2})
+        self.assertEqual(len(replays), 2)
+
+    def test_journal_compaction_skips_folded_journal(self):
+        """Test that a pending compaction does not overwrite a newer snapshot."""
+        first = self.opened(JournalStorage(self.file_path, compact_bytes=50))
+        second = self.opened(JournalStorage(self.file_path, compact_bytes=50))
+        with first.version.lock():
+            # The compaction thread of first waits for the lock held by this commit
+            first.commit({"a": "x" * 60}, {"a"})
+            data = second.load()
+            data["b"] = "y" * 60
+            second.commit(data, {"b"})
+        first.wait_for_compaction()
+
+        with open(self.file_path, "r", encoding="utf-8") as snapshot_file:
+            self.assertEqual(json.load(snapshot_file), data)
+        self.assertEqual(self.opened(JournalStorage(self.file_path)).load(), data)
+
+    def test_create_storage(self):
+        """Test selecting the storage engine by mode and environment."""
+        for mode, engine in ((None, JsonStorage), (STORAGE_JOURNAL, JournalStorage),
+                             (STORAGE_LAZY, LazyJsonStorage)):
+            self.assertIsInstance(self.opened(create_storage(self.file_path, mode)), engine)
+        with patch.dict(os.environ, {STORAGE_MODE_ENV: STORAGE_JOURNAL}):
+            self.assertIsInstance(self.opened(create_storage(self.file_path)), JournalStorage)
+        with self.assertRaises(ValueError):
+            create_storage(self.file_path, "unknown")
+
+    def test_profile_manager_in_journal_mode(self):
+        """Test that profiles survive a reload in journal mode."""
+        manager = ProfileManager(file_path=self.file_path, storage=STORAGE_JOURNAL)
+        self.addCleanup(manager.storage.close)
+        manager.add_profile("id1", "Work")
+        manager.add_path_to_profile("id1", "C:/ide.exe")
+        manager.change_profile_name("id1", "Office")
+
+        reloaded = ProfileManager(file_path=self.file_path, storage=STORAGE_JOURNAL)
+        self.addCleanup(reloaded.storage.close)
+
+        self.assertEqual(reloaded.data["id1"].to_dict(), {"name": "Office", "paths": ["C:/ide.exe"]})
+
+    def test_sqlite_settings_round_trip(self):
+        """Test storing JSON values in the SQLite settings table."""
+        storage = self.opened(SqliteStorage(os.path.join(self.temp_dir.name, "settings.json")))
+        data = {"appearance": "Dark", "launch_workers": 4}
+        storage.commit(data, {"appearance", "launch_workers"})
+        del data["launch_workers"]
+        storage.commit(data, {"launch_workers"})
+
+        self.assertEqual(storage.load(), {"appearance": "Dark"})
+
+    def test_sqlite_profiles_round_trip(self):
+        """Test that profiles, ordered paths and options survive a reload."""
+        storage = self.open_profile_storage()
+        data = {
+            "id1": {"name": "Work", "paths": ["C:/b.exe", "C:/a.exe"],
+                    "options": {"C:/a.exe": {"after": ["C:/b.exe"]}}},
+            "id2": {"name": "Games", "paths": []},
+        }
+        storage.commit(data, {"id1", "id2"})
+
+        self.assertEqual(self.open_profile_storage().load(), data)
+
+    def test_sqlite_commit_touches_changed_rows_only(self):
+        """Test that committing one profile leaves the rows of other profiles alone."""
+        storage = self.open_profile_storage()
+        data = {"id1": {"name": "Work", "paths": ["C:/a.exe"]},
+                "id2": {"name": "Games", "paths": ["C:/game.exe"]}}
+        storage.commit(data, {"id1", "id2"})
+        changes_before = storage.connection.total_changes
+
+        data["id1"]["paths"].append("C:/b.exe")
+        storage.commit(data, {"id1"})
+
+        # One placeholder name, one profile upsert, one delete of its single
+        # path row, two path inserts and the version of the table
+        self.assertEqual(storage.connection.total_changes - changes_before, 6)
+        del data["id2"]
+        storage.commit(data, {"id2"})
+        self.assertEqual(self.open_profile_storage().load(), data)
+
+    def test_sqlite_profile_names_are_unique(self):
+        """Test the uniqueness constraint on profile names."""
+        storage = self.open_profile_storage()
+        storage.commit({"id1": {"name": "Work", "paths": []}}, {"id1"})
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            storage.commit({"id2": {"name": "Work", "paths": []}}, {"id2"})
+
+    def test_sqlite_commit_swaps_profile_names(self):
+        """Test that names can move between profiles within one commit."""
+        storage = self.open_profile_storage()
+        data = {"a": {"name": "A", "paths": []}, "b": {"name": "B", "paths": []}}
+        storage.commit(data, {"a", "b"})
+
+        data["a"]["name"], data["b"]["name"] = "B", "A"
+        storage.commit(data, {"a", "b"})
+
+        self.assertEqual(self.open_profile_storage().load(), data)
+
+    def test_sqlite_manager_swaps_names_in_transaction(self):
+        """Test swapping two profile names through a temporary name in one transaction."""
+        manager = ProfileManager(file_path=self.file_path, storage=STORAGE_SQLITE)
+        self.addCleanup(manager.storage.close)
+        manager.add_profile("a", "A")
+        manager.add_profile("b", "B")
+
+        with manager.transaction():
+            manager.change_profile_name("a", "T")
+            manager.change_profile_name("b", "A")
+            manager.change_profile_name("a", "B")
+
+        stored = self.open_profile_storage().load()
+        self.assertEqual((stored["a"]["name"], stored["b"]["name"]), ("B", "A"))
+
+    def test_failed_commit_restores_stored_state(self):
+        """Test that a commit the engine rejects leaves the manager usable."""
+        manager = ProfileManager(file_path=self.file_path, storage=STORAGE_SQLITE)
+        self.addCleanup(manager.storage.close)
+        manager.add_profile("id1", "Work")
+
+        with patch.object(SqliteProfileStorage, "_write_row", side_effect=sqlite3.OperationalError):
+            with self.assertRaises(sqlite3.OperationalError):
+                manager.add_profile("id2", "Games")
+
+        self.assertEqual(manager.get_profile_names(), ["Work"])
+        self.assertIsNone(manager.find_profile_id("Games"))
+        self.assertTrue(manager.add_profile("id2", "Games"))
+        self.assertEqual(self.open_profile_storage().load()["id2"]["name"], "Games")
+
+    def test_sqlite_migrates_json_once(self):
+        """Test the one-shot migration of an existing JSON file."""
+        with open(self.file_path, "w", encoding="utf-8") as json_file:
+            json.dump({"id1": {"name": "Work", "paths": ["C:/a.exe"]},
+                       "id2": {"name": "Work", "paths": []}}, json_file)
+
+        storage = self.open_profile_storage()
+        data = storage.load()
+        self.assertEqual(data["id1"], {"name": "Work", "paths": ["C:/a.exe"]})
+        self.assertEqual(data["id2"]["name"], "Work (2)")
+
+        del data["id2"]
+        storage.commit(data, {"id2"})
+        self.assertNotIn("id2", self.open_profile_storage().load())
+
+    def test_managers_in_sqlite_mode(self):
+        """Test the manager API on top of the SQLite engines."""
+        profiles = ProfileManager(file_path=self.file_path, storage=STORAGE_SQLITE)
+        settings = SettingsManager(
+            file_path=os.path.join(self.temp_dir.name, "settings.json"), storage=STORAGE_SQLITE)
+        self.addCleanup(profiles.storage.close)
+        self.addCleanup(settings.storage.close)
+        profiles.add_profile("id1", "Work")
+        profiles.add_path_to_profile("id1", "C:/ide.exe")
+        settings.add_entry("appearance", "Light")
+
+        self.assertEqual(profiles.storage.database_path, settings.storage.database_path)
+        reloaded = ProfileManager(file_path=self.file_path, storage=STORAGE_SQLITE)
+        self.addCleanup(reloaded.storage.close)
+        self.assertEqual(reloaded.get_entry("id1").to_dict(), {"name": "Work", "paths": ["C:/ide.exe"]})
+
+    def test_sqlite_versions_are_per_table(self):
+        """Test that settings commits don't make profile managers reload."""
+        profiles = ProfileManager(file_path=self.file_path, storage=STORAGE_SQLITE)
+        settings = SettingsManager(
+            file_path=os.path.join(self.temp_dir.name, "settings.json"), storage=STORAGE_SQLITE)
+        other = ProfileManager(file_path=self.file_path, storage=STORAGE_SQLITE)
+        for manager in (profiles, settings, other):
+            self.addCleanup(manager.storage.close)
+
+        with patch.object(ProfileManager, "_reload") as reload:
+            settings.add_entry("current_profile", "id1")
+            settings.update_entry("appearance", "Dark")
+            self.assertFalse(profiles.refresh())
+            reload.assert_not_called()
+
+        other.add_profile("id1", "Work")
+        self.assertTrue(profiles.refresh())
+        self.assertEqual(profiles.get_profile_names(), ["Work"])
+        self.assertFalse(other.refresh())
+
+    def test_lazy_storage_decodes_on_access(self):
+        """Test that lazy mode reads names from the index and decodes only accessed profiles."""
+        manager = ProfileManager(file_path=self.file_path, storage=STORAGE_LAZY)
+        self.addCleanup(manager.storage.close)
+        with manager.transaction():
+            for index in range(3):
+                manager.add_profile(f"id{index}", f"Profile {index}")
+                manager.add_path_to_profile(f"id{index}", f"C:/app{index}.exe")
+
+        reloaded = ProfileManager(file_path=self.file_path, storage=STORAGE_LAZY)
+        self.addCleanup(reloaded.storage.close)
+
+        self.assertEqual(reloaded.get_profile_names(), ["Profile 0", "Profile 1", "Profile 2"])
+        self.assertEqual(reloaded.find_profile_id("Profile 2"), "id2")
+        self.assertFalse(any(reloaded.data.is_loaded(key) for key in reloaded.data))
+        self.assertEqual(reloaded.data["id1"].paths, ["C:/app1.exe"])
+        self.assertEqual([reloaded.data.is_loaded(key) for key in reloaded.data],
+                         [False, True, False])
+
+    def test_lazy_storage_reuses_index(self):
+        """Test that the sidecar index is reused until the document changes."""
+        storage = self.opened(LazyJsonStorage(self.file_path, index_fields=("name",)))
+        storage.commit({"id1": {"name": "Work", "paths": []}}, {"id1"})
+        storage.close()
+
+        with patch.object(LazyJsonStorage, "_scan") as scan:
+            data = self.opened(LazyJsonStorage(self.file_path, index_fields=("name",))).load()
+        scan.assert_not_called()
+        self.assertEqual(data.summary("id1"), {"name": "Work"})
+
+    def test_lazy_storage_indexes_foreign_document(self):
+        """Test loading a document written by the JSON engine, with non-ASCII text."""
+        stored = {"id1": {"name": "Büro", "paths": ["C:/Ärzte/app.exe"]},
+                  "id2": {"name": "Games", "paths": []}}
+        with open(self.file_path, "w", encoding="utf-8") as json_file:
+            json.dump(stored, json_file, indent=2, ensure_ascii=False)
+
+        storage = self.opened(LazyJsonStorage(self.file_path, index_fields=("name",)))
+        data = storage.load()
+
+        self.assertEqual(data.summary("id2"), {"name": "Games"})
+        self.assertEqual(dict(data), stored)
+
+    def test_lazy_storage_commit_keeps_unloaded_entries(self):
+        """Test that a commit copies entries that were never decoded."""
+        storage = self.opened(LazyJsonStorage(self.file_path))
+        storage.commit({"a": {"x": 1}, "b": [1, 2], "c": "text"}, {"a", "b", "c"})
+
+        data = storage.load()
+        data["b"] = [3]
+        del data["c"]
+        storage.commit(data, {"b", "c"})
+        self.assertFalse(data.is_loaded("a"))
+        self.assertEqual(data["a"], {"x": 1})
+        storage.close()
+
+        with open(self.file_path, "r", encoding="utf-8") as json_file:
+            self.assertEqual(json.load(json_file), {"a": {"x": 1}, "b": [3]})
+
+    def test_lazy_managers_commit_in_turn(self):
+        """Test that two lazy mode managers replace the document the other one loaded."""
+        first = ProfileManager(file_path=self.file_path, storage=STORAGE_LAZY)
+        second = ProfileManager(file_path=self.file_path, storage=STORAGE_LAZY)
+        self.addCleanup(first.storage.close)
+        self.addCleanup(second.storage.close)
+
+        first.add_profile("id1", "Work")
+        second.add_profile("id2", "Games")
+        first.add_path_to_profile("id1", "C:/ide.exe")
+
+        self.assertEqual(second.get_profile_names(), ["Work", "Games"])
+        self.assertEqual(second.data["id1"].paths, ["C:/ide.exe"])
+        self.assertEqual(first.find_profile_id("Games"), "id2")
+
+    def test_sqlite_managers_stay_coherent(self):
+        """Test that SQLite managers notice commits of other connections."""
+        first = ProfileManager(file_path=self.file_path, storage=STORAGE_SQLITE)
+        second = ProfileManager(file_path=self.file_path, storage=STORAGE_SQLITE)
+        self.addCleanup(first.storage.close)
+        self.addCleanup(second.storage.close)
+
+        first.add_profile("id1", "Work")
+        self.assertEqual(second.find_profile_id("Work"), "id1")
@@ -0,0 +1,149 @@
+"""Tests for the process supervisor."""
+
+import subprocess
+import sys
+import time
+import unittest
+from unittest.mock import patch
+from src.constants.process import (
+    PROCESS_CRASHED, PROCESS_EXITED, PROCESS_RUNNING, RESTART_ALWAYS, RESTART_ON_CRASH
+)
+from src.service import supervisor
+from src.service.launcher import SpawnSpec, spawn
+from src.service.supervisor import ProcessSupervisor, RestartPolicy
+
+
+def python_spec(path, code):
+    """Get a spec that runs a Python snippet."""
+    return SpawnSpec(path, [sys.executable, "-c", code])
+
+
+class TestRestartPolicy(unittest.TestCase):
+    """Test suite for RestartPolicy."""
+
+    def test_should_restart(self):
+        """Test the restart decision of every mode."""
+        on_crash = RestartPolicy(mode=RESTART_ON_CRASH, max_restarts=2)
+        self.assertTrue(on_crash.should_restart(1, 0))
+        self.assertTrue(on_crash.should_restart(None, 1))
+        self.assertFalse(on_crash.should_restart(0, 0))
+        self.assertFalse(on_crash.should_restart(1, 2))
+        self.assertTrue(RestartPolicy(mode=RESTART_ALWAYS).should_restart(0, 0))
+        self.assertFalse(RestartPolicy().should_restart(1, 0))
+
+    def test_delay_backs_off_exponentially(self):
+        """Test that the delay doubles up to the maximum."""
+        policy = RestartPolicy(backoff=0.5, max_backoff=3)
+        self.assertEqual([policy.delay(attempts) for attempts in range(5)],
+                         [0.5, 1, 2, 3, 3])
+
+    def test_from_config(self):
+        """Test that invalid configurations raise ValueError."""
+        self.assertEqual(RestartPolicy.from_config({"mode": "on-crash"}).mode, RESTART_ON_CRASH)
+        for config in ({"mode": "sometimes"}, {"retries": 3}, {"backoff": -1}):
+            with self.assertRaises(ValueError):
+                RestartPolicy.from_config(config)
+
+
+class TestProcessSupervisor(unittest.TestCase):
+    """Test suite for ProcessSupervisor with real child processes."""
+
+    def setUp(self):
+        """Create a supervisor that records its state changes."""
+        self.changes = []
+        self.supervisor = ProcessSupervisor(on_change=self.changes.append, poll_interval=0.01)
+
+    def tearDown(self):
+        """Stop the supervisor."""
+        self.supervisor.stop()
+
+    def supervise(self, spec, policy=None):
+        """Spawn a spec and hand it to the supervisor."""
+        result = spawn(spec)
+        self.supervisor.supervise(spec, result.process, policy)
+        return result.process
+
+    def wait_for(self, path, status, timeout=10):
+        """Wait until a path reaches a status and get its state."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            state = self.supervisor.state(path)
+            if state.status == status:
+                return state
+            time.sleep(0.01)
+        self.fail(f"{path} did not reach {status}: {self.supervisor.state(path)}")
+        return None
+
+    def test_crashing_process_is_restarted_until_the_limit(self):
+        """Test that crashes are restarted with backoff up to max_restarts."""
+        policy = RestartPolicy(mode=RESTART_ON_CRASH, max_restarts=2, backoff=0.01)
+        self.supervise(python_spec("crash", "raise SystemExit(3)"), policy)
+
+        state = self.wait_for("crash", PROCESS_CRASHED)
+
+        self.assertEqual(state.restarts, 2)
+        self.assertEqual(state.exit_code, 3)
+        statuses = [change.status for change in self.changes]
+        self.assertEqual((statuses.count("running"), statuses.count("restarting")), (3, 2))
+        self.assertEqual(self.changes[-1], state)
+
+    def test_clean_exit_is_not_restarted_on_crash_policy(self):
+        """Test that a clean exit ends the supervision of an on-crash path."""
+        self.supervise(python_spec("clean", "pass"),
+                       RestartPolicy(mode=RESTART_ON_CRASH, backoff=0))
+
+        state = self.wait_for("clean", PROCESS_EXITED)
+
+        self.assertEqual((state.restarts, state.exit_code), (0, 0))
+
+    def test_running_state(self):
+        """Test the PID and uptime of a running process."""
+        process = self.supervise(python_spec("sleep", "import time; time.sleep(30)"))
+        try:
+            time.sleep(0.05)
+            state = self.supervisor.states()["sleep"]
+            self.assertEqual((state.pid, state.status), (process.pid, PROCESS_RUNNING))
+            self.assertGreater(state.uptime, 0)
+
+            # Stopping the supervisor leaves the process running
+            self.supervisor.stop()
+            self.assertIsNone(process.poll())
+        finally:
+            process.kill()
+            process.wait()
+
+    def test_polls_without_pidfd(self):
+        """Test that processes are reaped by polling where pidfds are not available."""
+        with patch.object(supervisor.os, "pidfd_open", side_effect=OSError, create=True):
+            self.supervise(python_spec("polled", "raise SystemExit(1)"))
+            state = self.wait_for("polled", PROCESS_CRASHED)
+
+        self.assertEqual(state.exit_code, 1)
+
+    def test_failed_restart_is_retried(self):
+        """Test that a restart that cannot spawn counts as a crash."""
+        spec = SpawnSpec("missing", ["/nonexistent/program"])
+        process = subprocess.Popen([sys.executable, "-c", "raise SystemExit(1)"])
+        self.supervisor.supervise(spec, process,
+                                  RestartPolicy(mode=RESTART_ON_CRASH, max_restarts=2, backoff=0))
+
+        state = self.wait_for("missing", PROCESS_CRASHED)
+
+        self.assertEqual(state.restarts, 2)
+        self.assertIsNone(state.pid)
+        self.assertIsNone(state.exit_code)
+
+    def test_forget(self):
+        """Test that forgotten paths are no longer reported."""
+        process = self.supervise(python_spec("sleep", "import time; time.sleep(30)"))
+        try:
+            self.assertTrue(self.supervisor.forget("sleep"))
+            self.assertFalse(self.supervisor.forget("sleep"))
+            self.assertEqual(self.supervisor.states(), {})
+        finally:
+            process.kill()
+            process.wait()
+
+
+if __name__ == "__main__":
+    unittest.main()
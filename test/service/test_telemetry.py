@@ -0,0 +1,96 @@
+"""Tests for the launch telemetry store."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from src.constants.launch import LAUNCH_CANCELLED
+from src.service.launcher import LaunchResult
+from src.service.telemetry import LaunchHistory, percentile
+
+
+class TestTelemetry(unittest.TestCase):
+    """Test suite for LaunchHistory and percentile."""
+
+    def setUp(self):
+        """Set up a history store in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.history_path = os.path.join(self.temp_dir.name, "history.jsonl")
+        self.history = LaunchHistory(file_path=self.history_path)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile([7], 95), 7)
+        self.assertIsNone(percentile([], 50))
+
+    def test_record_launch_appends_compact_records(self):
+        """Test that each launch appends one line per path plus a profile line."""
+        process = MagicMock()
+        process.poll.return_value = None
+        results = [
+            LaunchResult(path="C:/a.exe", pid=1, spawn_latency=0.01, ready_latency=0.5,
+                         process=process),
+            LaunchResult(path="C:/b.exe", spawn_latency=0.002, error="missing"),
+        ]
+
+        self.history.record_launch("profile1", results, 0.6)
+
+        with open(self.history_path, "r", encoding="utf-8") as history_file:
+            records = [json.loads(line) for line in history_file]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0]["a"], "C:/a.exe")
+        self.assertEqual(records[0]["s"], 10.0)
+        self.assertEqual(records[0]["r"], 500.0)
+        self.assertIsNone(records[0]["x"])
+        self.assertEqual(records[1]["e"], "missing")
+        self.assertIsNone(records[1]["s"])
+        self.assertEqual(records[2], {"k": "profile", "t": records[2]["t"],
+                                      "p": "profile1", "d": 600.0})
+
+    def test_summarize_per_path_and_profile(self):
+        """Test p50/p95 summaries grouped per path and per profile."""
+        process = MagicMock()
+        process.poll.return_value = None
+        for latency in (0.01, 0.02, 0.03):
+            self.history.record_launch(
+                "profile1", [LaunchResult(path="C:/a.exe", spawn_latency=latency, process=process)],
+                latency * 2)
+        # A path that was never spawned counts, but has no spawn latency
+        self.history.record_launch(
+            "profile1", [LaunchResult(path="C:/a.exe", status=LAUNCH_CANCELLED)], 0.08)
+
+        per_path = self.history.summarize("path")
+        per_profile = self.history.summarize("profile")
+
+        self.assertEqual(per_path["C:/a.exe"]["count"], 4)
+        self.assertEqual(per_path["C:/a.exe"]["spawn_p50"], 20.0)
+        self.assertEqual(per_path["C:/a.exe"]["spawn_p95"], 30.0)
+        self.assertIsNone(per_path["C:/a.exe"]["ready_p50"])
+        self.assertEqual(per_profile["profile1"]["duration_p50"], 40.0)
+        with self.assertRaises(ValueError):
+            self.history.summarize("unknown")
+
+    def test_corrupt_lines_are_skipped(self):
+        """Test that a truncated line does not break loading."""
+        self.history.record_launch("profile1", [LaunchResult(path="C:/a.exe")], 0.1)
+        with open(self.history_path, "a", encoding="utf-8") as history_file:
+            history_file.write('{"t": 1, "a"')
+
+        self.assertEqual(len(self.history.load_records()), 2)
+
+    def test_history_is_trimmed(self):
+        """Test that the oldest records are dropped once the file is too large."""
+        history = LaunchHistory(file_path=self.history_path, max_bytes=2000)
+        for _ in range(50):
+            history.record_launch("profile1", [LaunchResult(path="C:/a.exe")], 0.1)
+
+        self.assertLessEqual(os.path.getsize(self.history_path), 2000)
+        self.assertGreater(len(history.load_records()), 0)
@@ -0,0 +1,118 @@
+"""Tests for the data file watcher."""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from src.service import watcher
+from src.service.storage import JournalStorage, JsonStorage, SqliteStorage
+from src.service.watcher import StoreWatcher
+
+
+class TestStoreWatcher(unittest.TestCase):
+    """Test suite for StoreWatcher with both backends."""
+
+    def setUp(self):
+        """Set up a temporary data directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "profiles.json")
+        self.other_path = os.path.join(self.temp_dir.name, "other.json")
+        self.changes = []
+        self.notified = threading.Event()
+
+    def tearDown(self):
+        """Clean up the temporary data directory."""
+        self.temp_dir.cleanup()
+
+    def on_change(self, paths):
+        """Record a notification."""
+        self.changes.append(paths)
+        self.notified.set()
+
+    def json_paths(self):
+        """Get the watched files of the JSON store."""
+        return {self.file_path: JsonStorage(self.file_path).watched_paths()}
+
+    def write_files(self):
+        """Write the watched file several times and an unwatched file once."""
+        for index in range(3):
+            temp_path = f"{self.file_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as data_file:
+                data_file.write(str(index))
+            os.replace(temp_path, self.file_path)
+        with open(f"{self.file_path}.version", "w", encoding="utf-8") as version_file:
+            version_file.write("1")
+        with open(self.other_path, "w", encoding="utf-8") as other_file:
+            other_file.write("{}")
+
+    def assert_single_notification(self, store_watcher):
+        """Start the watcher, write the files and check the debounced notification."""
+        store_watcher.start()
+        self.addCleanup(store_watcher.stop)
+        self.write_files()
+
+        self.assertTrue(self.notified.wait(5))
+        store_watcher.stop()
+        self.assertEqual(self.changes, [{os.path.abspath(self.file_path)}])
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux only")
+    def test_inotify_backend(self):
+        """Test that a burst of writes is reported once through inotify."""
+        store_watcher = StoreWatcher(self.json_paths(), self.on_change, debounce=0.1)
+
+        self.assert_single_notification(store_watcher)
+        self.assertIsNone(store_watcher._backend)
+
+    def test_polling_backend(self):
+        """Test the stat polling fallback."""
+        store_watcher = StoreWatcher(self.json_paths(), self.on_change,
+                                     debounce=0.1, poll_interval=0.05)
+        with patch.object(watcher.sys, "platform", "win32"):
+            self.assert_single_notification(store_watcher)
+
+    def test_rotated_journal_is_watched(self):
+        """Test that a change of the rotated journal of a journal store is reported."""
+        storage = JournalStorage(self.file_path)
+        store_watcher = StoreWatcher({self.file_path: storage.watched_paths()}, self.on_change,
+                                     debounce=0.1, poll_interval=0.05)
+        with patch.object(watcher.sys, "platform", "win32"):
+            store_watcher.start()
+        self.addCleanup(store_watcher.stop)
+        with open(storage.rotated_journal_path, "w", encoding="utf-8") as journal_file:
+            journal_file.write("{}\n")
+
+        self.assertTrue(self.notified.wait(5))
+        self.assertEqual(self.changes, [{os.path.abspath(self.file_path)}])
+
+    def assert_sqlite_commit_reported(self, platform):
+        """Check that a commit of another connection reports every store of the database."""
+        settings_path = os.path.join(self.temp_dir.name, "settings.json")
+        storages = [SqliteStorage(self.file_path), SqliteStorage(settings_path)]
+        for storage in storages:
+            self.addCleanup(storage.close)
+        store_watcher = StoreWatcher(
+            {storage.file_path: storage.watched_paths() for storage in storages},
+            self.on_change, debounce=0.1, poll_interval=0.05)
+        with patch.object(watcher.sys, "platform", platform):
+            store_watcher.start()
+        self.addCleanup(store_watcher.stop)
+
+        other = SqliteStorage(self.file_path)
+        self.addCleanup(other.close)
+        other.commit({"theme": "dark"}, {"theme"})
+
+        self.assertTrue(self.notified.wait(5))
+        self.assertEqual(self.changes, [{os.path.abspath(self.file_path),
+                                         os.path.abspath(settings_path)}])
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux only")
+    def test_sqlite_commit_through_inotify(self):
+        """Test that a commit to the shared database is seen through inotify."""
+        self.assert_sqlite_commit_reported(sys.platform)
+
+    def test_sqlite_commit_through_polling(self):
+        """Test that a commit to the shared database is seen by the polling fallback."""
+        self.assert_sqlite_commit_reported("win32")
+
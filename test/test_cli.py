@@ -0,0 +1,172 @@
+"""Tests for the command line interface."""
+
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import patch, MagicMock
+from src import cli
+from src.service.data_manager import ProfileManager, SettingsManager
+from src.service.launcher import LaunchResult
+from src.service.process_table import ProcessTable
+from src.service.profile_service import ProfileService
+from src.service.settings_service import SettingsService
+from src.service.telemetry import LaunchHistory
+
+
+class TestCli(unittest.TestCase):
+    """Test suite for the command line commands."""
+
+    def setUp(self):
+        """Set up a profile service backed by temporary files."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.service = ProfileService()
+        self.service.profiles = ProfileManager(
+            file_path=os.path.join(self.temp_dir.name, "profiles.json"))
+        self.service.history = LaunchHistory(
+            file_path=os.path.join(self.temp_dir.name, "history.jsonl"))
+        self.settings = SettingsService()
+        self.settings.settings = SettingsManager(
+            file_path=os.path.join(self.temp_dir.name, "settings.json"))
+        for name, service in (("ProfileService", self.service), ("SettingsService", self.settings)):
+            patcher = patch.object(cli, name, return_value=service)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def run_cli(self, *argv):
+        """Run the CLI and capture its output.
+
+        Returns:
+            tuple: Exit status and printed output.
+        """
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(output):
+            status = cli.main(list(argv))
+        return status, output.getvalue()
+
+    def test_report_without_history(self):
+        """Test the report when nothing has been launched."""
+        status, output = self.run_cli("report")
+
+        self.assertEqual(status, 0)
+        self.assertIn("No launches recorded", output)
+
+    def test_report_per_path_and_profile(self):
+        """Test the report tables per path and per profile."""
+        self.service.create_profile("id1", "Work")
+        self.service.history.record_launch(
+            "id1", [LaunchResult(path="C:/a.exe", spawn_latency=0.01,
+                                 process=MagicMock(**{"poll.return_value": None}))], 0.02)
+
+        _, per_path = self.run_cli("report")
+        _, per_profile = self.run_cli("report", "--by", "profile")
+
+        self.assertIn("C:/a.exe", per_path)
+        self.assertIn("10.0", per_path)
+        self.assertIn("Work", per_profile)
+        self.assertIn("20.0", per_profile)
+
+    def test_cli_does_not_import_gui(self):
+        """Test that the CLI never imports the view layer or GUI toolkits."""
+        check = ("import sys, src.cli; "
+                 "print(any(name in sys.modules for name in "
+                 "('tkinter', 'customtkinter', 'PIL', 'src.view.interface')))")
+        output = subprocess.run([sys.executable, "-c", check], capture_output=True,
+                                text=True, check=True).stdout
+
+        self.assertEqual(output.strip(), "False")
+
+    def test_list_profiles(self):
+        """Test listing profiles with their paths and the current profile."""
+        self.service.create_profile("id1", "Work")
+        self.service.create_profile("id2", "Games")
+        self.service.add_path_to_profile("id1", "C:/ide.exe")
+        self.settings.update_current_user_profile("id1")
+
+        status, output = self.run_cli("list")
+
+        self.assertEqual(status, 0)
+        self.assertIn("* Work (id1)", output)
+        self.assertIn("  Games (id2)", output)
+        self.assertIn("    C:/ide.exe", output)
+
+    def test_add_path(self):
+        """Test adding paths by profile name, with dependencies."""
+        self.service.create_profile("id1", "Work")
+
+        self.assertEqual(self.run_cli("add-path", "Work", "C:/vpn.exe")[0], 0)
+        self.assertEqual(self.run_cli("add-path", "id1", "C:/ide.exe", "--after", "C:/vpn.exe")[0], 0)
+
+        self.assertEqual(self.service.get_paths_for_profile("id1"), ["C:/vpn.exe", "C:/ide.exe"])
+        self.assertEqual(self.service.get_path_dependencies("id1"), {"C:/ide.exe": ["C:/vpn.exe"]})
+
+    def test_add_path_errors(self):
+        """Test that invalid add-path calls change nothing."""
+        self.service.create_profile("id1", "Work")
+        self.run_cli("add-path", "Work", "C:/vpn.exe")
+
+        self.assertEqual(self.run_cli("add-path", "Unknown", "C:/vpn.exe")[0], 2)
+        self.assertEqual(self.run_cli("add-path", "Work", "C:/vpn.exe")[0], 2)
+        self.assertEqual(self.run_cli("add-path", "Work", "C:/ide.exe", "--after", "C:/x.exe")[0], 2)
+        self.assertEqual(self.service.get_paths_for_profile("id1"), ["C:/vpn.exe"])
+
+    @patch('subprocess.Popen')
+    def test_launch_by_name(self, mock_popen):
+        """Test launching a profile by name."""
+        mock_popen.return_value = MagicMock(pid=42, **{"poll.return_value": None})
+        self.service.create_profile("id1", "Work")
+        self.service.add_path_to_profile("id1", "C:/ide.exe")
+
+        status, output = self.run_cli("launch", "Work")
+
+        self.assertEqual(status, 0)
+        self.assertIn("pid 42", output)
+        mock_popen.assert_called_once_with(["C:/ide.exe"])
+
+    @patch('subprocess.Popen')
+    def test_launch_current_profile_with_failure(self, mock_popen):
+        """Test launching the current profile and reporting a failed path."""
+        mock_popen.side_effect = FileNotFoundError("not found")
+        self.service.create_profile("id1", "Work")
+        self.service.add_path_to_profile("id1", "C:/missing.exe")
+        self.settings.update_current_user_profile("id1")
+
+        status, output = self.run_cli("launch")
+
+        self.assertEqual(status, 1)
+        self.assertIn("C:/missing.exe: not found", output)
+
+    @patch('subprocess.Popen')
+    def test_launch_skips_running_paths(self, mock_popen):
+        """Test that running paths are only skipped with --skip-running or the setting."""
+        mock_popen.return_value = MagicMock(pid=42, **{"poll.return_value": None})
+        self.service.create_profile("id1", "Work")
+        self.service.add_path_to_profile("id1", "C:/ide.exe")
+        table = ProcessTable({os.path.realpath("C:/ide.exe"): (4242,)})
+
+        with patch.object(ProcessTable, "snapshot", return_value=table):
+            self.assertEqual(self.run_cli("launch", "Work")[0], 0)
+            mock_popen.assert_called_once_with(["C:/ide.exe"])
+
+            status, output = self.run_cli("launch", "Work", "--skip-running")
+            self.assertEqual(status, 0)
+            self.assertIn("already running pid 4242", output)
+
+            self.settings.update_skip_running(True)
+            self.assertIn("already running", self.run_cli("launch", "Work")[1])
+            self.run_cli("launch", "Work", "--no-skip-running")
+        self.assertEqual(mock_popen.call_count, 2)
+
+    def test_launch_unknown_profile(self):
+        """Test that launching an unknown profile is a usage error."""
+        status, output = self.run_cli("launch", "Unknown")
+
+        self.assertEqual(status, 2)
+        self.assertIn("Profile not found", output)
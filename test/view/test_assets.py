@@ -0,0 +1,84 @@
+"""Tests for the cache of resized image assets."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from PIL import Image
+from src.view import assets
+from src.view.assets import AssetCache
+
+
+class TestAssetCache(unittest.TestCase):
+    """Test suite for AssetCache."""
+
+    SIZE = (16, 16)
+
+    def setUp(self):
+        """Create a resource directory with an icon and an empty cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        resource_dir = os.path.join(self.temp_dir.name, "resource")
+        os.makedirs(resource_dir)
+        patcher = patch.object(assets, "RESOURCE_DIR", resource_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.source = os.path.join(resource_dir, "logo.ico")
+        self.save_icon((255, 0, 0, 255))
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+
+    def save_icon(self, color):
+        """Write the source icon in a single color."""
+        Image.new("RGBA", (32, 32), color).save(self.source, sizes=[(32, 32)])
+
+    def load(self):
+        """Load the icon through a fresh cache, as a new start of the GUI would."""
+        return AssetCache(self.cache_dir).load_image("logo.ico", self.SIZE)
+
+    def cache_file(self):
+        """Get the cache file of the loaded variant."""
+        return os.path.join(self.cache_dir, f"logo_{self.SIZE[0]}x{self.SIZE[1]}.rgba")
+
+    def test_cached_variant_is_not_decoded_again(self):
+        """Test that a later start reads the variant back instead of decoding it."""
+        decoded = self.load()
+
+        with patch.object(AssetCache, "_decode") as decode:
+            cached = self.load()
+
+        decode.assert_not_called()
+        self.assertEqual(cached.size, self.SIZE)
+        self.assertEqual(cached.tobytes(), decoded.tobytes())
+
+    def test_changed_source_is_decoded_again(self):
+        """Test that a new modification time of the source invalidates the cached variant."""
+        self.load()
+        self.save_icon((0, 0, 255, 255))
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        image = self.load()
+
+        self.assertEqual(image.getpixel((8, 8)), (0, 0, 255, 255))
+
+    def test_corrupt_cache_file_falls_back_to_decoding(self):
+        """Test that a truncated or foreign cache file is ignored and rewritten."""
+        self.load()
+        for content in (b"WVA1", b"not a cached image at all", None):
+            with open(self.cache_file(), "r+b") as cached:
+                if content is None:
+                    cached.truncate(os.path.getsize(self.cache_file()) - 1)
+                else:
+                    cached.write(content)
+                    cached.truncate()
+
+            image = self.load()
+
+            self.assertEqual(image.getpixel((8, 8)), (255, 0, 0, 255))
+            with patch.object(AssetCache, "_decode") as decode:
+                self.load()
+            decode.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
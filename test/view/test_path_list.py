@@ -0,0 +1,103 @@
+"""Tests for the row recycling of the virtualized path list."""
+
+import tkinter
+import unittest
+from types import SimpleNamespace
+import customtkinter
+from src.view.path_list import (
+    OVERSCAN_ROWS, ROW_HEIGHT, PathList, pool_size, visible_rows
+)
+
+
+class TestRowRecycling(unittest.TestCase):
+    """Test suite for the pool size and the binding of paths to pool rows."""
+
+    def test_pool_size(self):
+        """Test that the pool covers a partly scrolled view plus the overscan."""
+        self.assertEqual(pool_size(0), 1 + 2 * OVERSCAN_ROWS)
+        self.assertEqual(pool_size(10 * ROW_HEIGHT), 11 + 2 * OVERSCAN_ROWS)
+        self.assertEqual(pool_size(10 * ROW_HEIGHT + 1), 12 + 2 * OVERSCAN_ROWS)
+
+    def test_visible_rows_at_top(self):
+        """Test that the first paths are bound to the pool rows of the same position."""
+        rows = visible_rows(0, 100, 8)
+
+        self.assertEqual(rows, {index: index for index in range(8)})
+
+    def test_visible_rows_bind_by_index_modulo_pool_size(self):
+        """Test the binding of a scrolled view, overscan included."""
+        offset = 20.5 * ROW_HEIGHT
+        rows = visible_rows(offset, 100, 8)
+
+        first = 20 - OVERSCAN_ROWS
+        self.assertEqual(list(rows), list(range(first, first + 8)))
+        self.assertEqual(rows, {index: index % 8 for index in rows})
+        self.assertEqual(len(set(rows.values())), 8)
+
+    def test_scrolling_by_one_row_rebinds_one_row(self):
+        """Test that a single pool row moves to the path that enters the view."""
+        before = visible_rows(30 * ROW_HEIGHT, 100, 8)
+        after = visible_rows(31 * ROW_HEIGHT, 100, 8)
+
+        rebound = {position for index, position in after.items() if before.get(index) != position}
+        self.assertEqual(len(rebound), 1)
+        self.assertEqual(set(before) - set(after), {min(before)})
+
+    def test_visible_rows_stop_at_the_end_of_the_list(self):
+        """Test that no pool row is bound beyond the last path."""
+        self.assertEqual(list(visible_rows(0, 3, 8)), [0, 1, 2])
+        self.assertEqual(visible_rows(0, 0, 8), {})
+        self.assertEqual(max(visible_rows(95 * ROW_HEIGHT, 100, 8)), 99)
+
+
+class TestPathList(unittest.TestCase):
+    """Test suite for the bound rows of PathList, skipped without a display."""
+
+    def setUp(self):
+        """Create a path list in a hidden window."""
+        try:
+            self.window = customtkinter.CTk()
+        except tkinter.TclError as e:
+            self.skipTest(f"No display: {e}")
+        self.addCleanup(self.window.destroy)
+        self.window.withdraw()
+        self.deleted = []
+        self.path_list = PathList(self.window, self.deleted.append)
+        # Lay out a view of five rows, as the viewport's <Configure> event would
+        # pylint: disable-next=protected-access
+        self.path_list._on_resize(SimpleNamespace(height=5 * ROW_HEIGHT))
+
+    def assert_bound_consistently(self):
+        """Check that exactly the paths in or near the view are bound, each to its own row."""
+        path_list = self.path_list
+        # pylint: disable=protected-access
+        expected = visible_rows(path_list._offset, len(path_list), len(path_list._rows))
+        self.assertEqual(set(path_list._bound), {path_list.paths[index] for index in expected})
+        for path, row in path_list._bound.items():
+            self.assertEqual(row.path, path)
+        unbound = [row for row in path_list._rows if row not in path_list._bound.values()]
+        self.assertTrue(all(row.path is None for row in unbound))
+
+    def test_bound_rows_follow_changes(self):
+        """Test the bound rows after setting, scrolling, appending and removing paths."""
+        paths = [f"C:/apps/app{index}.exe" for index in range(50)]
+        self.path_list.set_paths(paths)
+        self.assert_bound_consistently()
+
+        self.path_list._scroll_to(20 * ROW_HEIGHT)  # pylint: disable=protected-access
+        self.assert_bound_consistently()
+
+        self.assertTrue(self.path_list.append("C:/apps/new.exe"))
+        self.assertFalse(self.path_list.append("C:/apps/new.exe"))
+        self.assert_bound_consistently()
+
+        self.assertTrue(self.path_list.remove(paths[20]))
+        self.assert_bound_consistently()
+
+        self.path_list.set_paths(paths[:2])
+        self.assert_bound_consistently()
+        self.assertEqual(len(self.path_list._bound), 2)  # pylint: disable=protected-access
+
+
+if __name__ == "__main__":
+    unittest.main()